@@ -0,0 +1,118 @@
+import base64
+import mmap
+import os
+import wave
+
+from audio import ULAW_BYTES_PER_MS, audioop
+from config import ASSET_CACHE_DIR, ASSET_FRAME_MS
+
+SAMPLE_RATE = 8000
+# μ-law silence, pads the last frame of a clip.
+ULAW_SILENCE = b"\xff"
+
+
+def transcode_wav(path):
+    """Read a PCM WAV file and return it as 8 kHz mono μ-law bytes."""
+    with wave.open(path, "rb") as source:
+        if source.getcomptype() != "NONE":
+            raise ValueError(f"Unsupported WAV compression in {path}")
+        channels = source.getnchannels()
+        width = source.getsampwidth()
+        rate = source.getframerate()
+        pcm = source.readframes(source.getnframes())
+
+    if width == 1:
+        # 8-bit WAV samples are unsigned.
+        pcm = audioop.bias(pcm, 1, -128)
+    if channels == 2:
+        pcm = audioop.tomono(pcm, width, 0.5, 0.5)
+    elif channels != 1:
+        raise ValueError(f"Unsupported channel count {channels} in {path}")
+    if width != 2:
+        pcm = audioop.lin2lin(pcm, width, 2)
+    if rate != SAMPLE_RATE:
+        pcm, _ = audioop.ratecv(pcm, 2, 1, rate, SAMPLE_RATE, None)
+    return audioop.lin2ulaw(pcm, 2)
+
+
+class AudioAsset:
+    """A pre-encoded clip, read as fixed-width base64 frames from a memory map.
+
+    Every frame covers `frame_ms` of audio, so frame `i` is a plain slice of
+    the mapped file and playing a clip needs no encoding work.
+    """
+
+    def __init__(self, name, path, frame_ms):
+        self.name = name
+        self.frame_ms = frame_ms
+        self.frame_width = base64_frame_width(frame_ms)
+        with open(path, "rb") as compiled:
+            self._map = mmap.mmap(compiled.fileno(), 0, access=mmap.ACCESS_READ)
+        self.frame_count = len(self._map) // self.frame_width
+        self.duration_ms = self.frame_count * frame_ms
+
+    def frame(self, index):
+        start = index * self.frame_width
+        return self._map[start : start + self.frame_width].decode("ascii")
+
+    def frames(self, start=0):
+        for index in range(start, self.frame_count):
+            yield self.frame(index)
+
+    def close(self):
+        self._map.close()
+
+
+def base64_frame_width(frame_ms):
+    return 4 * -(-frame_ms * ULAW_BYTES_PER_MS // 3)
+
+
+def compile_asset(source_path, target_path, frame_ms):
+    """Transcode a WAV file and write its base64 frames, replacing the target atomically."""
+    ulaw = transcode_wav(source_path)
+    frame_bytes = frame_ms * ULAW_BYTES_PER_MS
+    remainder = len(ulaw) % frame_bytes
+    if remainder:
+        ulaw += ULAW_SILENCE * (frame_bytes - remainder)
+    frames = b"".join(
+        base64.b64encode(ulaw[start : start + frame_bytes])
+        for start in range(0, len(ulaw), frame_bytes)
+    )
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    temporary_path = f"{target_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as target:
+        target.write(frames)
+    os.replace(temporary_path, target_path)
+
+
+def load_asset(usecase_name, source_path, cache_dir=ASSET_CACHE_DIR, frame_ms=ASSET_FRAME_MS):
+    """Map the compiled frames of a WAV asset, compiling them if the source changed."""
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    stat = os.stat(source_path)
+    target_path = os.path.join(
+        cache_dir, f"{usecase_name}-{name}-{frame_ms}ms-{stat.st_mtime_ns:x}-{stat.st_size:x}.b64"
+    )
+    if not os.path.isfile(target_path):
+        print(f"Transcoding audio asset {source_path}")
+        compile_asset(source_path, target_path, frame_ms)
+    return AudioAsset(name, target_path, frame_ms)
+
+
+def load_usecase_assets(usecase_name, usecase_dir):
+    """Load every WAV file of a usecase folder, keyed by file name without extension."""
+    assets = {}
+    for entry in sorted(os.scandir(usecase_dir), key=lambda entry: entry.name):
+        if entry.is_file() and entry.name.endswith(".wav"):
+            asset = load_asset(usecase_name, entry.path)
+            assets[asset.name] = asset
+    return assets
+
+
+if __name__ == "__main__":
+    # Compile every usecase asset ahead of time, e.g. while building the image.
+    from registry import USECASES_DIR
+
+    for entry in sorted(os.scandir(USECASES_DIR), key=lambda entry: entry.name):
+        if entry.is_dir():
+            for name, asset in load_usecase_assets(entry.name, entry.path).items():
+                print(f"{entry.name}/{name}: {asset.frame_count} frames, {asset.duration_ms} ms")
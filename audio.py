@@ -0,0 +1,16 @@
+import warnings
+
+with warnings.catch_warnings():
+    # Deprecated in 3.11 and 3.12, audioop comes from the audioop-lts package on 3.13+.
+    warnings.simplefilter("ignore", DeprecationWarning)
+    import audioop  # noqa: F401
+
+# g711_ulaw at 8 kHz, one byte per sample.
+ULAW_BYTES_PER_MS = 8
+
+
+def base64_length(payload):
+    """Number of bytes encoded by a base64 string, without decoding it."""
+    if not payload:
+        return 0
+    return len(payload) * 3 // 4 - payload.count("=", -2)
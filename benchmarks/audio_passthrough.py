@@ -0,0 +1,74 @@
+"""Frames/sec per core on the OpenAI -> Twilio audio leg.
+
+Compares the old path (base64 roundtrip + dict + json.dumps, as done by
+`WebSocket.send_json`) with the passthrough path (delta forwarded as is into
+a pre-rendered Twilio media frame). Both include parsing the OpenAI event.
+
+Run from the repository root: python benchmarks/audio_passthrough.py
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frames import TwilioFrames  # noqa: E402
+
+STREAM_SID = "MZ18ad3ab5a668481ce02b83e7395059f0"
+DELTA_BYTES = int(os.getenv("DELTA_BYTES", 2400))  # 300 ms of 8 kHz g711_ulaw
+DURATION = float(os.getenv("DURATION", 2.0))
+
+EVENT = json.dumps(
+    {
+        "type": "response.audio.delta",
+        "event_id": "event_AZx2dlKtGmHcVLQF3kpuR",
+        "response_id": "resp_AZx2dAW2vuYaHBcsRXYpq",
+        "item_id": "item_AZx2dDeRFCTKnY2pqHVBA",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": base64.b64encode(os.urandom(DELTA_BYTES)).decode("utf-8"),
+    }
+)
+
+
+def before(message):
+    response = json.loads(message)
+    audio_payload = base64.b64encode(base64.b64decode(response["delta"])).decode("utf-8")
+    audio_delta = {
+        "event": "media",
+        "streamSid": STREAM_SID,
+        "media": {"payload": audio_payload},
+    }
+    return json.dumps(audio_delta, separators=(",", ":"), ensure_ascii=False)
+
+
+twilio_frames = TwilioFrames(STREAM_SID)
+
+
+def after(message):
+    response = json.loads(message)
+    return twilio_frames.media(response["delta"])
+
+
+def frames_per_second(relay):
+    count = 0
+    started = time.perf_counter()
+    deadline = started + DURATION
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            relay(EVENT)
+        count += 1000
+    return count / (time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    assert json.loads(before(EVENT)) == json.loads(after(EVENT))
+    old = frames_per_second(before)
+    new = frames_per_second(after)
+    print(f"delta size: {DELTA_BYTES} bytes")
+    print(f"before (roundtrip + send_json): {old:,.0f} frames/sec/core")
+    print(f"after  (passthrough template):  {new:,.0f} frames/sec/core")
+    print(f"speedup: {new / old:.2f}x")
@@ -0,0 +1,107 @@
+import hashlib
+import hmac
+import time
+from dataclasses import asdict, dataclass, fields
+
+# <Stream> parameters added when the call settings are signed.
+ISSUED_AT_PARAMETER = "issued_at"
+SIGNATURE_PARAMETER = "signature"
+
+
+class InvalidStreamParameters(ValueError):
+    """Raised when signed <Stream> parameters fail verification."""
+
+
+def sign_parameters(params, secret):
+    """HMAC-SHA256 of the parameters, in name order, with the signing secret."""
+    message = "\n".join(f"{name}={params[name]}" for name in sorted(params))
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_parameters(params, secret, max_age_seconds=None):
+    """Check the signature and age of signed parameters."""
+    unsigned = {name: value for name, value in params.items() if name != SIGNATURE_PARAMETER}
+    signature = params.get(SIGNATURE_PARAMETER, "")
+    if not hmac.compare_digest(signature, sign_parameters(unsigned, secret)):
+        raise InvalidStreamParameters("Bad <Stream> parameter signature")
+    try:
+        age = time.time() - int(params[ISSUED_AT_PARAMETER])
+    except (KeyError, ValueError):
+        raise InvalidStreamParameters("Signed <Stream> parameters have no issue time")
+    if max_age_seconds is not None and age > max_age_seconds:
+        raise InvalidStreamParameters("Signed <Stream> parameters have expired")
+
+
+@dataclass(frozen=True)
+class CallContext:
+    """Immutable per-call settings taken from the /incoming-call query string.
+
+    The context travels from the webhook to /media-stream as Twilio <Stream>
+    custom parameters, so concurrent calls never share mutable state and any
+    worker or node can serve the stream. With a signing secret the parameters
+    carry an issue time and a signature, checked when they come back.
+    """
+
+    # common
+    type: str = "api"
+    intermediate: bool = False
+    voice: str = "coral"
+    # rag
+    db: str = "pg"
+    re_rank: bool = False
+    hybrid_search: bool = False
+    hybrid_search_weight: float = 0.5
+    top_k: int = 10
+    # api
+    enable_fields: bool = True
+    context_limit: int = 6000
+
+    def to_stream_parameters(self, secret=None):
+        """Serialize the context into string key/value pairs for <Parameter>."""
+        params = {name: str(value) for name, value in asdict(self).items()}
+        if secret:
+            params[ISSUED_AT_PARAMETER] = str(int(time.time()))
+            params[SIGNATURE_PARAMETER] = sign_parameters(params, secret)
+        return params
+
+    @classmethod
+    def from_stream_parameters(cls, params, secret=None, max_age_seconds=None):
+        """Rebuild a context from the `customParameters` of a Twilio `start` event.
+
+        With a `secret` the parameters must be signed with it, and no older
+        than `max_age_seconds`, or InvalidStreamParameters is raised.
+        """
+        if secret:
+            verify_parameters(params, secret, max_age_seconds)
+        values = {}
+        for field in fields(cls):
+            if field.name not in params:
+                continue
+            raw = params[field.name]
+            if field.type is bool:
+                values[field.name] = str(raw).lower() in ("true", "1", "yes")
+            elif field.type is int:
+                values[field.name] = int(raw)
+            elif field.type is float:
+                values[field.name] = float(raw)
+            else:
+                values[field.name] = str(raw)
+        return cls(**values)
+
+    def tool_args(self):
+        """Extra keyword arguments injected into every tool call of this usecase."""
+        if self.type == "rag":
+            return {
+                "db": self.db,
+                "re_rank": self.re_rank,
+                "hybrid_search": self.hybrid_search,
+                "hybrid_search_weight": self.hybrid_search_weight,
+                "top_k": self.top_k,
+            }
+        if self.type == "api":
+            return {
+                "enable_fields": self.enable_fields,
+                "context_limit": self.context_limit,
+            }
+        return {}
+
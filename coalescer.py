@@ -0,0 +1,62 @@
+import asyncio
+import base64
+import time
+
+import metrics
+from audio import ULAW_BYTES_PER_MS
+
+
+class AudioCoalescer:
+    """Merge consecutive inbound μ-law payloads into a single append.
+
+    Audio is flushed once it covers `max_delay_ms` or reaches `max_bytes`, and
+    a timer flushes it after `max_delay_ms` in case frames stop arriving. The
+    time the oldest frame spent buffered is recorded as
+    `inbound_coalesce.delay_ms`.
+    """
+
+    def __init__(self, send, max_delay_ms, max_bytes):
+        self._send = send
+        self._max_delay = max_delay_ms / 1000
+        self._max_bytes = min(max_bytes, max_delay_ms * ULAW_BYTES_PER_MS)
+        self._buffer = bytearray()
+        self._frames = 0
+        self._first_at = None
+        self._timer = None
+        self._flush_task = None
+
+    async def add(self, payload):
+        # Base64 chunks of 160 bytes are padded, so they can't be joined as text.
+        self._buffer += base64.b64decode(payload)
+        self._frames += 1
+        if self._first_at is None:
+            self._first_at = time.monotonic()
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self._on_timer
+            )
+        if len(self._buffer) >= self._max_bytes:
+            await self.flush()
+
+    def _on_timer(self):
+        self._timer = None
+        self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        if not self._buffer:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        payload = base64.b64encode(self._buffer).decode("utf-8")
+        metrics.observe("inbound_coalesce.delay_ms", (time.monotonic() - self._first_at) * 1000)
+        metrics.incr("inbound_coalesce.frames", self._frames)
+        metrics.incr("inbound_coalesce.appends")
+        self._buffer = bytearray()
+        self._frames = 0
+        self._first_at = None
+        await self._send(payload)
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,92 @@
+import json
+
+from config import JSON_CODEC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _select_backend(name):
+    if name == "auto":
+        if orjson is not None:
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+        return "json"
+    if name not in ("orjson", "msgspec", "json"):
+        raise ValueError(f"Unknown JSON_CODEC '{name}'.")
+    if (name == "orjson" and orjson is None) or (name == "msgspec" and msgspec is None):
+        raise ValueError(f"JSON_CODEC is set to '{name}' but it is not installed.")
+    return name
+
+
+BACKEND = _select_backend(JSON_CODEC)
+
+if BACKEND == "orjson":
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+elif BACKEND == "msgspec":
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+
+    def loads(data):
+        return _decoder.decode(data)
+
+    def dumps(obj):
+        return _encoder.encode(obj).decode("utf-8")
+
+else:
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Fast paths for the audio frames, which make up almost all of the relay traffic.
+# A quoted key followed by a quoted value can only match a real key, since quotes
+# inside JSON strings are always escaped. Base64 payloads, ids and timestamps never
+# contain escapes, so their value ends at the next quote.
+
+
+def _string_value(message, key, start=0):
+    index = message.find(key, start)
+    if index < 0:
+        return None
+    index += len(key)
+    return message[index : message.find('"', index)]
+
+
+def read_twilio_media(message):
+    """Return the payload of a Twilio `media` frame, None for other frames."""
+    if not message.startswith('{"event":"media"'):
+        return None
+    return _string_value(message, '"payload":"')
+
+
+def peek_event_type(message):
+    """Return the `type` of an OpenAI event when it is the first key, otherwise None."""
+    if not message.startswith('{"type":"'):
+        return None
+    return message[9 : message.find('"', 9)]
+
+
+def read_audio_delta(message):
+    """Return (item_id, delta) of a `response.audio.delta` event, None if not found."""
+    delta = _string_value(message, '"delta":"')
+    if delta is None:
+        return None
+    return _string_value(message, '"item_id":"'), delta
@@ -6,3 +6,97 @@ REALTIME_AUDIO_API_URL = os.getenv(
 )
 
 print(REALTIME_AUDIO_API_URL)
+
+# Forward g711_ulaw audio deltas from OpenAI to Twilio without re-encoding them.
+AUDIO_PASSTHROUGH = os.getenv("AUDIO_PASSTHROUGH", "true").lower() == "true"
+
+# JSON backend for relay frames: auto, orjson, msgspec or json.
+JSON_CODEC = os.getenv("JSON_CODEC", "auto")
+
+# Merge inbound 20 ms Twilio frames into one append of up to this many ms, 0 disables it.
+INBOUND_COALESCE_MS = int(os.getenv("INBOUND_COALESCE_MS", 0))
+INBOUND_COALESCE_MAX_BYTES = int(os.getenv("INBOUND_COALESCE_MAX_BYTES", 1600))
+
+# Send a Twilio mark per this many ms of assistant audio, and at the end of each segment.
+MARK_INTERVAL_MS = int(os.getenv("MARK_INTERVAL_MS", 500))
+
+# Function calls of a single response run concurrently, up to this many at once.
+TOOL_MAX_CONCURRENCY = int(os.getenv("TOOL_MAX_CONCURRENCY", 4))
+# Read-only tools started as soon as their arguments are streamed. Other tools, such as
+# book_appointment, wait for response.done since a cancelled call may already have run.
+TOOL_SPECULATIVE = {
+    name.strip()
+    for name in os.getenv(
+        "TOOL_SPECULATIVE", "get_inventory_search,get_vector_info_inventory"
+    ).split(",")
+    if name.strip()
+}
+
+# Deadline of a tool call in seconds, TOOL_TIMEOUTS overrides it per tool ("name=seconds,...").
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", 8))
+TOOL_TIMEOUTS = {
+    name.strip(): float(seconds)
+    for name, seconds in (
+        entry.split("=", 1) for entry in os.getenv("TOOL_TIMEOUTS", "").split(",") if entry
+    )
+}
+# Idempotent tools that get a second, hedged request once they run past their p95 latency.
+TOOL_HEDGE = {name.strip() for name in os.getenv("TOOL_HEDGE", "").split(",") if name.strip()}
+TOOL_HEDGE_MIN_SAMPLES = int(os.getenv("TOOL_HEDGE_MIN_SAMPLES", 20))
+
+# How tool results reach the model: "output" sends them once as function_call_output
+# items, "inline" also repeats them in the response.create instructions.
+TOOL_RESULT_DELIVERY = os.getenv("TOOL_RESULT_DELIVERY", "output")
+
+# Character budget of a formatted tool result, rows past it are left out.
+TOOL_RESULT_MAX_CHARS = int(os.getenv("TOOL_RESULT_MAX_CHARS", 6000))
+
+# Usecase WAV assets are transcoded to 8 kHz μ-law here, frames of ASSET_FRAME_MS each.
+ASSET_CACHE_DIR = os.getenv(
+    "ASSET_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".assets")
+)
+ASSET_FRAME_MS = int(os.getenv("ASSET_FRAME_MS", 20))
+
+# Filler clips start this long after the tool calls of a turn, then repeat interval apart.
+FILLER_DELAY_MS = int(os.getenv("FILLER_DELAY_MS", 1500))
+FILLER_INTERVAL_MS = int(os.getenv("FILLER_INTERVAL_MS", 3000))
+
+# Pre-connected Realtime sessions kept per usecase and voice, sized by the recent call
+# rate up to REALTIME_POOL_MAX_SIZE. 0 disables the pool.
+REALTIME_POOL_MAX_SIZE = int(os.getenv("REALTIME_POOL_MAX_SIZE", 0))
+REALTIME_POOL_IDLE_SECONDS = float(os.getenv("REALTIME_POOL_IDLE_SECONDS", 300))
+REALTIME_POOL_WINDOW_SECONDS = float(os.getenv("REALTIME_POOL_WINDOW_SECONDS", 300))
+
+# Worker processes started by `python main.py`, forked after startup and sharing one socket.
+WORKERS = int(os.getenv("WORKERS", 1))
+
+# Secret signing the call settings carried in <Stream> parameters. Required with several
+# workers, and on every node of a multi-node deployment, all sharing the same secret.
+# Unset on a single worker, the parameters are not signed.
+STREAM_SIGNING_SECRET = os.getenv("STREAM_SIGNING_SECRET")
+# Signed parameters are refused this long after the /incoming-call that issued them.
+STREAM_PARAMETERS_MAX_AGE_SECONDS = int(os.getenv("STREAM_PARAMETERS_MAX_AGE_SECONDS", 300))
+
+# Prepare the Realtime session during /incoming-call. The session only reaches the call when
+# the media stream lands on the same process, so it defaults to off with several workers.
+SESSION_HANDOFF = os.getenv("SESSION_HANDOFF", str(WORKERS == 1)).lower() == "true"
+# Sessions opened by /incoming-call are closed if the call's media stream doesn't arrive in time.
+HANDOFF_TIMEOUT_SECONDS = float(os.getenv("HANDOFF_TIMEOUT_SECONDS", 30))
+
+# Audio queued per direction between Twilio and OpenAI, the oldest audio is dropped past it.
+RELAY_INBOUND_MAX_MS = int(os.getenv("RELAY_INBOUND_MAX_MS", 5000))
+RELAY_OUTBOUND_MAX_MS = int(os.getenv("RELAY_OUTBOUND_MAX_MS", 60000))
+
+# Optional pacing of assistant audio, it is released on the playback clock so Twilio holds
+# at most this much unplayed audio and an interruption has little to clear. 0 sends audio
+# to Twilio as soon as it arrives.
+OUTBOUND_PACING_LEAD_MS = int(os.getenv("OUTBOUND_PACING_LEAD_MS", 0))
+
+# Optional local barge-in detection on caller audio, it clears playback before the server
+# VAD reports speech. A detection not confirmed by the server within the window is counted
+# as a false positive and playback resumes.
+LOCAL_VAD = os.getenv("LOCAL_VAD", "false").lower() == "true"
+LOCAL_VAD_RMS = int(os.getenv("LOCAL_VAD_RMS", 1200))
+LOCAL_VAD_MAX_CROSSINGS_PER_MS = float(os.getenv("LOCAL_VAD_MAX_CROSSINGS_PER_MS", 2.5))
+LOCAL_VAD_MIN_SPEECH_MS = int(os.getenv("LOCAL_VAD_MIN_SPEECH_MS", 100))
+LOCAL_VAD_CONFIRM_MS = int(os.getenv("LOCAL_VAD_CONFIRM_MS", 1500))
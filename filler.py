@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import metrics
+
+# Filler audio is sent at most this far ahead of real time, so a `clear` has little to drop.
+FILLER_LEAD_MS = 200
+
+
+class FillerPlayer:
+    """Play pre-rendered filler clips to the caller while tool calls run.
+
+    `start` arms a timer, and if the player is still running after `delay_ms`
+    the clips are streamed in turn, `interval_ms` apart, until `stop`. Stopping
+    sends a Twilio `clear` when filler audio went out, so the real answer is
+    never queued behind it. A clip only starts once `busy()` is false, so it
+    never plays over, or clears, assistant audio still on its way out.
+    """
+
+    def __init__(self, send_media, send_clear, busy, clips, delay_ms, interval_ms):
+        self._send_media = send_media
+        self._send_clear = send_clear
+        self._busy = busy
+        self._clips = clips
+        self._delay = delay_ms / 1000
+        self._interval = interval_ms / 1000
+        self._next_clip = 0
+        self._task = None
+        self._sent = False
+
+    @property
+    def active(self):
+        return self._task is not None
+
+    def start(self):
+        if self._task is None:
+            self._sent = False
+            self._task = asyncio.create_task(self._play())
+
+    async def _play(self):
+        try:
+            await asyncio.sleep(self._delay)
+            while True:
+                while self._busy():
+                    await asyncio.sleep(FILLER_LEAD_MS / 1000)
+                await self._play_clip(self._clips[self._next_clip % len(self._clips)])
+                self._next_clip += 1
+                await asyncio.sleep(self._interval)
+        except Exception as e:
+            print(f"Error playing filler audio: {e}")
+
+    async def _play_clip(self, clip):
+        metrics.incr("filler.played")
+        started = time.monotonic()
+        for index, payload in enumerate(clip.frames()):
+            ahead_ms = index * clip.frame_ms - (time.monotonic() - started) * 1000
+            if ahead_ms > FILLER_LEAD_MS:
+                await asyncio.sleep((ahead_ms - FILLER_LEAD_MS) / 1000)
+            await self._send_media(payload)
+            self._sent = True
+        # Let the clip finish playing before the interval starts.
+        await asyncio.sleep(clip.duration_ms / 1000 - (time.monotonic() - started))
+
+    async def stop(self):
+        """Stop the filler and drop what Twilio still has buffered of it."""
+        if self._task is None:
+            return
+        self.cancel()
+        if self._sent:
+            self._sent = False
+            await self._send_clear()
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,107 @@
+import csv
+import io
+
+import metrics
+from codec import loads
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return "; ".join(f"{key}={item}" for key, item in value.items())
+    return str(value)
+
+
+def _rows(result):
+    """Return the result as a list of row dicts, or None when it is not tabular."""
+    if isinstance(result, str):
+        text = result.lstrip()
+        if not text.startswith(("[", "{")):
+            return None
+        try:
+            result = loads(text)
+        except ValueError:
+            return None
+    if isinstance(result, dict):
+        data = result.get("data")
+        result = data if isinstance(data, list) else [result]
+    if isinstance(result, list) and all(isinstance(row, dict) for row in result):
+        return result
+    return None
+
+
+class ResultFormatter:
+    """Turn a tool result into a compact, budgeted text for the model.
+
+    Rows are projected to `fields` (plus the fields the model asked for) and
+    encoded as CSV with a single header line, dropping empty columns. Rows that
+    do not fit in `max_chars` are cut and replaced by a short note. Results that
+    are not tabular are passed through, truncated to the budget.
+    """
+
+    def __init__(self, name, fields=None):
+        self.name = name
+        self.fields = tuple(fields) if fields else None
+
+    def format(self, result, max_chars, requested_fields=None):
+        rows = _rows(result)
+        if rows is None:
+            text = self._truncate(_cell(result), max_chars)
+        else:
+            text = self._table(rows, max_chars, requested_fields)
+        metrics.observe(f"tool.{self.name}.result_chars", len(text))
+        return text
+
+    def _columns(self, rows, requested_fields):
+        seen = {}
+        for row in rows:
+            for key, value in row.items():
+                if _cell(value):
+                    seen[key] = None
+        if self.fields is None:
+            return list(seen)
+        wanted = list(self.fields)
+        if requested_fields:
+            wanted += [field.strip() for field in requested_fields.split(",")]
+        # Keep the projection order, a row field outside of it is dropped.
+        columns = [field for field in dict.fromkeys(wanted) if field in seen]
+        return columns or list(seen)
+
+    def _table(self, rows, max_chars, requested_fields):
+        if not rows:
+            return "No results."
+        columns = self._columns(rows, requested_fields)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        for count, row in enumerate(rows):
+            size = buffer.tell()
+            writer.writerow([_cell(row.get(column)) for column in columns])
+            if buffer.tell() > max_chars and count == 0:
+                # Even the first row is over the budget, it is cut like plain text.
+                text = self._truncate(buffer.getvalue(), max_chars)
+                if len(rows) > 1:
+                    metrics.incr(f"tool.{self.name}.truncated_rows", len(rows) - 1)
+                    text += f"\n({len(rows) - 1} more rows not shown)\n"
+                return text
+            if buffer.tell() > max_chars:
+                omitted = len(rows) - count
+                metrics.incr(f"tool.{self.name}.truncated_rows", omitted)
+                buffer.seek(size)
+                buffer.truncate()
+                buffer.write(f"({omitted} more rows not shown)\n")
+                break
+        return buffer.getvalue()
+
+    def _truncate(self, text, max_chars):
+        if len(text) <= max_chars:
+            return text
+        metrics.incr(f"tool.{self.name}.truncated_text")
+        # Cut on a line boundary when one is close enough.
+        cut = text.rfind("\n", 0, max_chars)
+        if cut < max_chars // 2:
+            cut = max_chars
+        return text[:cut] + "\n(truncated)"
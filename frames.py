@@ -0,0 +1,26 @@
+import json
+
+
+class TwilioFrames:
+    """Pre-rendered outbound Twilio Media Stream frames for a single stream.
+
+    The stream sid is serialized once, so building a frame is plain string
+    concatenation. Payloads are base64 and never need JSON escaping.
+    """
+
+    def __init__(self, stream_sid):
+        sid = json.dumps(stream_sid)
+        self._media_prefix = f'{{"event":"media","streamSid":{sid},"media":{{"payload":"'
+        self._mark_prefix = f'{{"event":"mark","streamSid":{sid},"mark":{{"name":'
+        self.clear = f'{{"event":"clear","streamSid":{sid}}}'
+
+    def media(self, payload):
+        return self._media_prefix + payload + '"}}'
+
+    def mark(self, name):
+        return self._mark_prefix + json.dumps(name) + "}}"
+
+
+def audio_append(payload):
+    """Build an OpenAI `input_audio_buffer.append` frame around a base64 payload."""
+    return '{"type":"input_audio_buffer.append","audio":"' + payload + '"}'
@@ -0,0 +1,79 @@
+import asyncio
+import secrets
+
+import metrics
+
+
+class PreparedSession:
+    """A Realtime session with its conversation started, and the greeting it used."""
+
+    __slots__ = ("ws", "usecase_name", "voice", "greeting")
+
+    def __init__(self, ws, usecase_name, voice, greeting):
+        self.ws = ws
+        self.usecase_name = usecase_name
+        self.voice = voice
+        self.greeting = greeting
+
+
+class SessionHandoff:
+    """Sessions prepared during /incoming-call, waiting for the call's media stream.
+
+    `start` runs the preparation in the background under a random token that
+    the TwiML puts in the <Stream> url. `/media-stream/<token>` claims it, and a
+    session that is not claimed within `timeout_seconds` is closed.
+    """
+
+    def __init__(self, timeout_seconds):
+        self._timeout_seconds = timeout_seconds
+        self._pending = {}
+
+    def start(self, prepare):
+        """Run the `prepare` coroutine in the background and return its token."""
+        token = secrets.token_urlsafe(16)
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(prepare)
+        expiry = loop.call_later(self._timeout_seconds, self._expire, token)
+        self._pending[token] = (task, expiry)
+        return token
+
+    async def claim(self, token, usecase_name, voice):
+        """Return the session prepared under `token` for this call, or None."""
+        entry = self._pending.pop(token, None)
+        if entry is None:
+            metrics.incr("handoff.missing")
+            return None
+        task, expiry = entry
+        expiry.cancel()
+        try:
+            prepared = await task
+        except Exception as e:
+            print(f"Error preparing Realtime session: {e}")
+            metrics.incr("handoff.failed")
+            return None
+        if (prepared.usecase_name, prepared.voice) != (usecase_name, voice):
+            metrics.incr("handoff.mismatched")
+            await prepared.ws.close()
+            return None
+        metrics.incr("handoff.claimed")
+        return prepared
+
+    def _expire(self, token):
+        entry = self._pending.pop(token, None)
+        if entry is not None:
+            print("Closing a prepared Realtime session, its media stream never arrived.")
+            metrics.incr("handoff.expired")
+            self._discard(entry[0])
+
+    @staticmethod
+    def _discard(task):
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            asyncio.create_task(task.result().ws.close())
+
+    def close(self):
+        for task, expiry in self._pending.values():
+            expiry.cancel()
+            self._discard(task)
+        self._pending.clear()
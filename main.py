@@ -1,18 +1,69 @@
 import asyncio
 import base64
-import importlib
-import json
 import os
 import ssl
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 
 import websockets
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request, WebSocket
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.websockets import WebSocketDisconnect
-from twilio.twiml.voice_response import Connect, VoiceResponse
 
-from config import REALTIME_AUDIO_API_URL
+import metrics
+from call_context import CallContext, InvalidStreamParameters
+from codec import (
+    dumps,
+    loads,
+    peek_event_type,
+    read_audio_delta,
+    read_twilio_media,
+)
+from audio import base64_length
+from coalescer import AudioCoalescer
+from config import (
+    AUDIO_PASSTHROUGH,
+    FILLER_DELAY_MS,
+    FILLER_INTERVAL_MS,
+    HANDOFF_TIMEOUT_SECONDS,
+    INBOUND_COALESCE_MAX_BYTES,
+    INBOUND_COALESCE_MS,
+    LOCAL_VAD,
+    LOCAL_VAD_CONFIRM_MS,
+    LOCAL_VAD_MAX_CROSSINGS_PER_MS,
+    LOCAL_VAD_MIN_SPEECH_MS,
+    LOCAL_VAD_RMS,
+    MARK_INTERVAL_MS,
+    OUTBOUND_PACING_LEAD_MS,
+    REALTIME_AUDIO_API_URL,
+    REALTIME_POOL_IDLE_SECONDS,
+    REALTIME_POOL_MAX_SIZE,
+    REALTIME_POOL_WINDOW_SECONDS,
+    RELAY_INBOUND_MAX_MS,
+    RELAY_OUTBOUND_MAX_MS,
+    SESSION_HANDOFF,
+    STREAM_PARAMETERS_MAX_AGE_SECONDS,
+    STREAM_SIGNING_SECRET,
+    TOOL_MAX_CONCURRENCY,
+    TOOL_RESULT_DELIVERY,
+    TOOL_RESULT_MAX_CHARS,
+    TOOL_SPECULATIVE,
+    WORKERS,
+)
+from filler import FillerPlayer
+from frames import TwilioFrames, audio_append
+from handoff import PreparedSession, SessionHandoff
+from marks import MarkTracker
+from realtime_pool import RealtimePool
+from relay_queue import RelayQueue
+from registry import build_assistant_message, build_conversation_item, load_usecases
+from speech import APOLOGY, APOLOGY_INSTRUCTIONS, APOLOGY_SPEECH, GREETING, SpeechCache
+from tool_runner import SpeculativeToolCalls, invoke_tool
+from twiml import render_incoming_call
+from usecases.http_client import close_session
+from vad import BargeInDetector
 
 # Create an SSL context (for development purposes only)
 ssl_context = ssl.create_default_context()
@@ -43,47 +94,58 @@ LOG_EVENT_TYPES = [
     "response.content_part.added",
 ]
 SHOW_TIMING_MATH = False
-
-INSTRUCTIONS = ""
-GREETING_TEXT = ""
-VOICE = ""
-INTRO = ""
-ADVANCED_SETTINGS = {}
-TOOLS_SCHEMA = []
-TOOLS = []
-
-PARAM_TYPE = ""
-PARAM_INTERMEDIATE = False
-PARAM_DB = ""
-PARAM_RE_RANK = False
-PARAM_HYBRID_SEARCH = False
-PARAM_HYBRID_SEARCH_WEIGHT = 0
-PARAM_TOP_K = 0
-PARAM_ENABLE_FIELDS = False
-PARAM_CONTEXT_LIMIT = 0
-
+# Tool results already sit in the conversation as function_call_output items.
+TOOL_ANSWER_INSTRUCTIONS = (
+    "Formulate an answer strictly based on the function call outputs without adding "
+    "external knowledge or assumptions. Be concise and friendly."
+)
 
 if not OPENAI_API_KEY:
     raise ValueError("Missing the OpenAI API key. Please set it in the .env file.")
+if WORKERS > 1 and not STREAM_SIGNING_SECRET:
+    raise ValueError("STREAM_SIGNING_SECRET is required to run several workers.")
+
+# Every usecase is imported, validated and precompiled once at startup.
+USECASES = load_usecases()
+# Greeting and apology audio per usecase and voice, shared by every call.
+speech_cache = SpeechCache()
+
+
+async def open_pooled_session(usecase, voice):
+    # open_realtime_session is defined further down.
+    return await open_realtime_session(usecase, voice)
+
+
+realtime_pool = RealtimePool(
+    open_pooled_session,
+    REALTIME_POOL_MAX_SIZE,
+    REALTIME_POOL_IDLE_SECONDS,
+    REALTIME_POOL_WINDOW_SECONDS,
+)
+# Sessions opened by /incoming-call, claimed by the media stream of the call.
+session_handoff = SessionHandoff(HANDOFF_TIMEOUT_SECONDS)
+
 
-app = FastAPI()
-voice_response = VoiceResponse()
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    session_handoff.close()
+    await realtime_pool.close()
+    # The shared tool HTTP client lives for the whole process.
+    await close_session()
+
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/", response_class=JSONResponse)
 async def index_page():
-    load_metadata(
-        type="api",
-        intermediate=False,
-        db="pg",
-        re_rank=False,
-        hybrid_search=False,
-        hybrid_search_weight=0.5,
-        top_k=10,
-        enable_fields=True,
-        context_limit=6000,
-        voice="coral",
-    )
-    return {"message": INTRO}
+    usecase = USECASES[CallContext().type]
+    return {"message": usecase.intro_text}
+
+
+@app.get("/metrics", response_class=JSONResponse)
+async def metrics_page():
+    return metrics.snapshot()
 
 
 @app.api_route("/incoming-call", methods=["GET", "POST"])
@@ -104,94 +166,232 @@ async def handle_incoming_call(
     context_limit: int = 6000,
 ):
     """Handle incoming call and return TwiML response to connect to Media Stream."""
-    
-    load_metadata(
-        type,
-        intermediate,
-        db,
-        re_rank,
-        hybrid_search,
-        hybrid_search_weight,
-        top_k,
-        enable_fields,
-        context_limit,
-        voice,
+    context = CallContext(
+        type=type,
+        intermediate=intermediate,
+        voice=voice,
+        db=db,
+        re_rank=re_rank,
+        hybrid_search=hybrid_search,
+        hybrid_search_weight=hybrid_search_weight,
+        top_k=top_k,
+        enable_fields=enable_fields,
+        context_limit=context_limit,
     )
-    global voice_response
-    # <Say> punctuation to improve text-to-speech flow
-    if INTRO:
-        voice_response.say(INTRO)
-        voice_response.pause(length=1)
+    usecase = USECASES.get(context.type)
+    if usecase is None:
+        raise HTTPException(status_code=404, detail=f"Unknown usecase: {type}")
     host = request.url.hostname
-    connect = Connect()
-    connect.stream(url=f"wss://{host}/media-stream")
-    voice_response.append(connect)
-    return HTMLResponse(content=str(voice_response), media_type="application/xml")
+    token = None
+    if SESSION_HANDOFF:
+        # Connect and start the conversation while Twilio plays the intro.
+        token = session_handoff.start(prepare_session(usecase, context.voice))
+    # Carry the call settings to /media-stream, they come back in the `start` event.
+    parameters = context.to_stream_parameters(STREAM_SIGNING_SECRET)
+    content = render_incoming_call(usecase, host, parameters, token)
+    return HTMLResponse(content=content, media_type="application/xml")
 
 
 @app.websocket("/media-stream")
-async def handle_media_stream(websocket: WebSocket):
+@app.websocket("/media-stream/{token}")
+async def handle_media_stream(websocket: WebSocket, token: str = None):
     """Handle WebSocket connections between Twilio and OpenAI."""
+    relay_tasks = []
     try:
-        print(
-            f"Client connected with params. type: {PARAM_TYPE}, intermediate: {PARAM_INTERMEDIATE}, db: {PARAM_DB}, re_rank: {PARAM_RE_RANK}, hybrid_search: {PARAM_HYBRID_SEARCH}, hybrid_search_weight: {PARAM_HYBRID_SEARCH_WEIGHT}, top_k: {PARAM_TOP_K}, enable_fields: {PARAM_ENABLE_FIELDS}, context_limit: {PARAM_CONTEXT_LIMIT}"
-        )
-        TOOL_MAP = {tool.name: tool for tool in TOOLS}
-        print(f"Current tools: {TOOL_MAP} \n schema: {TOOLS_SCHEMA}")
-
         await websocket.accept()
+
+        # The call settings arrive as custom parameters of the Twilio `start` event.
+        stream_sid, context = await wait_for_stream_start(websocket)
+        if stream_sid is None:
+            return
+        usecase = USECASES.get(context.type)
+        if usecase is None:
+            print(f"Unknown usecase: {context.type}")
+            return
+        print(f"Client connected with context: {context}")
+
         responses = []
 
-        async with websockets.connect(
-            REALTIME_AUDIO_API_URL,
-            extra_headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "OpenAI-Beta": "realtime=v1",
-            },
-            ssl=ssl_context,
-        ) as openai_ws:
-            await initialize_session(openai_ws)
-
-            # Connection specific state
-            stream_sid = None
-            latest_media_timestamp = 0
+        # Connection specific state
+        twilio_frames = TwilioFrames(stream_sid)
+        last_assistant_item = None
+        marks = MarkTracker(MARK_INTERVAL_MS)
+        # Item Twilio is playing, and the offset its audio starts at in the sent audio.
+        playing_item = None
+        playing_item_offset = 0
+        tool_answer_requested_at = None
+        speech_capture = None
+        # (end offset, payload) of audio sent but maybe not played yet, kept for local
+        # barge-ins, a false positive sends it again.
+        sent_audio = deque()
+
+        async def send_audio_to_twilio(payload):
+            """Send queued assistant audio, its marks are registered as it goes out."""
+            await websocket.send_text(twilio_frames.media(payload))
+            await send_mark(websocket, stream_sid, marks.add_audio(base64_length(payload)))
+            if LOCAL_VAD:
+                played = marks.played_bytes()
+                while sent_audio and sent_audio[0][0] <= played:
+                    sent_audio.popleft()
+                sent_audio.append((marks.sent_bytes, payload))
+
+        def unplayed_audio():
+            """Payloads Twilio has not played yet, the first one cut at the played offset."""
+            played = marks.played_bytes()
+            payloads = []
+            for end, payload in sent_audio:
+                if end <= played:
+                    continue
+                start = end - base64_length(payload)
+                if start < played:
+                    ulaw = base64.b64decode(payload)[played - start :]
+                    payload = base64.b64encode(ulaw).decode("utf-8")
+                payloads.append(payload)
+            return payloads
+
+        async def send_segment_mark():
+            await send_mark(websocket, stream_sid, marks.mark())
+
+        def item_start(item_id):
+            """Queued step run when the audio of a new item is about to go out."""
+
+            async def start():
+                nonlocal playing_item, playing_item_offset
+                # Each assistant item gets its own mark segment.
+                await send_segment_mark()
+                playing_item = item_id
+                playing_item_offset = marks.sent_bytes
+
+            return start
+
+        def pacing_delay():
+            """Seconds until Twilio holds less than the pacing lead."""
+            return (marks.buffered_ms() - OUTBOUND_PACING_LEAD_MS) / 1000
+
+        # Audio to Twilio goes through a bounded queue, so a slow peer never stalls OpenAI reads.
+        # When paced, payloads go out one by one as Twilio plays them.
+        outbound = RelayQueue(
+            "outbound",
+            send_audio_to_twilio,
+            RELAY_OUTBOUND_MAX_MS,
+            merge=not OUTBOUND_PACING_LEAD_MS,
+            send_delay=pacing_delay if OUTBOUND_PACING_LEAD_MS else None,
+        )
+        relay_tasks.append(asyncio.create_task(outbound.run()))
+
+        def play_speech(speech):
+            """Queue cached speech for Twilio, tracked by marks like model audio."""
+            nonlocal last_assistant_item
+            metrics.incr("speech.played")
+            # The speech is no model audio item, an interruption only clears it.
             last_assistant_item = None
-            mark_queue = []
-            response_start_timestamp_twilio = None
+            outbound.put_control(item_start(None))
+            for payload in speech.clip.frames():
+                outbound.put_audio(payload)
+            outbound.put_control(send_segment_mark)
+
+        async def send_mark(connection, stream_sid, name):
+            if stream_sid and name:
+                await connection.send_text(twilio_frames.mark(name))
+
+        # The session prepared by /incoming-call already started the conversation.
+        prepared = None
+        if token is not None:
+            prepared = await session_handoff.claim(token, usecase.name, context.voice)
+        if prepared is not None:
+            greeting = prepared.greeting
+        else:
+            greeting = speech_cache.get(
+                usecase, context.voice, GREETING, usecase.greeting_speech
+            )
+
+        # A cached greeting plays while the OpenAI session is still being set up.
+        if greeting is not None:
+            play_speech(greeting)
+        else:
+            speech_capture = speech_cache.capture(usecase, context.voice, GREETING)
+
+        if prepared is not None:
+            openai_ws = prepared.ws
+        else:
+            # A pooled session is already connected and configured for the usecase and voice.
+            openai_ws = realtime_pool.acquire(usecase, context.voice)
+            if openai_ws is None:
+                openai_ws = await open_realtime_session(usecase, context.voice)
+
+        try:
+            if prepared is None:
+                await start_conversation(openai_ws, usecase, greeting)
+
+            async def append_input_audio(payload):
+                await openai_ws.send(audio_append(payload))
+
+            coalescer = None
+            if INBOUND_COALESCE_MS > 0:
+                coalescer = AudioCoalescer(
+                    append_input_audio, INBOUND_COALESCE_MS, INBOUND_COALESCE_MAX_BYTES
+                )
+
+            async def send_input_audio(payload):
+                if coalescer is not None:
+                    await coalescer.add(payload)
+                else:
+                    await append_input_audio(payload)
+
+            # Twilio's 160 byte frames are padded, they can't be merged as text, the
+            # coalescer batches them when enabled.
+            inbound = RelayQueue(
+                "inbound", send_input_audio, RELAY_INBOUND_MAX_MS, merge=False
+            )
+            relay_tasks.append(asyncio.create_task(inbound.run()))
 
             async def receive_from_twilio():
                 """Receive audio data from Twilio and send it to the OpenAI Realtime API."""
-                nonlocal stream_sid, latest_media_timestamp
                 try:
                     async for message in websocket.iter_text():
-                        data = json.loads(message)
+                        payload = read_twilio_media(message)
+                        if payload is not None:
+                            if openai_ws.open:
+                                inbound.put_audio(payload)
+                                if vad is not None:
+                                    await detect_barge_in(payload)
+                            continue
+
+                        data = loads(message)
                         if data["event"] == "media" and openai_ws.open:
-                            latest_media_timestamp = int(data["media"]["timestamp"])
-                            audio_append = {
-                                "type": "input_audio_buffer.append",
-                                "audio": data["media"]["payload"],
-                            }
-                            await openai_ws.send(json.dumps(audio_append))
-                        elif data["event"] == "start":
-                            stream_sid = data["start"]["streamSid"]
-                            print(f"Incoming stream has started {stream_sid}")
-                            response_start_timestamp_twilio = None
-                            latest_media_timestamp = 0
-                            last_assistant_item = None
-                        elif data["event"] == "mark":
-                            if mark_queue:
-                                mark_queue.pop(0)
+                            inbound.put_audio(data["media"]["payload"])
+                            if vad is not None:
+                                await detect_barge_in(data["media"]["payload"])
+                            continue
+
+                        # Control frames must not wait behind coalesced audio.
+                        if coalescer is not None and openai_ws.open:
+                            inbound.put_control(coalescer.flush)
+
+                        # The `start` frame was read by wait_for_stream_start.
+                        if data["event"] == "mark":
+                            marks.ack(data["mark"]["name"])
                 except WebSocketDisconnect:
                     print("Client disconnected.")
                     if openai_ws.open:
                         await openai_ws.close()
+                finally:
+                    if coalescer is not None:
+                        coalescer.close()
 
             async def send_to_twilio():
                 """Receive events from the OpenAI Realtime API, send audio back to Twilio."""
-                nonlocal stream_sid, last_assistant_item, response_start_timestamp_twilio
+                nonlocal stream_sid, last_assistant_item, speech_capture
                 try:
                     async for openai_message in openai_ws:
-                        response = json.loads(openai_message)
+                        # Audio deltas skip the full parse, only the item id and delta are read.
+                        if peek_event_type(openai_message) == "response.audio.delta":
+                            audio_delta = read_audio_delta(openai_message)
+                            if audio_delta is not None:
+                                await forward_audio_delta(*audio_delta)
+                                continue
+
+                        response = loads(openai_message)
                         response_type = response.get("type", "")
                         if response_type in LOG_EVENT_TYPES:
                             print(f"Received event: {response_type}", response)
@@ -200,53 +400,36 @@ async def handle_media_stream(websocket: WebSocket):
                             response_type == "response.audio.delta"
                             and "delta" in response
                         ):
-                            audio_payload = base64.b64encode(
-                                base64.b64decode(response["delta"])
-                            ).decode("utf-8")
-                            audio_delta = {
-                                "event": "media",
-                                "streamSid": stream_sid,
-                                "media": {"payload": audio_payload},
-                            }
-                            await websocket.send_json(audio_delta)
-
-                            if response_start_timestamp_twilio is None:
-                                response_start_timestamp_twilio = latest_media_timestamp
-                                if SHOW_TIMING_MATH:
-                                    print(
-                                        f"Setting start timestamp for new response: {response_start_timestamp_twilio}ms"
-                                    )
-
-                            # Update last_assistant_item safely
-                            if response.get("item_id"):
-                                last_assistant_item = response["item_id"]
-
-                            await send_mark(websocket, stream_sid)
-
-                        # if (
-                        #     response_type
-                        #     == "response.function_call_arguments.delta"
-                        #     and "delta" in response
-                        # ):
-
-                        #     # Path to your .mp3 file
-                        #     file_path = "./usecases/maintenance/custom-audio.wav"
+                            await forward_audio_delta(
+                                response.get("item_id"), response["delta"]
+                            )
 
-                        #     # Read the .mp3 file in binary mode
-                        #     with open(file_path, "rb") as audio_file:
-                        #         # Encode the file content to Base64
-                        #         audio_payload = base64.b64encode(
-                        #             audio_file.read()
-                        #         ).decode("utf-8")
+                        if (
+                            response_type == "response.audio_transcript.done"
+                            and speech_capture is not None
+                        ):
+                            speech_capture.text = response.get("transcript")
 
-                        #         audio_delta = {
-                        #             "event": "media",
-                        #             "streamSid": stream_sid,
-                        #             "media": {"payload": audio_payload},
-                        #         }
+                        # Start tools as soon as their arguments are complete.
+                        if response_type == "response.output_item.added":
+                            tool_calls.on_item_added(
+                                response.get("response_id"), response.get("item", {})
+                            )
+                        if response_type == "response.function_call_arguments.delta":
+                            tool_calls.on_arguments_delta(
+                                response.get("call_id"), response.get("delta", "")
+                            )
+                        if response_type == "response.function_call_arguments.done":
+                            tool_calls.on_arguments_done(
+                                response.get("response_id"),
+                                response.get("call_id"),
+                                response.get("arguments", "{}"),
+                                response.get("name"),
+                            )
 
-                        #         await websocket.send_json(audio_delta)
-                        # if response_type == "response.function_call_arguments.done":
+                        # Close the mark segment at the end of each audio part.
+                        if response_type == "response.audio.done":
+                            outbound.put_control(send_segment_mark)
 
                         if response_type == "response.created":
                             responses.append(
@@ -282,157 +465,49 @@ async def handle_media_stream(websocket: WebSocket):
                                     }
                                 )
 
+                            if status != "completed":
+                                tool_calls.cancel_response(response_id)
+
+                            # The first response after arming a capture is the cached utterance.
+                            if speech_capture is not None:
+                                if status == "completed":
+                                    speech_capture.store()
+                                speech_capture = None
+
+                            record_tool_answer_usage(current_response)
+
                             if status == "completed":
                                 current_response_output = current_response.get(
                                     "output", []
                                 )
-                                last_response_result = (
-                                    current_response_output[-1]
-                                    if current_response_output
-                                    else None
-                                )
+                                function_call_items = [
+                                    item
+                                    for item in current_response_output
+                                    if item.get("type") == "function_call"
+                                ]
 
                                 print(
                                     "Log: ",
                                     current_response,
-                                    last_response_result,
                                     responses,
                                 )
 
-                                if last_response_result:
-                                    try:
-                                        call_id = last_response_result.get("call_id")
-                                        function_name = last_response_result.get("name")
-                                        args = json.loads(
-                                            last_response_result.get("arguments", "{}")
-                                        )
-
-                                        intermediate_messages = [
-                                            "I'm processing your request, this will just take a moment...",
-                                            "Working on getting that information for you...",
-                                            "Almost there, retrieving the data you need...",
-                                            "Just a few more seconds while I gather the details...",
-                                            "Processing your request, thank you for your patience...",
-                                        ]
-
-                                        tool_to_invoke = TOOL_MAP.get(function_name)
-
-                                        if tool_to_invoke:
-                                            message_index = 0
-                                            result = None
-
-                                            # async def send_intermediate_messages():
-                                            #     nonlocal message_index, result, responses
-                                            #     if PARAM_INTERMEDIATE:
-                                            #         is_last_response_active = (
-                                            #             responses[-1]["response_status"]
-                                            #             == "in_progress"
-                                            #         )
-                                            #         print(
-                                            #             f"Intermediate messages enabled. {is_last_response_active}"
-                                            #         )
-
-                                            #         while result is None:
-                                            #             # Wait for 3 second to see if the result is ready
-                                            #             await asyncio.sleep(3)
-                                            #             if (
-                                            #                 not result
-                                            #                 and not is_last_response_active
-                                            #             ):
-                                            #                 current_msg = f"Respond to the user with waiting message to avoid silence: {intermediate_messages[message_index % len(intermediate_messages)]}"
-                                            #                 await send_conversation_item(
-                                            #                     openai_ws,
-                                            #                     current_msg,
-                                            #                     is_last_response_active,
-                                            #                 )
-                                            #                 message_index += 1
-                                            #                 break  # Exit the loop after sending the message
-
-                                            # Run intermediate message sender and tool invocation concurrently
-                                            # message_task = asyncio.create_task(
-                                            #     send_intermediate_messages()
-                                            # )
-                                            try:
-                                                if PARAM_TYPE == "rag":
-                                                    args["db"] = PARAM_DB
-                                                    args["re_rank"] = PARAM_RE_RANK
-                                                    args["hybrid_search"] = (
-                                                        PARAM_HYBRID_SEARCH
-                                                    )
-                                                    args["hybrid_search_weight"] = (
-                                                        PARAM_HYBRID_SEARCH_WEIGHT
-                                                    )
-                                                    args["top_k"] = PARAM_TOP_K
-                                                elif PARAM_TYPE == "api":
-                                                    args["enable_fields"] = (
-                                                        PARAM_ENABLE_FIELDS
-                                                    )
-                                                    args["context_limit"] = (
-                                                        PARAM_CONTEXT_LIMIT
-                                                    )
-                                                print("Args to invoke tool:", args)
-                                                
-                                                # audio_delta_intermediate = {
-                                                #     "event": "media",
-                                                #     "streamSid": stream_sid,
-                                                #     "media": {"payload": INTERMEDIATE_AUDIO},
-                                                # }
-                                                # await websocket.send_json(audio_delta_intermediate)
-                                                
-                                                result = await asyncio.to_thread(
-                                                    tool_to_invoke.func, **args
-                                                )
-                                            except Exception as e:
-                                                print(f"Error in tool invokation: {e}")
-                                                
-                                            if result:
-                                                print(
-                                                    f"Received function call result: {result}"
-                                                )
-                                                # Send the final response
-                                                function_output_event = {
-                                                    "type": "conversation.item.create",
-                                                    "item": {
-                                                        "type": "function_call_output",
-                                                        "call_id": call_id,
-                                                        "output": result,
-                                                    },
-                                                }
-                                                await openai_ws.send(
-                                                    json.dumps(function_output_event)
-                                                )
-
-                                                # Send final response
-                                                response_create_event = {
-                                                    "type": "response.create",
-                                                    "response": {
-                                                        "modalities": ["text", "audio"],
-                                                        "instructions": f"Formulate an answer strictly based on the provided context chunks without adding external knowledge or assumptions. context: {result}. Be concise and friendly.",
-                                                    },
-                                                }
-                                                await openai_ws.send(
-                                                    json.dumps(response_create_event)
-                                                )
-
-                                                # await websocket.send_json(
-                                                #     {"event": "clear", "streamSid": stream_sid}
-                                                # )
-                                                
-                                                
-                                    except Exception as e:
-                                        print(
-                                            "Error processing question via Assistant:",
-                                            e,
-                                        )
-                                        await send_conversation_item(
-                                            openai_ws,
-                                            f"Respond to the user with apologetic message. ' apologize, but I'm having trouble processing your request right now. Is there anything else I can help you with?'",
-                                        )
+                                if function_call_items:
+                                    # The turn runs aside, so a barge-in still stops the filler.
+                                    task = asyncio.create_task(
+                                        run_function_calls(function_call_items)
+                                    )
+                                    tool_turns.add(task)
+                                    task.add_done_callback(tool_turns.discard)
 
                         # Trigger an interruption. Your use case might work better using `input_audio_buffer.speech_stopped`, or combining the two.
                         if response_type == "input_audio_buffer.speech_started":
                             print("Speech started detected.")
-                            if last_assistant_item:
+                            if filler is not None:
+                                await filler.stop()
+                            if barge_in is not None:
+                                await confirm_barge_in()
+                            elif last_assistant_item or marks.pending:
                                 print(
                                     f"Interrupting response with id: {last_assistant_item}"
                                 )
@@ -444,111 +519,302 @@ async def handle_media_stream(websocket: WebSocket):
                 except Exception as e:
                     print(f"Error in send_to_twilio: {e}")
 
-            async def handle_speech_started_event():
-                """Handle interruption when the caller's speech starts."""
-                nonlocal response_start_timestamp_twilio, last_assistant_item
-                print("Handling speech started event.")
-                if mark_queue and response_start_timestamp_twilio is not None:
-                    elapsed_time = (
-                        latest_media_timestamp - response_start_timestamp_twilio
-                    )
-                    if SHOW_TIMING_MATH:
-                        print(
-                            f"Calculating elapsed time for truncation: {latest_media_timestamp} - {response_start_timestamp_twilio} = {elapsed_time}ms"
+            async def run_tool_call(function_name, arguments):
+                """Invoke a usecase tool with the model arguments and the call settings."""
+                tool_to_invoke = usecase.tool_map.get(function_name)
+                if tool_to_invoke is None:
+                    return f"unknown tool: {function_name}"
+                args = loads(arguments or "{}")
+                args.update(context.tool_args())
+                print("Args to invoke tool:", args)
+                result = await invoke_tool(tool_to_invoke, args)
+                # Project and encode the result compactly within the call budget.
+                max_chars = min(
+                    TOOL_RESULT_MAX_CHARS, args.get("context_limit") or TOOL_RESULT_MAX_CHARS
+                )
+                return usecase.result_formatters[function_name].format(
+                    result, max_chars, args.get("fields")
+                )
+
+            tool_calls = SpeculativeToolCalls(
+                run_tool_call, TOOL_MAX_CONCURRENCY, TOOL_SPECULATIVE
+            )
+
+            async def send_filler_media(payload):
+                await websocket.send_text(twilio_frames.media(payload))
+
+            async def send_filler_clear():
+                await websocket.send_text(twilio_frames.clear)
+
+            def assistant_audio_playing():
+                # Filler goes straight to Twilio, it waits for queued and buffered speech to play.
+                return bool(outbound.audio_ms or marks.buffered_ms() > 0)
+
+            filler = None
+            if context.intermediate and usecase.filler_audio:
+                filler = FillerPlayer(
+                    send_filler_media,
+                    send_filler_clear,
+                    assistant_audio_playing,
+                    usecase.filler_audio,
+                    FILLER_DELAY_MS,
+                    FILLER_INTERVAL_MS,
+                )
+
+            # Function-call turns in progress, cancelled when the call ends.
+            tool_turns = set()
+
+            async def run_function_calls(items):
+                try:
+                    await handle_function_calls(items)
+                except Exception as e:
+                    print("Error processing question via Assistant:", e)
+                    await send_apology()
+
+            async def handle_function_calls(items):
+                """Run every function call of a response, then request a single answer."""
+                nonlocal tool_answer_requested_at
+                # Cover slow tools with filler audio, it stops when the answer starts.
+                if filler is not None:
+                    filler.start()
+
+                # Calls run concurrently, most were already started from the streamed arguments.
+                results = await tool_calls.results(items)
+
+                outputs = []
+                errors = []
+                failed_outputs = []
+                for item, result in zip(items, results):
+                    if isinstance(result, Exception):
+                        print(f"Error in tool invokation: {result!r}")
+                        errors.append(result)
+                        # The model still gets an output for the call, or it assumes it never ran.
+                        reason = (
+                            "timeout" if isinstance(result, TimeoutError) else type(result).__name__
                         )
-
-                    if last_assistant_item:
-                        if SHOW_TIMING_MATH:
-                            print(
-                                f"Truncating item with ID: {last_assistant_item}, Truncated at: {elapsed_time}ms"
-                            )
-
-                        truncate_event = {
-                            "type": "conversation.item.truncate",
-                            "item_id": last_assistant_item,
-                            "content_index": 0,
-                            "audio_end_ms": elapsed_time,
-                        }
-                        await openai_ws.send(json.dumps(truncate_event))
-
-                    await websocket.send_json(
-                        {"event": "clear", "streamSid": stream_sid}
-                    )
-
-                    mark_queue.clear()
-                    last_assistant_item = None
-                    response_start_timestamp_twilio = None
-
-            async def send_mark(connection, stream_sid):
-                if stream_sid:
-                    mark_event = {
-                        "event": "mark",
-                        "streamSid": stream_sid,
-                        "mark": {"name": "responsePart"},
+                        failed_outputs.append((item["call_id"], f"tool failed: {reason}"))
+                    else:
+                        print(f"Received function call result: {result}")
+                        outputs.append((item["call_id"], result or "No results."))
+                if not outputs:
+                    # Every call failed, timed out or hit an open circuit: apologize.
+                    raise errors[0]
+
+                for call_id, result in outputs + failed_outputs:
+                    function_output_event = {
+                        "type": "conversation.item.create",
+                        "item": {
+                            "type": "function_call_output",
+                            "call_id": call_id,
+                            "output": result,
+                        },
                     }
-                    await connection.send_json(mark_event)
-                    mark_queue.append("responsePart")
+                    await openai_ws.send(dumps(function_output_event))
+
+                # Send final response, once for all the outputs
+                if TOOL_RESULT_DELIVERY == "inline":
+                    context_chunks = "\n".join(result for _, result in outputs)
+                    instructions = f"Formulate an answer strictly based on the provided context chunks without adding external knowledge or assumptions. context: {context_chunks}. Be concise and friendly."
+                else:
+                    instructions = TOOL_ANSWER_INSTRUCTIONS
+                response_create_event = {
+                    "type": "response.create",
+                    "response": {
+                        "modalities": ["text", "audio"],
+                        "instructions": instructions,
+                        "metadata": {"tool_result_delivery": TOOL_RESULT_DELIVERY},
+                    },
+                }
+                await openai_ws.send(dumps(response_create_event))
+                tool_answer_requested_at = time.monotonic()
+
+            def record_tool_answer_usage(current_response):
+                """Record the input tokens of a response answering tool results."""
+                metadata = current_response.get("metadata") or {}
+                usage = current_response.get("usage")
+                delivery = metadata.get("tool_result_delivery")
+                if delivery is None or not usage:
+                    return
+                metrics.observe(
+                    f"tool_answer.{delivery}.input_tokens", usage.get("input_tokens", 0)
+                )
+                details = usage.get("input_token_details") or {}
+                metrics.observe(
+                    f"tool_answer.{delivery}.cached_tokens", details.get("cached_tokens", 0)
+                )
+
+            async def forward_audio_delta(item_id, delta):
+                """Queue an audio delta from OpenAI for Twilio and track the item."""
+                nonlocal last_assistant_item, tool_answer_requested_at
+                if filler is not None and filler.active:
+                    await filler.stop()
+                if tool_answer_requested_at is not None:
+                    metrics.observe(
+                        f"tool_answer.{TOOL_RESULT_DELIVERY}.first_audio_ms",
+                        (time.monotonic() - tool_answer_requested_at) * 1000,
+                    )
+                    tool_answer_requested_at = None
+                if item_id and item_id != last_assistant_item:
+                    outbound.put_control(item_start(item_id))
+
+                if speech_capture is not None:
+                    speech_capture.add(delta)
+
+                if AUDIO_PASSTHROUGH:
+                    # Both legs use g711_ulaw base64, forward the delta as is.
+                    audio_payload = delta
+                else:
+                    audio_payload = base64.b64encode(base64.b64decode(delta)).decode(
+                        "utf-8"
+                    )
+                outbound.put_audio(audio_payload)
+
+                # Update last_assistant_item safely
+                if item_id:
+                    last_assistant_item = item_id
+
+            async def send_apology():
+                """Apologize for a failed turn, from cached speech when there is one."""
+                nonlocal speech_capture
+                apology = speech_cache.get(usecase, context.voice, APOLOGY, APOLOGY_SPEECH)
+                if apology is None:
+                    speech_capture = speech_cache.capture(usecase, context.voice, APOLOGY)
+                    await send_conversation_item(openai_ws, APOLOGY_INSTRUCTIONS)
+                    return
+                if filler is not None:
+                    await filler.stop()
+                await openai_ws.send(build_assistant_message(apology.text))
+                play_speech(apology)
+
+            vad = None
+            if LOCAL_VAD:
+                vad = BargeInDetector(
+                    LOCAL_VAD_RMS, LOCAL_VAD_MAX_CROSSINGS_PER_MS, LOCAL_VAD_MIN_SPEECH_MS
+                )
+            # (item id, truncation point, false positive timer, unplayed audio) of a local barge-in.
+            barge_in = None
+
+            async def detect_barge_in(payload):
+                """Stop playback as soon as the caller talks over the assistant."""
+                nonlocal barge_in
+                if barge_in is not None or not (marks.pending or outbound.audio_ms):
+                    vad.reset()
+                    return
+                if not vad.feed(payload):
+                    return
+                print("Local barge-in detected.")
+                metrics.incr("barge_in.detected")
+                # Hold what OpenAI still sends until the server VAD confirms the interruption.
+                outbound.pause()
+                await websocket.send_text(twilio_frames.clear)
+                audio_end_ms = marks.played_ms_since(playing_item_offset)
+                timer = asyncio.get_running_loop().call_later(
+                    LOCAL_VAD_CONFIRM_MS / 1000, reject_barge_in
+                )
+                barge_in = (playing_item, audio_end_ms, timer, unplayed_audio())
+                # Playback restarts from here, a replay keeps the same audio offsets.
+                marks.clear()
+                sent_audio.clear()
+
+            async def confirm_barge_in():
+                """The server heard the caller too, drop the held audio and truncate."""
+                nonlocal barge_in
+                item_id, audio_end_ms, timer, _ = barge_in
+                timer.cancel()
+                barge_in = None
+                metrics.incr("barge_in.confirmed")
+                outbound.clear_audio()
+                outbound.resume()
+                await truncate_interrupted(item_id, audio_end_ms)
+
+            def reject_barge_in():
+                """No speech from the server VAD in time, resume the held audio."""
+                nonlocal barge_in
+                unplayed = barge_in[3]
+                barge_in = None
+                print("Local barge-in was a false positive.")
+                metrics.incr("barge_in.false_positive")
+                # Twilio dropped the audio it had buffered, resend it from where playback stopped.
+                outbound.requeue_audio(unplayed)
+                outbound.resume()
 
-            await asyncio.gather(receive_from_twilio(), send_to_twilio())
+            async def handle_speech_started_event():
+                """Handle interruption when the caller's speech starts."""
+                print("Handling speech started event.")
+                # Audio still queued here was never sent, it is dropped outright.
+                dropped_ms = outbound.clear_audio()
+                if marks.pending or dropped_ms:
+                    # Truncate where playback is, from the acknowledged marks and the time since.
+                    audio_end_ms = marks.played_ms_since(playing_item_offset)
+                    await websocket.send_text(twilio_frames.clear)
+                    marks.clear()
+                    sent_audio.clear()
+                    await truncate_interrupted(playing_item, audio_end_ms)
+
+            async def truncate_interrupted(item_id, audio_end_ms):
+                """Cut the interrupted item to what the caller heard, and any unplayed item."""
+                nonlocal last_assistant_item, playing_item
+                if item_id:
+                    await send_truncate(item_id, audio_end_ms)
+                if last_assistant_item and last_assistant_item != item_id:
+                    # Generated after the playing item, none of it was heard.
+                    await send_truncate(last_assistant_item, 0)
+                last_assistant_item = None
+                playing_item = None
+
+            async def send_truncate(item_id, audio_end_ms):
+                if SHOW_TIMING_MATH:
+                    print(f"Truncating item with ID: {item_id}, Truncated at: {audio_end_ms}ms")
+                truncate_event = {
+                    "type": "conversation.item.truncate",
+                    "item_id": item_id,
+                    "content_index": 0,
+                    "audio_end_ms": audio_end_ms,
+                }
+                await openai_ws.send(dumps(truncate_event))
+
+            try:
+                await asyncio.gather(receive_from_twilio(), send_to_twilio())
+            finally:
+                if barge_in is not None:
+                    barge_in[2].cancel()
+                for task in tool_turns:
+                    task.cancel()
+                tool_calls.cancel_all()
+                if filler is not None:
+                    filler.cancel()
+        finally:
+            await openai_ws.close()
 
     except WebSocketDisconnect:
         print("WebSocket disconnected by the client.")
     except Exception as e:
         print(f"Unexpected error in media stream: {e}")
     finally:
+        for task in relay_tasks:
+            task.cancel()
         await websocket.close()
 
 
-def load_metadata(
-    type,
-    intermediate,
-    db,
-    re_rank,
-    hybrid_search,
-    hybrid_search_weight,
-    top_k,
-    enable_fields,
-    context_limit,
-    voice,
-):
-    module_name = f"usecases.{type}.config"
-    module = importlib.import_module(module_name)
-
-    global INTRO
-    global INSTRUCTIONS
-    global GREETING_TEXT
-    global VOICE
-    global ADVANCED_SETTINGS
-    global TOOLS_SCHEMA
-    global TOOLS
-    global PARAM_TYPE
-    global PARAM_INTERMEDIATE
-    global PARAM_DB
-    global PARAM_RE_RANK
-    global PARAM_HYBRID_SEARCH
-    global PARAM_HYBRID_SEARCH_WEIGHT
-    global PARAM_TOP_K
-    global PARAM_ENABLE_FIELDS
-    global PARAM_CONTEXT_LIMIT
-    # global INTERMEDIATE_AUDIO
-
-    INTRO = module.INTRO_TEXT
-    INSTRUCTIONS = module.SYSTEM_INSTRUCTIONS
-    GREETING_TEXT = module.GREETING_TEXT
-    VOICE = voice  # module.VOICE
-    ADVANCED_SETTINGS = module.ADVANCED_SETTINGS
-    TOOLS_SCHEMA = module.TOOLS_SCHEMA
-    TOOLS = module.TOOLS
-    # INTERMEDIATE_AUDIO = module.INTERMEDIATE_AUDIO
-    PARAM_TYPE = type
-    PARAM_INTERMEDIATE = intermediate
-    PARAM_DB = db
-    PARAM_RE_RANK = re_rank
-    PARAM_HYBRID_SEARCH = hybrid_search
-    PARAM_HYBRID_SEARCH_WEIGHT = hybrid_search_weight
-    PARAM_TOP_K = top_k
-    PARAM_ENABLE_FIELDS = enable_fields
-    PARAM_CONTEXT_LIMIT = context_limit
+async def wait_for_stream_start(websocket):
+    """Read Twilio frames until `start`, return its stream sid and call context."""
+    async for message in websocket.iter_text():
+        data = loads(message)
+        if data["event"] == "start":
+            stream_sid = data["start"]["streamSid"]
+            print(f"Incoming stream has started {stream_sid}")
+            try:
+                context = CallContext.from_stream_parameters(
+                    data["start"].get("customParameters", {}),
+                    STREAM_SIGNING_SECRET,
+                    STREAM_PARAMETERS_MAX_AGE_SECONDS,
+                )
+            except InvalidStreamParameters as e:
+                print(f"Rejecting stream {stream_sid}: {e}")
+                metrics.incr("stream.rejected")
+                return None, None
+            return stream_sid, context
+    return None, None
 
 
 async def send_conversation_item(ws, text, is_last_response_active=False):
@@ -560,49 +826,58 @@ async def send_conversation_item(ws, text, is_last_response_active=False):
         )
         return
 
-    await ws.send(
-        json.dumps(
-            {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": text}],
-                },
-            }
-        )
-    )
+    for event in build_conversation_item(text):
+        await ws.send(event)
+
 
-    await ws.send(json.dumps({"type": "response.create"}))
-
-
-async def initialize_session(ws):
-    """Control initial session with OpenAI."""
-    session_update = {
-        "type": "session.update",
-        "session": {
-            "turn_detection": ADVANCED_SETTINGS["turn_detection"]
-            or {"type": "server_vad"},
-            "input_audio_format": ADVANCED_SETTINGS["input_audio_format"]
-            or "g711_ulaw",
-            "output_audio_format": ADVANCED_SETTINGS["output_audio_format"]
-            or "g711_ulaw",
-            "voice": VOICE,
-            "instructions": INSTRUCTIONS,
-            "modalities": ADVANCED_SETTINGS["modalities"] or ["text", "audio"],
-            "temperature": ADVANCED_SETTINGS["temperature"] or 0.8,
-            "tools": TOOLS_SCHEMA,
-            "tool_choice": "auto",
+async def open_realtime_session(usecase, voice):
+    """Connect to the Realtime API and configure the session for a usecase and voice."""
+    ws = await websockets.connect(
+        REALTIME_AUDIO_API_URL,
+        extra_headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "OpenAI-Beta": "realtime=v1",
         },
-    }
-    print("Sending session update:", json.dumps(session_update))
-    await ws.send(json.dumps(session_update))
+        ssl=ssl_context,
+    )
+    print(f"Sending session update for usecase: {usecase.name}, voice: {voice}")
+    await ws.send(usecase.session_update(voice))
+    return ws
+
+
+async def prepare_session(usecase, voice):
+    """Open and start the Realtime session of a call before its media stream arrives."""
+    greeting = speech_cache.get(usecase, voice, GREETING, usecase.greeting_speech)
+    ws = realtime_pool.acquire(usecase, voice)
+    if ws is None:
+        ws = await open_realtime_session(usecase, voice)
+    try:
+        await start_conversation(ws, usecase, greeting)
+    except BaseException:
+        await ws.close()
+        raise
+    return PreparedSession(ws, usecase.name, voice, greeting)
+
+
+async def start_conversation(ws, usecase, greeting=None):
+    """Have the AI speak first, or hand it the text of the greeting already played."""
+    if greeting is not None:
+        # The caller already hears the cached greeting, the model only needs its text.
+        await ws.send(build_assistant_message(greeting.text))
+        return
 
     # Uncomment the next line to have the AI speak first
-    await send_conversation_item(ws, GREETING_TEXT)
+    for event in usecase.greeting_events:
+        await ws.send(event)
 
 
 if __name__ == "__main__":
-    import uvicorn
+    if WORKERS > 1:
+        from workers import serve
+
+        # The usecases are loaded by now, the workers share them copy-on-write.
+        serve(app, "0.0.0.0", PORT, WORKERS)
+    else:
+        import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT, log_level="info")
+        uvicorn.run("main:app", host="0.0.0.0", port=PORT, log_level="info")
@@ -0,0 +1,94 @@
+import time
+from collections import deque
+
+from audio import ULAW_BYTES_PER_MS
+
+MARK_PREFIX = "responsePart-"
+
+
+class MarkTracker:
+    """Twilio marks sent for assistant audio that Twilio has not played yet.
+
+    A mark is emitted per `interval_ms` of audio instead of per delta, and
+    each queue entry records the audio offset its segment ends at. The
+    tracker also keeps the playback clock: Twilio has played up to the end of
+    the last acknowledged mark plus the time since, capped by what was sent.
+    """
+
+    def __init__(self, interval_ms):
+        self._interval_bytes = interval_ms * ULAW_BYTES_PER_MS
+        self._queue = deque()
+        self._unmarked_bytes = 0
+        self._sequence = 0
+        # Audio bytes sent over the call, and a point of the playback clock.
+        self.sent_bytes = 0
+        self._acked_bytes = 0
+        self._anchor_bytes = 0
+        self._anchor_time = 0.0
+
+    @property
+    def pending(self):
+        """Whether sent audio may still be playing at Twilio."""
+        return bool(self._queue) or self._unmarked_bytes > 0
+
+    def add_audio(self, size):
+        """Account for sent audio bytes, return a mark name when one is due."""
+        if not self.pending:
+            self._acked_bytes = self.sent_bytes
+        if self.played_bytes() >= self.sent_bytes:
+            # Twilio ran out of audio, this audio starts playing right away.
+            self._anchor_bytes = self.sent_bytes
+            self._anchor_time = time.monotonic()
+        self.sent_bytes += size
+        self._unmarked_bytes += size
+        if self._unmarked_bytes >= self._interval_bytes:
+            return self.mark()
+        return None
+
+    def mark(self):
+        """Close the current segment, return its mark name or None if it is empty."""
+        if not self._unmarked_bytes:
+            return None
+        self._sequence += 1
+        self._queue.append((self._sequence, self.sent_bytes))
+        self._unmarked_bytes = 0
+        return f"{MARK_PREFIX}{self._sequence}"
+
+    def ack(self, name):
+        """Handle a mark echoed by Twilio, return the audio bytes it covered.
+
+        Marks are numbered in send order, so echoes of marks dropped by `clear()`
+        are ignored and an ack also settles any earlier mark Twilio skipped.
+        """
+        if not name.startswith(MARK_PREFIX):
+            return 0
+        sequence = int(name[len(MARK_PREFIX) :])
+        if not self._queue or self._queue[0][0] > sequence:
+            return 0
+        while self._queue and self._queue[0][0] <= sequence:
+            _, end = self._queue.popleft()
+        played = end - self._acked_bytes
+        self._acked_bytes = self._anchor_bytes = end
+        self._anchor_time = time.monotonic()
+        return played
+
+    def played_bytes(self):
+        """Audio offset Twilio has played up to, in O(1)."""
+        if not self.pending:
+            return self.sent_bytes
+        elapsed_ms = (time.monotonic() - self._anchor_time) * 1000
+        return min(self.sent_bytes, self._anchor_bytes + int(elapsed_ms) * ULAW_BYTES_PER_MS)
+
+    def buffered_ms(self):
+        """Milliseconds of sent audio Twilio has not played yet."""
+        return (self.sent_bytes - self.played_bytes()) / ULAW_BYTES_PER_MS
+
+    def played_ms_since(self, offset):
+        """Milliseconds played of the audio sent from `offset` on."""
+        return max(0, self.played_bytes() - offset) // ULAW_BYTES_PER_MS
+
+    def clear(self):
+        """Forget the pending marks after a Twilio `clear`, playback stops where it is."""
+        self.sent_bytes = self._acked_bytes = self._anchor_bytes = self.played_bytes()
+        self._queue.clear()
+        self._unmarked_bytes = 0
@@ -0,0 +1,51 @@
+from collections import defaultdict
+
+
+class Summary:
+    """Running count, average and maximum of an observed value."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+        }
+
+
+# Process wide, every worker exposes its own values on /metrics.
+_counters = defaultdict(int)
+_summaries = defaultdict(Summary)
+_gauges = {}
+
+
+def incr(name, value=1):
+    _counters[name] += value
+
+
+def observe(name, value):
+    _summaries[name].observe(value)
+
+
+def set_gauge(name, value):
+    _gauges[name] = value
+
+
+def snapshot():
+    return {
+        "counters": dict(_counters),
+        "gauges": dict(_gauges),
+        "summaries": {name: summary.snapshot() for name, summary in _summaries.items()},
+    }
@@ -0,0 +1,149 @@
+import asyncio
+import math
+import time
+from collections import defaultdict, deque
+
+import metrics
+
+# Sessions kept per key are enough to cover the calls arriving while this many refills run.
+HEADROOM = 2
+REAP_INTERVAL_SECONDS = 5
+
+
+class IdleSession:
+    __slots__ = ("ws", "opened_at")
+
+    def __init__(self, ws, opened_at):
+        self.ws = ws
+        self.opened_at = opened_at
+
+
+class RealtimePool:
+    """Pre-connected, pre-configured Realtime sessions per (usecase, voice).
+
+    `open_session(usecase, voice)` connects and sends the `session.update`, so
+    a call that gets a pooled session only has to start the conversation. The
+    number of idle sessions per key follows the recent call arrival rate times
+    the time it takes to open one, up to `max_size`. Sessions idle for longer
+    than `idle_seconds` are closed, and the pool refills in the background.
+    """
+
+    def __init__(self, open_session, max_size, idle_seconds, window_seconds):
+        self._open_session = open_session
+        self._max_size = max_size
+        self._idle_seconds = idle_seconds
+        self._window_seconds = window_seconds
+        self._idle = defaultdict(deque)
+        self._opening = defaultdict(int)
+        self._arrivals = defaultdict(deque)
+        self._usecases = {}
+        self._open_seconds = 1.0
+        self._tasks = set()
+        self._reaper = None
+
+    @property
+    def enabled(self):
+        return self._max_size > 0
+
+    def acquire(self, usecase, voice):
+        """Return an idle session for the call, or None, and top the pool up."""
+        if not self.enabled:
+            return None
+        key = (usecase.name, voice)
+        self._usecases[usecase.name] = usecase
+        self._arrivals[key].append(time.monotonic())
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+
+        session = None
+        idle = self._idle[key]
+        while idle:
+            candidate = idle.popleft()
+            if candidate.ws.open:
+                session = candidate.ws
+                break
+            metrics.incr("realtime_pool.dropped")
+        metrics.incr("realtime_pool.hits" if session is not None else "realtime_pool.misses")
+        self._refill(key)
+        return session
+
+    def _target(self, key):
+        arrivals = self._arrivals[key]
+        horizon = time.monotonic() - self._window_seconds
+        while arrivals and arrivals[0] < horizon:
+            arrivals.popleft()
+        if not arrivals:
+            return 0
+        rate = len(arrivals) / self._window_seconds
+        return min(self._max_size, math.ceil(rate * self._open_seconds * HEADROOM))
+
+    def _refill(self, key):
+        missing = self._target(key) - len(self._idle[key]) - self._opening[key]
+        for _ in range(missing):
+            self._opening[key] += 1
+            task = asyncio.create_task(self._open(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _open(self, key):
+        name, voice = key
+        started = time.monotonic()
+        try:
+            ws = await self._open_session(self._usecases[name], voice)
+        except Exception as e:
+            print(f"Error opening pooled Realtime session for {name}/{voice}: {e}")
+            metrics.incr("realtime_pool.errors")
+            return
+        finally:
+            self._opening[key] -= 1
+        elapsed = time.monotonic() - started
+        # Smoothed open latency, it sizes the pool.
+        self._open_seconds = 0.8 * self._open_seconds + 0.2 * elapsed
+        metrics.observe("realtime_pool.open_ms", elapsed * 1000)
+        self._idle[key].append(IdleSession(ws, time.monotonic()))
+        self._publish(key)
+
+    async def _reap(self):
+        while True:
+            await asyncio.sleep(REAP_INTERVAL_SECONDS)
+            expired_before = time.monotonic() - self._idle_seconds
+            stale = []
+            for key, idle in list(self._idle.items()):
+                target = self._target(key)
+                kept = deque()
+                # Oldest first, sessions over the target go before they expire.
+                for index, session in enumerate(idle):
+                    if (
+                        session.ws.open
+                        and session.opened_at > expired_before
+                        and len(idle) - index <= target
+                    ):
+                        kept.append(session)
+                    else:
+                        stale.append(session.ws)
+                self._idle[key] = kept
+                self._refill(key)
+                self._publish(key)
+            metrics.incr("realtime_pool.expired", len(stale))
+            for ws in stale:
+                await self._close(ws)
+
+    def _publish(self, key):
+        metrics.set_gauge(f"realtime_pool.{key[0]}.{key[1]}.idle", len(self._idle[key]))
+
+    @staticmethod
+    async def _close(ws):
+        try:
+            await ws.close()
+        except Exception as e:
+            print(f"Error closing pooled Realtime session: {e}")
+
+    async def close(self):
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        for task in list(self._tasks):
+            task.cancel()
+        for idle in self._idle.values():
+            while idle:
+                await self._close(idle.popleft().ws)
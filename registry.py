@@ -0,0 +1,163 @@
+import importlib
+import os
+import re
+from dataclasses import dataclass
+
+from assets import load_usecase_assets
+from codec import dumps
+from formatter import ResultFormatter
+
+USECASES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "usecases")
+
+# Voices supported by the Realtime API, session.update payloads are precompiled for each.
+VOICES = ("alloy", "ash", "ballad", "coral", "echo", "sage", "shimmer", "verse")
+
+REQUIRED_ATTRIBUTES = (
+    "INTRO_TEXT",
+    "GREETING_TEXT",
+    "SYSTEM_INSTRUCTIONS",
+    "ADVANCED_SETTINGS",
+)
+
+
+@dataclass(frozen=True)
+class Usecase:
+    """A validated usecase config with its ready-to-send Realtime API frames."""
+
+    name: str
+    intro_text: str
+    greeting_text: str
+    greeting_speech: str
+    instructions: str
+    advanced_settings: dict
+    tools_schema: list
+    tool_map: dict
+    result_formatters: dict
+    assets: dict
+    filler_audio: tuple
+    greeting_events: tuple
+    session_updates: dict
+
+    def session_update(self, voice):
+        """Return the serialized `session.update` frame for the given voice."""
+        payload = self.session_updates.get(voice)
+        if payload is None:
+            payload = build_session_update(self, voice)
+        return payload
+
+
+def build_session_update(usecase, voice):
+    advanced_settings = usecase.advanced_settings
+    session_update = {
+        "type": "session.update",
+        "session": {
+            "turn_detection": advanced_settings.get("turn_detection")
+            or {"type": "server_vad"},
+            "input_audio_format": advanced_settings.get("input_audio_format")
+            or "g711_ulaw",
+            "output_audio_format": advanced_settings.get("output_audio_format")
+            or "g711_ulaw",
+            "voice": voice,
+            "instructions": usecase.instructions,
+            "modalities": advanced_settings.get("modalities") or ["text", "audio"],
+            "temperature": advanced_settings.get("temperature") or 0.8,
+            "tools": usecase.tools_schema,
+            "tool_choice": "auto",
+        },
+    }
+    return dumps(session_update)
+
+
+def build_conversation_item(text):
+    """Serialize a user message followed by a `response.create` frame."""
+    return (
+        dumps(
+            {
+                "type": "conversation.item.create",
+                "item": {
+                    "type": "message",
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": text}],
+                },
+            }
+        ),
+        dumps({"type": "response.create"}),
+    )
+
+
+def build_assistant_message(text):
+    """Serialize an assistant message, for speech played without the model."""
+    return dumps(
+        {
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": text}],
+            },
+        }
+    )
+
+
+def greeting_speech(module):
+    """The words of the greeting, GREETING_SPEECH or the quoted part of GREETING_TEXT."""
+    speech = getattr(module, "GREETING_SPEECH", None)
+    if speech is None:
+        quoted = re.search(r"'(.+)'", module.GREETING_TEXT, re.S)
+        speech = quoted.group(1).strip() if quoted else None
+    return speech
+
+
+def load_usecase(name):
+    """Import and validate a single usecase folder under /usecases."""
+    module = importlib.import_module(f"usecases.{name}.config")
+
+    missing = [attr for attr in REQUIRED_ATTRIBUTES if not hasattr(module, attr)]
+    if missing:
+        raise ValueError(f"Usecase '{name}' is missing {', '.join(missing)} in config.py")
+
+    tools = getattr(module, "TOOLS", [])
+    tools_schema = getattr(module, "TOOLS_SCHEMA", [])
+    tool_map = {tool.name: tool for tool in tools}
+    # Optional per tool projection of result rows, {tool name: [field, ...]}.
+    result_fields = getattr(module, "TOOL_RESULT_FIELDS", {})
+
+    assets = load_usecase_assets(name, os.path.join(USECASES_DIR, name))
+    filler_names = getattr(module, "FILLER_AUDIO", ())
+    missing_assets = [asset for asset in filler_names if asset not in assets]
+    if missing_assets:
+        raise ValueError(f"Usecase '{name}' has no audio asset {', '.join(missing_assets)}")
+    unknown = [schema["name"] for schema in tools_schema if schema["name"] not in tool_map]
+    if unknown:
+        raise ValueError(f"Usecase '{name}' has no tool for schema {', '.join(unknown)}")
+
+    usecase = Usecase(
+        name=name,
+        intro_text=module.INTRO_TEXT,
+        greeting_text=module.GREETING_TEXT,
+        greeting_speech=greeting_speech(module),
+        instructions=module.SYSTEM_INSTRUCTIONS,
+        advanced_settings=dict(module.ADVANCED_SETTINGS),
+        tools_schema=list(tools_schema),
+        tool_map=tool_map,
+        result_formatters={
+            name: ResultFormatter(name, result_fields.get(name)) for name in tool_map
+        },
+        assets=assets,
+        filler_audio=tuple(assets[asset] for asset in filler_names),
+        greeting_events=build_conversation_item(module.GREETING_TEXT),
+        session_updates={},
+    )
+    for voice in VOICES:
+        usecase.session_updates[voice] = build_session_update(usecase, voice)
+    return usecase
+
+
+def load_usecases(usecases_dir=USECASES_DIR):
+    """Discover every usecase folder that has a config.py and preload it."""
+    usecases = {}
+    for entry in sorted(os.scandir(usecases_dir), key=lambda entry: entry.name):
+        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "config.py")):
+            usecases[entry.name] = load_usecase(entry.name)
+    print(f"Loaded usecases: {', '.join(usecases)}")
+    return usecases
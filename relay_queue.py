@@ -0,0 +1,142 @@
+import asyncio
+from collections import deque
+
+import metrics
+from audio import ULAW_BYTES_PER_MS, base64_length
+
+
+class RelayQueue:
+    """Bounded queue decoupling a read loop from the peer it forwards audio to.
+
+    Audio payloads are bounded by `max_ms` of audio. Past it the oldest audio
+    is dropped, so a slow peer costs stale audio instead of memory. Control
+    steps, zero-argument coroutine functions such as sending a mark, keep
+    their place in the stream and are never dropped. When several payloads are
+    waiting, the consumer merges them into one send to catch up, joining the
+    base64 strings without decoding them.
+
+    `send_delay`, if given, returns the seconds to hold the next payload back,
+    which paces the audio to the peer instead of sending it as it comes.
+
+    Depth is recorded as `relay.<name>.depth_ms`, audio lost to the bound as
+    `relay.<name>.dropped_ms` and audio discarded by `clear_audio` as
+    `relay.<name>.cleared_ms`.
+    """
+
+    def __init__(self, name, send_audio, max_ms, merge=True, send_delay=None):
+        self.name = name
+        self._send_audio = send_audio
+        self._max_bytes = max_ms * ULAW_BYTES_PER_MS
+        self._merge = merge
+        self._send_delay = send_delay
+        # Entries are (payload, size) for audio and (None, step) for control.
+        self._items = deque()
+        self._audio_bytes = 0
+        self._ready = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+    @property
+    def audio_ms(self):
+        return self._audio_bytes / ULAW_BYTES_PER_MS
+
+    def put_audio(self, payload):
+        size = base64_length(payload)
+        self._items.append((payload, size))
+        self._audio_bytes += size
+        if self._audio_bytes > self._max_bytes:
+            self._drop_oldest()
+        metrics.observe(f"relay.{self.name}.depth_ms", self._audio_bytes / ULAW_BYTES_PER_MS)
+        self._ready.set()
+
+    def requeue_audio(self, payloads):
+        """Put audio back at the head of the queue, ahead of everything queued."""
+        for payload in reversed(payloads):
+            size = base64_length(payload)
+            self._items.appendleft((payload, size))
+            self._audio_bytes += size
+        if payloads:
+            self._ready.set()
+
+    def put_control(self, step):
+        self._items.append((None, step))
+        self._ready.set()
+
+    def _drop_oldest(self):
+        dropped = 0
+        kept = deque()
+        while self._items and self._audio_bytes > self._max_bytes:
+            payload, size = self._items.popleft()
+            if payload is None:
+                kept.append((payload, size))
+            else:
+                self._audio_bytes -= size
+                dropped += size
+        kept.extend(self._items)
+        self._items = kept
+        metrics.incr(f"relay.{self.name}.dropped_ms", dropped // ULAW_BYTES_PER_MS)
+
+    def clear_audio(self):
+        """Drop every queued audio payload, control steps stay. Returns the ms dropped."""
+        if not self._audio_bytes:
+            return 0
+        dropped_ms = self._audio_bytes // ULAW_BYTES_PER_MS
+        self._items = deque(item for item in self._items if item[0] is None)
+        self._audio_bytes = 0
+        metrics.incr(f"relay.{self.name}.cleared_ms", dropped_ms)
+        return dropped_ms
+
+    def pause(self):
+        """Hold the queue, items keep queueing within the bound until `resume`."""
+        self._resumed.clear()
+
+    def resume(self):
+        self._resumed.set()
+
+    def _next_audio(self, payload, size):
+        """Merge the payloads queued right behind `payload` into it.
+
+        Base64 strings concatenate into valid base64 as long as every chunk but
+        the last encodes a multiple of 3 bytes, that is carries no padding.
+        """
+        self._audio_bytes -= size
+        if not self._merge:
+            return payload
+        chunks = [payload]
+        while (
+            self._items
+            and self._items[0][0] is not None
+            and not chunks[-1].endswith("=")
+        ):
+            payload, size = self._items.popleft()
+            self._audio_bytes -= size
+            chunks.append(payload)
+        if len(chunks) == 1:
+            return payload
+        metrics.incr(f"relay.{self.name}.merged", len(chunks) - 1)
+        return "".join(chunks)
+
+    async def run(self):
+        """Forward queued items in order until cancelled."""
+        try:
+            while True:
+                if not self._items:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                if not self._resumed.is_set():
+                    await self._resumed.wait()
+                    continue
+                if self._items[0][0] is not None and self._send_delay is not None:
+                    delay = self._send_delay()
+                    if delay > 0:
+                        # The queue may be cleared meanwhile, so look again after the wait.
+                        await asyncio.sleep(delay)
+                        continue
+                payload, item = self._items.popleft()
+                if payload is None:
+                    await item()
+                else:
+                    await self._send_audio(self._next_audio(payload, item))
+        except Exception as e:
+            print(f"Error relaying {self.name} audio: {e}")
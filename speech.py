@@ -0,0 +1,73 @@
+import metrics
+
+GREETING = "greeting"
+APOLOGY = "apology"
+
+APOLOGY_INSTRUCTIONS = "Respond to the user with apologetic message. ' apologize, but I'm having trouble processing your request right now. Is there anything else I can help you with?'"
+APOLOGY_SPEECH = "I apologize, but I'm having trouble processing your request right now. Is there anything else I can help you with?"
+
+
+class CapturedAudio:
+    """Audio deltas of a generated response, kept as the base64 payloads received."""
+
+    def __init__(self, payloads):
+        self._payloads = tuple(payloads)
+
+    def frames(self, start=0):
+        return iter(self._payloads[start:])
+
+
+class CachedSpeech:
+    __slots__ = ("text", "clip")
+
+    def __init__(self, text, clip):
+        self.text = text
+        self.clip = clip
+
+
+class SpeechCapture:
+    """Collect the audio and transcript of one response to cache it."""
+
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._payloads = []
+        self.text = None
+
+    def add(self, payload):
+        self._payloads.append(payload)
+
+    def store(self):
+        if self.text and self._payloads:
+            self._cache.put(self._key, CachedSpeech(self.text, CapturedAudio(self._payloads)))
+
+
+class SpeechCache:
+    """Audio of the fixed utterances of each usecase, per voice.
+
+    An utterance comes from a `<kind>-<voice>.wav` asset of the usecase, or
+    from the first response generated for it in this process. Cached speech is
+    played straight to the caller and only its text goes to the model.
+    """
+
+    def __init__(self):
+        self._speech = {}
+
+    def get(self, usecase, voice, kind, text):
+        key = (usecase.name, voice, kind)
+        speech = self._speech.get(key)
+        if speech is None and text:
+            asset = usecase.assets.get(f"{kind}-{voice}")
+            if asset is not None:
+                speech = self._speech[key] = CachedSpeech(text, asset)
+        if speech is not None:
+            metrics.incr(f"speech.{kind}.cached")
+        return speech
+
+    def capture(self, usecase, voice, kind):
+        return SpeechCapture(self, (usecase.name, voice, kind))
+
+    def put(self, key, speech):
+        print(f"Cached {key[2]} speech for usecase: {key[0]}, voice: {key[1]}")
+        metrics.incr(f"speech.{key[2]}.captured")
+        self._speech[key] = speech
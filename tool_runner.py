@@ -0,0 +1,206 @@
+import asyncio
+import time
+from collections import deque
+
+import metrics
+from config import TOOL_HEDGE, TOOL_HEDGE_MIN_SAMPLES, TOOL_TIMEOUT_SECONDS, TOOL_TIMEOUTS
+from usecases.http_client import hedged_request, request_deadline
+
+# Extra time for a tool to surface its own timeout before its deadline cancels it.
+DEADLINE_GRACE_SECONDS = 0.25
+
+
+class LatencyWindow:
+    """The most recent successful latencies of a tool, in seconds."""
+
+    def __init__(self, size=200):
+        self._samples = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, seconds):
+        self._samples.append(seconds)
+
+    def percentile(self, fraction):
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+latency_windows = {}
+
+
+async def _attempt(tool, args):
+    started = time.monotonic()
+    if tool.coroutine is not None:
+        result = await tool.coroutine(**args)
+    else:
+        result = await asyncio.to_thread(tool.func, **args)
+    elapsed = time.monotonic() - started
+
+    window = latency_windows.setdefault(tool.name, LatencyWindow())
+    window.add(elapsed)
+    metrics.observe(f"tool.{tool.name}.ms", elapsed * 1000)
+    metrics.set_gauge(f"tool.{tool.name}.p50_ms", round(window.percentile(0.5) * 1000, 3))
+    metrics.set_gauge(f"tool.{tool.name}.p95_ms", round(window.percentile(0.95) * 1000, 3))
+    return result
+
+
+def _hedge_delay(name):
+    """Seconds after which a hedged request is sent, None when the tool is not hedged."""
+    window = latency_windows.get(name)
+    if name not in TOOL_HEDGE or window is None or len(window) < TOOL_HEDGE_MIN_SAMPLES:
+        return None
+    return window.percentile(0.95)
+
+
+async def _hedged(tool, args, delay):
+    first = asyncio.create_task(_attempt(tool, args))
+    pending = {first}
+    error = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return first.result()
+
+        metrics.incr(f"tool.{tool.name}.hedged")
+        # The task copies the context, so only the second attempt skips request collapsing.
+        token = hedged_request.set(True)
+        try:
+            pending.add(asyncio.create_task(_attempt(tool, args)))
+        finally:
+            hedged_request.reset(token)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        # Also reached when the deadline cancels the wait, no attempt is left running.
+        for task in pending:
+            task.cancel()
+
+
+async def invoke_tool(tool, args):
+    """Run a usecase tool within its deadline, awaiting coroutine tools directly.
+
+    Synchronous tools still run in the default executor. Tools listed in
+    TOOL_HEDGE get a second request once they run past their p95 latency, and
+    the first answer wins. Successful latencies are recorded per tool as
+    `tool.<name>.ms` and feed the p50/p95 gauges the hedge threshold uses.
+    """
+    timeout = TOOL_TIMEOUTS.get(tool.name, TOOL_TIMEOUT_SECONDS)
+    token = request_deadline.set(asyncio.get_running_loop().time() + timeout)
+    try:
+        async with asyncio.timeout(timeout + DEADLINE_GRACE_SECONDS):
+            delay = _hedge_delay(tool.name)
+            if delay is None:
+                return await _attempt(tool, args)
+            return await _hedged(tool, args, delay)
+    except TimeoutError:
+        metrics.incr(f"tool.{tool.name}.timeouts")
+        raise
+    finally:
+        request_deadline.reset(token)
+
+
+class ToolCall:
+    __slots__ = ("response_id", "name", "arguments", "task", "started_at", "finished_at")
+
+    def __init__(self, response_id, name):
+        self.response_id = response_id
+        self.name = name
+        self.arguments = []
+        self.task = None
+        self.started_at = None
+        self.finished_at = None
+
+
+class SpeculativeToolCalls:
+    """Start function calls as soon as the model has streamed their arguments.
+
+    Arguments are collected per `call_id` from the `response.function_call_arguments`
+    events, and a tool in `speculative` starts on `.done` instead of waiting for
+    `response.done`. Only read-only tools belong there, cancelling a call does
+    not undo a request it already sent. At most `max_concurrency` tools of a
+    call run at once. The time gained per turn is recorded as
+    `tool.speculative_saved_ms`.
+    """
+
+    def __init__(self, run, max_concurrency, speculative):
+        self._run = run
+        self._speculative = speculative
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._calls = {}
+
+    def on_item_added(self, response_id, item):
+        if item.get("type") == "function_call":
+            self._calls[item["call_id"]] = ToolCall(response_id, item.get("name"))
+
+    def on_arguments_delta(self, call_id, delta):
+        call = self._calls.get(call_id)
+        if call is not None:
+            call.arguments.append(delta)
+
+    def on_arguments_done(self, response_id, call_id, arguments, name=None):
+        call = self._calls.get(call_id)
+        if call is None:
+            call = self._calls[call_id] = ToolCall(response_id, name)
+        if call.task is None and call.name in self._speculative:
+            call.arguments = [arguments]
+            self._start(call)
+            metrics.incr("tool.speculative_started")
+
+    def _start(self, call):
+        call.started_at = time.monotonic()
+        call.task = asyncio.create_task(self._bounded_run(call.name, "".join(call.arguments)))
+        call.task.add_done_callback(lambda task: self._on_finished(call, task))
+
+    async def _bounded_run(self, name, arguments):
+        async with self._semaphore:
+            return await self._run(name, arguments)
+
+    @staticmethod
+    def _on_finished(call, task):
+        call.finished_at = time.monotonic()
+        # Results of cancelled responses are never awaited, retrieve them here.
+        if not task.cancelled():
+            task.exception()
+
+    async def results(self, items):
+        """Run the `function_call` output items of `response.done` concurrently.
+
+        Returns one result per item, or the exception the tool raised.
+        """
+        now = time.monotonic()
+        tasks = []
+        saved = 0.0
+        for item in items:
+            call = self._calls.pop(item["call_id"], None)
+            if call is None or call.task is None:
+                call = ToolCall(None, item.get("name"))
+                call.arguments = [item.get("arguments", "{}")]
+                self._start(call)
+            else:
+                finished_at = call.finished_at or now
+                saved = max(saved, min(finished_at, now) - call.started_at)
+            tasks.append(call.task)
+        # Calls of a turn run in parallel, so the turn gains the largest head start.
+        metrics.observe("tool.speculative_saved_ms", saved * 1000)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def cancel_response(self, response_id):
+        """Drop the calls of a response that did not complete."""
+        for call_id, call in list(self._calls.items()):
+            if call.response_id == response_id:
+                del self._calls[call_id]
+                if call.task is not None:
+                    call.task.cancel()
+
+    def cancel_all(self):
+        for call in self._calls.values():
+            if call.task is not None:
+                call.task.cancel()
+        self._calls.clear()
@@ -0,0 +1,48 @@
+from functools import lru_cache
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from twilio.twiml.voice_response import Connect, VoiceResponse
+
+PARAMETERS_PLACEHOLDER = "__stream_parameters__"
+PATH_PLACEHOLDER = "__stream_path__"
+ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
+
+@lru_cache(maxsize=128)
+def incoming_call_template(usecase_name, intro_text, host):
+    """Render the /incoming-call TwiML once and split it around the per-call parts.
+
+    Those are the end of the <Stream> url path and the <Stream> parameters. The
+    cache is bounded since the host comes from the request.
+    """
+    voice_response = VoiceResponse()
+    # <Say> punctuation to improve text-to-speech flow
+    if intro_text:
+        voice_response.say(intro_text)
+        voice_response.pause(length=1)
+    connect = Connect()
+    stream = connect.stream(url=f"wss://{host}/media-stream{PATH_PLACEHOLDER}")
+    stream.parameter(name=PARAMETERS_PLACEHOLDER)
+    voice_response.append(connect)
+
+    placeholder = f'<Parameter name="{PARAMETERS_PLACEHOLDER}" />'
+    prefix, suffix = str(voice_response).split(placeholder)
+    head, middle = prefix.split(PATH_PLACEHOLDER)
+    return head, middle, suffix
+
+
+def render_incoming_call(usecase, host, parameters, token=None):
+    """Build the TwiML connecting a call to /media-stream with the given parameters.
+
+    Twilio does not allow a query string on the <Stream> url, so the token of a
+    prepared session goes in the path, /media-stream/<token>.
+    """
+    head, middle, suffix = incoming_call_template(usecase.name, usecase.intro_text, host)
+    path = f"/{quote(token, safe='')}" if token else ""
+    elements = "".join(
+        f'<Parameter name="{escape(name, ATTRIBUTE_ENTITIES)}" '
+        f'value="{escape(value, ATTRIBUTE_ENTITIES)}" />'
+        for name, value in parameters.items()
+    )
+    return head + path + middle + elements + suffix
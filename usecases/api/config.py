@@ -10,6 +10,9 @@ ADVANCED_SETTINGS = {
     "temperature": 0.8,
 }
 
+# Audio assets played while tool calls run, when the call enables `intermediate`.
+FILLER_AUDIO = ("custom-audio",)
+
 # Entry message spoken out to the end user by Twilio.
 INTRO_TEXT = (
     """Thank you for calling. For quality of service, this call may be recorded. """
@@ -0,0 +1,182 @@
+import asyncio
+import csv
+import json
+import os
+from bisect import bisect_left, bisect_right
+
+# Search params matched exactly against the row field of the same name.
+EXACT_FIELDS = (
+    "vin",
+    "stock_number",
+    "vehicle_type",
+    "make",
+    "model",
+    "trim",
+    "style",
+    "exterior_color",
+    "interior_color",
+    "certified",
+    "fuel_type",
+    "transmission",
+    "drive_type",
+    "doors",
+    "engine_type",
+)
+# Row fields holding several values, a search matches any one of them.
+LIST_FIELDS = ("features", "packages")
+# Free text fields, matched as a substring of the candidates left by the indexes.
+TEXT_FIELDS = ("options", "description")
+
+
+def _normalize(value):
+    return str(value).strip().casefold()
+
+
+def _to_number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _split_list(value):
+    if isinstance(value, list):
+        return value
+    if value in (None, ""):
+        return []
+    return str(value).split(",")
+
+
+class InventoryIndex:
+    """Immutable in-memory index over an inventory snapshot.
+
+    Exact fields and list fields get an inverted index from normalized value to
+    row ids, price and year are kept as sorted arrays for range lookups.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._inverted = {field: {} for field in EXACT_FIELDS + LIST_FIELDS}
+        prices = []
+        years = []
+        for row_id, row in enumerate(rows):
+            for field in EXACT_FIELDS:
+                value = row.get(field)
+                if value not in (None, ""):
+                    self._inverted[field].setdefault(_normalize(value), set()).add(row_id)
+            for field in LIST_FIELDS:
+                for value in _split_list(row.get(field)):
+                    self._inverted[field].setdefault(_normalize(value), set()).add(row_id)
+            price = _to_number(row.get("price"))
+            if price is not None:
+                prices.append((price, row_id))
+            year = _to_number(row.get("year"))
+            if year is not None:
+                years.append((year, row_id))
+        prices.sort()
+        years.sort()
+        self._prices = prices
+        self._price_keys = [price for price, _ in prices]
+        self._years = years
+        self._year_keys = [year for year, _ in years]
+
+    @classmethod
+    def load(cls, path):
+        """Build an index from a JSON (list or {"data": [...]}) or CSV snapshot."""
+        with open(path, newline="", encoding="utf-8") as snapshot:
+            if path.endswith(".csv"):
+                rows = list(csv.DictReader(snapshot))
+            else:
+                rows = json.load(snapshot)
+                if isinstance(rows, dict):
+                    rows = rows["data"]
+        return cls(rows)
+
+    def _range(self, entries, keys, low, high):
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        return {row_id for _, row_id in entries[start:end]}
+
+    def search(self, params):
+        """Answer a get_inventory_search call from the filtered query params."""
+        candidates = []
+        for field in EXACT_FIELDS + LIST_FIELDS:
+            if field in params:
+                candidates.append(self._inverted[field].get(_normalize(params[field]), set()))
+        if "year" in params:
+            year = _to_number(params["year"])
+            candidates.append(self._range(self._years, self._year_keys, year, year))
+        if "min_price" in params or "max_price" in params:
+            candidates.append(
+                self._range(
+                    self._prices,
+                    self._price_keys,
+                    _to_number(params.get("min_price")),
+                    _to_number(params.get("max_price")),
+                )
+            )
+
+        if candidates:
+            candidates.sort(key=len)
+            row_ids = set(candidates[0]).intersection(*candidates[1:])
+        else:
+            row_ids = range(len(self.rows))
+        rows = [self.rows[row_id] for row_id in sorted(row_ids)]
+
+        for field in TEXT_FIELDS:
+            if field in params:
+                needle = _normalize(params[field])
+                rows = [row for row in rows if needle in _normalize(row.get(field, ""))]
+
+        if params.get("fields"):
+            fields = [field.strip() for field in params["fields"].split(",") if field.strip()]
+            rows = [{field: row.get(field) for field in fields} for row in rows]
+
+        context_limit = params.get("context_limit")
+        if context_limit:
+            rows = self._fit(rows, int(context_limit))
+        return rows
+
+    @staticmethod
+    def _fit(rows, context_limit):
+        """Keep as many leading rows as fit in `context_limit` characters."""
+        size = 2
+        for count, row in enumerate(rows):
+            size += len(str(row)) + 2
+            if size > context_limit:
+                return rows[:count]
+        return rows
+
+
+class InventoryEngine:
+    """Serves searches from the latest snapshot and reloads it in the background.
+
+    The snapshot is rebuilt in a worker thread when the file changes, and the
+    new index replaces the old one in a single assignment, so searches never
+    wait on a refresh.
+    """
+
+    def __init__(self, path, refresh_seconds):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self._mtime = os.path.getmtime(path)
+        self.index = InventoryIndex.load(path)
+        self._refresh_task = None
+        print(f"Loaded inventory snapshot {path} with {len(self.index.rows)} rows")
+
+    def search(self, params):
+        if self.refresh_seconds > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+        return self.index.search(params)
+
+    async def _refresh(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                mtime = os.path.getmtime(self.path)
+                if mtime != self._mtime:
+                    self.index = await asyncio.to_thread(InventoryIndex.load, self.path)
+                    self._mtime = mtime
+                    print(f"Reloaded inventory snapshot with {len(self.index.rows)} rows")
+            except Exception as e:
+                print(f"Error reloading inventory snapshot: {e}")
@@ -1,15 +1,34 @@
 import os
 
-import requests
 from langchain_core.tools import StructuredTool, tool
 from pydantic import BaseModel, Field
+from yarl import URL
 
+from usecases import http_client
+from usecases.api.inventory import InventoryEngine
+from usecases.cache import TTLCache
 from usecases.util import convert_to_function
 
 BASE_URL = os.getenv(
     "TOOLS_API_URL", "https://mock-api-realtime-938786674786.us-central1.run.app"
 )
 
+# Inventory search results are cached in process, a TTL of 0 disables the cache.
+INVENTORY_CACHE_TTL = float(os.getenv("INVENTORY_CACHE_TTL", 60))
+INVENTORY_CACHE_SIZE = int(os.getenv("INVENTORY_CACHE_SIZE", 512))
+
+inventory_cache = TTLCache("inventory_cache", INVENTORY_CACHE_SIZE, INVENTORY_CACHE_TTL)
+
+# Optional JSON/CSV inventory snapshot searched in process instead of the remote API.
+INVENTORY_SNAPSHOT_PATH = os.getenv("INVENTORY_SNAPSHOT_PATH", "")
+INVENTORY_REFRESH_SECONDS = float(os.getenv("INVENTORY_REFRESH_SECONDS", 300))
+
+inventory_engine = (
+    InventoryEngine(INVENTORY_SNAPSHOT_PATH, INVENTORY_REFRESH_SECONDS)
+    if INVENTORY_SNAPSHOT_PATH
+    else None
+)
+
 # ---------------------------
 # Book Appointment Tool
 # ---------------------------
@@ -24,7 +43,7 @@ class BookAppointmentModel(BaseModel):
 
 
 @tool
-def book_appointment(
+async def book_appointment(
     customer_name: str,
     vehicle_details: str,
     date: str,
@@ -39,7 +58,6 @@ def book_appointment(
     Customer Name, Vehicle Details, Date, Time, and Service.
     """
     url = f"{BASE_URL}/book-appointment"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "customer_name": customer_name,
         "vehicle_details": vehicle_details,
@@ -47,8 +65,7 @@ def book_appointment(
         "time": time,
         "service": service,
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.text
+    return await http_client.post_json(url, payload)
 
 
 book_appointment_schema = StructuredTool.from_function(
@@ -76,7 +93,7 @@ class AppointmentDetails(BaseModel):
 
 
 @tool
-def get_appointment_details(
+async def get_appointment_details(
     query: str,
     re_rank: bool = False,
     hybrid_search: bool = False,
@@ -91,7 +108,6 @@ def get_appointment_details(
     Query the knowledge base for questions about the booked appointment.
     """
     url = f"{BASE_URL}/vector-info"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "query": query,
         "filter": {
@@ -105,10 +121,10 @@ def get_appointment_details(
         "db": db,
     }
 
-    response = requests.post(url, json=payload, headers=headers)
+    response_text = await http_client.post_json(url, payload)
     print("RAG Payload: ", payload)
 
-    return str(response.text)
+    return str(response_text)
 
 
 get_appointment_details_schema = StructuredTool.from_function(
@@ -639,7 +655,7 @@ class InventorySearchModel(BaseModel):
 
 
 @tool
-def get_inventory_search(
+async def get_inventory_search(
     vin: str = None,
     stock_number: str = None,
     vehicle_type: str = None,
@@ -696,22 +712,44 @@ def get_inventory_search(
         "context_limit": context_limit,
     }
 
-    # Filter out None values
-    filtered_params = {k: v for k, v in query_params.items() if v is not None}
+    # Filter out None values, aiohttp only accepts text and numbers as query values
+    filtered_params = {k: str(v) for k, v in query_params.items() if v is not None}
 
     # Debugging print statements
     print(f"enable_fields: {enable_fields} | fields: {fields}")
     print(f"Filtered parameters: {filtered_params}")
 
+    if inventory_engine is not None:
+        return inventory_engine.search(filtered_params)
+
     # Construct the URL with query parameters
     url = f"{BASE_URL}/search"
-    full_url = requests.Request("GET", url, params=filtered_params).prepare().url
-    print(f"Invoked URL: {full_url}")
-
-    # Make the GET request
-    response = requests.get(url, params=filtered_params)
-    json_response = response.json()
-    return str(json_response["data"])
+    print(f"Invoked URL: {URL(url).with_query(filtered_params)}")
+
+    # Make the GET request, identical searches are served from the cache
+    if INVENTORY_CACHE_TTL > 0:
+        json_response = await inventory_cache.get_or_load(
+            inventory_cache_key(filtered_params),
+            lambda: search_inventory(url, filtered_params),
+        )
+    else:
+        json_response = await search_inventory(url, filtered_params)
+    return json_response["data"]
+
+
+async def search_inventory(url, params):
+    """GET an inventory search, an answer without `data` raises so it is never cached."""
+    json_response = await http_client.get_json(url, params=params)
+    if not isinstance(json_response, dict) or "data" not in json_response:
+        raise ValueError(f"Inventory search returned no data: {str(json_response)[:200]}")
+    return json_response
+
+
+def inventory_cache_key(filtered_params):
+    """Normalize search params so equivalent searches share a cache entry."""
+    return tuple(
+        sorted((key, value.strip().casefold()) for key, value in filtered_params.items())
+    )
 
 
 get_inventory_search_schema = StructuredTool.from_function(
@@ -727,6 +765,29 @@ get_inventory_search_schema = StructuredTool.from_function(
 # ---------------------------
 
 TOOLS = [get_inventory_search, book_appointment, get_appointment_details]
+# Row fields relayed to the model, the fields it asks for explicitly are kept as well.
+TOOL_RESULT_FIELDS = {
+    "get_inventory_search": [
+        "year",
+        "make",
+        "model",
+        "trim",
+        "style",
+        "price",
+        "exterior_color",
+        "interior_color",
+        "certified",
+        "fuel_type",
+        "transmission",
+        "drive_type",
+        "doors",
+        "engine_type",
+        "features",
+        "packages",
+        "stock_number",
+        "vin",
+    ],
+}
 TOOLS_SCHEMA = [
     convert_to_function(book_appointment_schema),
     convert_to_function(get_inventory_search_schema),
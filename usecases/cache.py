@@ -0,0 +1,62 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+import metrics
+from usecases.http_client import hedged_request
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after `ttl_seconds`.
+
+    Concurrent misses for the same key share a single in-flight load, except
+    for the hedged attempt of a tool call, which loads on its own. Hits,
+    misses, collapsed and hedged requests are counted as `<name>.hits`,
+    `<name>.misses`, `<name>.collapsed` and `<name>.hedged` on /metrics.
+    """
+
+    def __init__(self, name, max_size, ttl_seconds):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._in_flight = {}
+
+    async def get_or_load(self, key, load):
+        """Return the cached value for `key`, or await `load()` and cache its result."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                metrics.incr(f"{self.name}.hits")
+                return value
+            del self._entries[key]
+
+        if hedged_request.get():
+            # Joining the slow load being hedged would defeat the hedge.
+            metrics.incr(f"{self.name}.hedged")
+            return await load()
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            metrics.incr(f"{self.name}.collapsed")
+        else:
+            metrics.incr(f"{self.name}.misses")
+            task = asyncio.ensure_future(load())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._on_loaded(key, done))
+        # A cancelled caller must not cancel the load shared with other callers.
+        return await asyncio.shield(task)
+
+    def _on_loaded(self, key, task):
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
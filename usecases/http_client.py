@@ -0,0 +1,175 @@
+import asyncio
+import os
+import time
+from contextvars import ContextVar
+
+import aiohttp
+from yarl import URL
+
+import metrics
+
+TIMEOUT_SECONDS = float(os.getenv("TOOLS_HTTP_TIMEOUT", 10))
+MAX_CONNECTIONS = int(os.getenv("TOOLS_HTTP_MAX_CONNECTIONS", 100))
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("TOOLS_HTTP_MAX_CONNECTIONS_PER_HOST", 20))
+KEEPALIVE_SECONDS = float(os.getenv("TOOLS_HTTP_KEEPALIVE", 30))
+# Consecutive failures that open the circuit of an endpoint, and how long it stays open.
+BREAKER_FAILURES = int(os.getenv("TOOLS_BREAKER_FAILURES", 5))
+BREAKER_RESET_SECONDS = float(os.getenv("TOOLS_BREAKER_RESET_SECONDS", 30))
+
+# Loop time by which the current tool call must finish, set by the tool runner.
+request_deadline = ContextVar("request_deadline", default=None)
+# Set for the second attempt of a hedged tool call, it must send its own request.
+hedged_request = ContextVar("hedged_request", default=False)
+
+_session = None
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Fail fast on an upstream endpoint after repeated failures.
+
+    After `BREAKER_FAILURES` consecutive errors, timeouts or 5xx responses the
+    circuit opens and requests fail immediately. Once `BREAKER_RESET_SECONDS`
+    have passed a single trial request is let through, and its outcome closes
+    or reopens the circuit.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def before_request(self):
+        if self.opened_at is None:
+            return
+        if self.trial_in_flight or time.monotonic() - self.opened_at < BREAKER_RESET_SECONDS:
+            metrics.incr(f"breaker.{self.name}.rejected")
+            raise CircuitOpenError(f"Circuit open for {self.name}")
+        self.trial_in_flight = True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= BREAKER_FAILURES:
+            if self.opened_at is None:
+                print(f"Opening circuit for {self.name}")
+                metrics.incr(f"breaker.{self.name}.opened")
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        """Forget a trial request that was cancelled before it finished."""
+        self.trial_in_flight = False
+
+
+_breakers = {}
+
+
+def get_breaker(url):
+    """Breaker of an endpoint, keyed by origin and first path segment."""
+    url = URL(url)
+    segment = url.path.strip("/").split("/", 1)[0]
+    name = f"{url.host}/{segment}"
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def get_session():
+    """Return the client session shared by every tool, created on first use.
+
+    Connections are kept alive and pooled, so tool calls skip the TCP and TLS
+    handshake once the upstream has been reached.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+            ),
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT_SECONDS),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _timeout():
+    """Client timeout capped by the deadline of the tool call in progress."""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - asyncio.get_running_loop().time()
+    return aiohttp.ClientTimeout(total=max(0.001, min(TIMEOUT_SECONDS, remaining)))
+
+
+def _response_error(response):
+    return aiohttp.ClientResponseError(
+        response.request_info,
+        response.history,
+        status=response.status,
+        message=response.reason or "",
+    )
+
+
+async def _request(method, url, read, raise_for_status=False, **kwargs):
+    breaker = get_breaker(url)
+    breaker.before_request()
+    timeout = _timeout()
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    try:
+        async with get_session().request(method, url, **kwargs) as response:
+            body = await read(response)
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+    if response.status >= 500:
+        breaker.record_failure()
+        # A server error is a failed call, its body is no result for the model.
+        raise _response_error(response)
+    breaker.record_success()
+    # A client error doesn't count against the endpoint, but it is no result either.
+    if raise_for_status and response.status >= 400:
+        raise _response_error(response)
+    return body
+
+
+async def get(url, params=None):
+    """GET a url and return the response body as text."""
+    return await _request("GET", url, lambda response: response.text(), params=params)
+
+
+async def get_json(url, params=None):
+    """GET a url and return the decoded JSON body, an error reply raises."""
+    return await _request(
+        "GET",
+        url,
+        lambda response: response.json(content_type=None),
+        raise_for_status=True,
+        params=params,
+    )
+
+
+async def post_json(url, payload):
+    """POST a JSON payload and return the response body as text."""
+    return await _request("POST", url, lambda response: response.text(), json=payload)
@@ -10,6 +10,9 @@ ADVANCED_SETTINGS = {
     "temperature": 0.8,
 }
 
+# Audio assets played while tool calls run, when the call enables `intermediate`.
+FILLER_AUDIO = ("intermediate-audio",)
+
 # Entry message spoken out to the end user by Twilio.
 INTRO_TEXT = (
     """Thank you for calling. For quality of service, this call may be recorded. """
@@ -64,6 +67,3 @@ BMW of Fairfax is a highly rated dealership in the Greater D.C. area, specializi
 - Phone: +1 800-641-4873  
 - Website: [bmwoffairfax.com](http://bmwoffairfax.com)
 """
-
-
-INTERMEDIATE_AUDIO = "UklGRiT6AABXQVZFZm10IBAAAAABAAEAQB8AAIA+AAACABAAZGF0YQD6AAAAABVMLFuRY/dohmzAbuJvBnAvb0ptJmpdZQhepVGNMV67L6h4nmCYWpTGkVeQ6494kAySzJQMmYCf8qngv3Q5zVM3Xx9mp2qcbVtvD3DKb4VuImxdaKhisVnySEbdKrFzo5ObeJYbkwqRC5AIkAGRDZNilnGbPaPBsJraZkhxWYJiQ2gRbHtuxm8QcGFvqW27aj1mZl8gVIE6rsA9qqyfKZnflBeSfpDsj1KQu5FIlEWYT57qp7e6/C9HUdVdPGURaj1tKG8EcOVvyW6WbA5ptWNnW4xMJwpktA6lk5whl4mTSZEikPiPypCoksSVhJrHof+t/cz5Q4xXX2GFZ5RrL26kbxVwjW8AbkdrEGerYFlW6kClx4is+KD/mW2VcZKskPKPMpBxkc6TipcynRGmh7aoH2tOVlxLZHFp1mzubvJv+m8HbwFttGmwZPhcpk/TJyq4z6alndaX/5OPkT6Q7o+YkEuSMZWlmWygjquCxHk+dVUnYLpmDmvdbXxvFHCzb1BuyWvVZ9phWljpRbHRGK9eouSaBJbRkuCQ/o8XkC6RW5PaliecYaQAs7zuIEu2WkhjxmhnbK5u228JcD1vZW1Qapxla15bUmQ0tby7qMqelph+lNyRYZDrj22Q9ZGnlNSYKp9dqVW+NzciU9he4mV/aoNtTW8NcNJvmG5CbI9o9GItWv5J4uMBsuKj2JumljmTG5ERkAOQ8ZDwkjWWLpvTovav+9VDR/BYNGIRaPBrZ269bxJwbm/CbeNqeWbCX8RUdDxmwtmqBaBjmQWVL5KKkO2PSZCmkSaUEJj+nWKne7mHLIdQb137ZOZpIW0YbwBw7G/bbrRsPWn8Y9hbcU2yFl61h6XdnFKXqZNbkSmQ9Y+8kI6Sm5VFmmShS61UypdC/lYLYU5ncGsabplvFXCYbxZua2tIZwBh7FZmQv/JNa1YoT2alpWLkrqQ9Y8qkF6RrZNYl+eclqV/tfAXjk3nWwVkQ2m4bN1u7W//bxZvHW3hafNkYV1tUAYsVLlSp/SdCZghlKORR5Dtj4yQM5IKlWqZEaDtqqLCsDzXVM1fgGbnasVtcG8TcLxvZG7rawpoKmLfWB1Hb9Xdr8aiJZswlu2S75ADkBGQHJE9k6yW4Zvwox6y6uQgSj1a/mKVaEdsm27Tbw1wS29/bXpq2mXMXg1T5zYlvkupH5/NmKKU8pFskOuPY5DekYKUnZjVnsyo4ry5NHJSd16kZVZqaW0/bwpw2m+sbmNswGg/Y6ZaAEst7eOyUqQenNSWV5MskReQ/4/ikNSSCpbtmmuiMa8h0hFGbFjlYdxnzmtSbrRvFHB6b9ptCWuzZhxgYlVBPkDEeKtgoJ6ZLJVIkpeQ7o9AkJGRBJTcl6+d36ZPuG0owE8FXblkumkFbQlv+2/yb+xu0mxraUJkSFxQTsceY7YBpiidhJfJk26RMZDyj66QdJJylQeaBKGdrO7HHEFrVrZgF2dLawNujm8VcKNvLW6Qa35nVGF6V81Do8zorbqhfJq/laWSyJD4jyOQS5GOkyiXnJwepYO0QAyqTHVbvmMUaZpsy27mbwNwJm85bQtqNGXIXS5RlC+OutinRJ4/mESUuJFRkOyPgJAbkuSUMZm3n1Kq58DCOjZUcl9FZsBqrG1jbxFwxW95bg1sPWh4YmFZP0jw2aawL6Npm1yWCZP/kAiQDJAMkSCTfpacm4KjRbEL3hVJwVmyYmRoJmyIbstvD3BZb5ltomoXZitfuFMvOaq/36l1nwWZx5QJkneQ649YkMiRX5RnmIKeQKiIu/IxvVEUXmVlLGpObTFvBnDhb75ugmzwaIdjHVv2S/r8y7PFpGWcBJd2kz2RHZD7j9OQuZLflayaBqJzrtXOz0TkV5Nhp2eraz1uqm8VcIZv8W0va+xmdWD6Vew/SMYerL2g2ZlUlWGSpJDwjzeQfZHik6mXYp1gpjS3byPxTptcdmSOaehs+W72b/dv/G7vbJhphmS1XCRPwCR3t36mdJ22l+qTgpE5kPCPoZBbkkqVypmmoPSrxcWHP9ZVX2DeZiZr622DbxVwrW9CbrNrtGenYQVYHkWXz6GuHqK7mumVwJLWkPyPG5A5kW6T+JZUnKikkrMI+LxLAVt2Y+Roe2y6bt9vB3A0b1RtNmp0ZSxe6VGjMtm7YqiWnnSYZ5TOkVuQ6490kAOSvpT4mGCfu6lKv6Y4jlMUXwhmmWqTbVZvDnDNb41uLmxwaMVi31lWSYnfebGco62biZYnkxCRDZAGkPuQApNRllibFqN0sMLY+0dBWWViMWgFbHRuw28RcGZvsm3KalNmiF9dVD87TcF3qs2fPpntlCCSg5Dsj06Qs5E7lDGYMZ63p0G6wy4BUa9dJGUBajNtIm8CcOhv0G6hbCBpz2OQW+NMrg+/tDqlrpw0l5WTUJEkkPePxJCekrWVbJqiobyt98t3Q1hXQGFxZ4drJ26gbxVwkW8IblRrJGfLYI9We0F9yMisG6EWmnyVepKxkPOPL5BqkcGTeJcVneOlI7YOHRtOLVwxZGBpy2zobvBv/G8NbwxtxWnJZB9d8E9+KZe4/6bCnemXDJSWkUKQ7o+UkEKSIpWPmUqgUavMw9M9O1UGYKRmAGvUbXdvFHC2b1hu1mvpZ/hhjFhcRgLTYK+FovyaFJbbkuaQAJAVkCeRUJPJlg2cNqSrsozqw0qJWi1jtGhbbKdu2G8KcENvb21garNlj16eUlo1O73vqOqeqpiLlOSRZZDrj2mQ7JGZlMCYC58oqcm9UDbiUrRey2VwanltSG8McNVvoG5PbKFoEGNaWl9K8uZTsguk8pu3lkSTIZETkAGQ7JDmkiWWFpusoqyvdtTTRr9YF2L9Z+NrX266bxNwc2/LbfFqjmbkX/9UIz0RwxSrJ6B5mROVOJKPkO2PRZCekRmU/ZfhnTKnC7kTKz1QSF3jZNZpF20Tb/5v7m/hbr9sTmkWZAJcxE0RGr+1s6X4nGSXtZNjkSyQ9I+2kISSi5UumkChCq1myQ1CyFbsYDpnY2sRbpVvFXCcbx9ueWtcZyBhIVfuQu/Kd618oVSapZWUkr+Q9o8nkFeRoZNGl8ucaaUhtTcUO029W+tjMmmtbNdu6m8BcBxvKG3waQtlh122UGYtx7mDpxKeHZgulKuRS5Dsj4eQKpL8lFWZ8J+zqvrB/jucVKxfambZarxta28ScL9vbG74ax1oR2IPWYpHBdcmsO2iP5tAlveS9ZAEkA+QFpEyk5uWx5vGo8yxGOK/SRBa4mKDaDtslG7Qbw5wUW+JbYlq8WXvXkxTxTezvoGpPp/imLCU+pFwkOuPX5DWkXWUiZi2npioX7y7MzBSU16MZUZqX206bwlw3W+ybm9s0mhaY9NaXUvs8TizfaQ5nOaWY5MykRmQ/Y/ckMqS+pXVmkai6q7c0JtFOljGYclnwWtKbrBvFHB/b+JtF2vIZj1gmlXjPvrEtauCoLOZO5VRkpuQ7488kIqR95PKl5KdsKblt60mdE/eXKBkqmn6bANv+W/0b/Ju3Wx8aVtkcFyfTjMhybYvpkSdlpfWk3aRNJDxj6mQa5JjlfCZ4aBerBvHiUA1VpZgAmc+a/ptim8VcKdvNW6da5JndGGuV01EsM0srt+hk5rPla+SzZD5jyCQRJGCkxaXgpzypCm01wVTTEpbpGMDaY5sxW7kbwVwK29EbRxqTGXuXXVRwjAHuwuoYp5SmFGUwJFUkOuPe5ASktaUG5mXnxmqS8AAOvhTT18uZrFqo21ebxBwyG+AbhlsUGiVYpBZqUjY2/SwWKOCm22WFJMFkQmQCpAFkRSTbZaDm1qj97D1261IklmWYlFoGmyAbshvEHBeb6JtsWotZk5f9lP4OULAFqqVnxqZ1ZQSknuQ649VkMCRUpRTmGOeDagMu80wd1HvXU1lHGpEbSxvBXDkb8VujmwCaaNjSVtQTGsFJbTwpIGcFZeBk0SRIJD5j82Qr5LPlZSa4KEvrrrNUkSwV3Rhk2edazVup28VcIpv+m09awFnlWAzVoNAE8dcrN+g8JlilWqSqJDxjzSQdpHWk5eXRZ0xpsy2SSGiTnJcXGR9ad1s8m70b/lvAm/6bKlpn2TcXHFPnCbht66mkZ3Jl/eTipE8kO+PnJBRkjuVtZmEoLerBcXpPpxVPmDJZhhr421/bxRwsG9KbsBryGfFYThYlkXQ0OiuRKLTmvmVypLckP2PGZAykWOT5pY6nH6kO7Me8mFL1VpbY9Nob2yzbt1vCXA6b15tRmqMZVFeLVKxM1q8lqi1noiYdZTWkV+Q649wkPuRsJTimECfg6m5vtE3T1PxXvJlimqJbVFvDnDQb5RuOmyCaOFiDlq7Sf/hybHFo8abmpYxkxaRD5AEkPWQ+JJBlkCb76IqsBXXjkcRWUhiHmj5a2xuwG8ScGtvu23Zamlmq1+ZVPc78cGxqu6fVJn7lCmSh5Dsj0uQq5EvlB6YE56Fp8y5eS25UIldDGXxaShtHG8BcOpv1m6sbDFp6mO7WzdNEBQdtWilypxGl6GTV5EnkPaPv5CVkqaVVZp9oXmt/crzQiNXIWFdZ3lrH26cbxVwlW8RbmJrOWfrYMZWCEJeyQitP6EtmouVhJK2kPSPLJBjkbaTZZf6nLWlwrUuGslNBFwXZE9pwGzhbu5v/m8TbxZt1WnhZEZdOlAEKwW5MKfgnfyXGZSekUWQ7Y+PkDmSFJV5mSigFqsYwyo9AVXlX49m8mrLbXNvE3C6b19u42v8ZxVivVjORmjUqa+qohWbJZblkuuQAZATkCGRRZO4lvObDKRYshHnZEpcWhFjomhPbKBu1W8McEhveW1vaspls17fUkc2xL0lqQmfv5iZlOyRaZDrj2WQ5JGMlKuY657xqEC9ZDWhUpBetGVgam9tQ28LcNhvp25abLNoLGOHWr9KaOqosjWkDJzIlk+TJ5EVkACQ5pDckhWW/ZqGomOvD9NiRo5Y+WHqZ9ZrWG63bxRwd2/Tbf9qpGYFYDhVzT3Cw0+rSKCOmSKVQZKTkO6PQpCXkQ2U6pfDnQGnnLiNKfNPIV3KZMZpDG0Nb/xv8G/obspsX2kwZCtcGE70HB+24aUVnXeXwZNpkS+Q84+xkHuSfJUXmh2hyqyGyIBBk1bNYCVnVWsJbpFvFXCgbyduh2twZz9hVldyQ+7Lua2hoWuatJWeksSQ948kkFCRlpM0l7CcPKXEtN0P5kySW9BjIGmibNBu6G8CcCJvMm0BaiNlrl39ULcuPbq1py+eMZg7lLORTpDsj4OQIJLulD+Zzp95qlTBRjtfVIpfVGbLarJtZm8RcMNvdG4EbDBoZGJAWfdHsdhxsBSjV5tQlgKT+5AGkA2QEJEnk4qWrpueo3yxoN9aSeFZxmJxaC9sjW7Nbw5wVW+SbZhqB2YSX4xTnjhFv7mpX5/3mL2UA5J0kOuPW5DOkWiUdZiXnmSo4LuyMuxRLl51ZTdqVW01bwdw32+5bnps5Gh1Y/9auEvH946zp6RTnPeWbpM5kRuQ/I/XkMCS6pW8miCipK6jzyJFB1ioYbVntGtDbq1vFXCDb+ttJWvdZl5g01WBP77F8quloMqZSZVakqCQ8I85kIKR65O2l3adgKZ7t9MkJ0+2XIdkmWnwbP1u92/2b/hu6GyNaXRkmVzuTlsjMLdepmGdqZfik32RN5Dwj6SQYZJUldqZvqAgrE/G8j/9VXZg7WYwa/Jthm8VcKpvPW6qa6ZnkmHiV8pEys5wrgSiq5relbmS05D7jx2QPpF2kwSXZ5zGpNCzS/35Sx9biWPxaINsvm7hbwZwMW9NbStqY2USXrlR4jGDuz6ogZ5mmF6UyJFYkOuPd5AJksiUBpl2n+Gpsr83ObpTLV8YZqNqmW1Zbw9wy2+HbiZsY2ixYr9ZEUn23UKxgKObm32WH5MLkQyQCJD/kAqTXZZpmzGjqbAB2kVIY1l5Yj5oDWx5bsVvEXBjb6xtwGpEZnFfM1S7Ot7AT6q2nzCZ45QakoCQ7I9RkLmRRZQ/mEWe2qeSuqAvMVHJXTVlDGo6bSZvBHDmb8tumWwUab1jc1unTAoMgLQcpZycJ5eNk0uRIpD4j8iQpZLAlX2avKHqrazM0kN9V1Zhf2eQay1uo28VcI5vAm5LaxZntWBpVhZB5sebrAOhB5pxlXOSrpDyjzGQb5HKk4SXKZ0Dpmm23x5TTkpcQmRsadJs7G7yb/tvCG8EbbppuGQEXbxPXShLuN2mrp3clwOUkZE/kO6Pl5BIkiyVnplhoHurSsRHPmRVHWC0Zgpr2m16bxRwtG9Sbs1r3GfjYWpYDUYV0i6vaaLsmgmW1JLikP+PF5AskViT1ZYfnFSk5rJV7QNLqFpAY8FoY2ysbtpvCnA/b2htVWqjZXZecFKvNN28yqjUnpyYgpTekWOQ649skPKRo5TOmCCfTakqvvA2D1PNXttlemqAbUxvDXDTb5tuRmyVaPxiO1ocSs3kGrLuo+Cbq5Y8kxyREZADkPCQ7ZIwliebx6Lfr37VIUfhWCtiCmjsa2VuvG8TcG9vxG3nan9mzF/VVKo8mcLrqg+gapkJlTKSjJDtj0iQo5EilAqY9Z1Up1i5FCxwUGJd82ThaR5tF2//b+1v3W64bENpBGTlW4tNzxd7tZSl5ZxXl62TXpEqkPWPupCLkpaVPppZoTitCMprQu5WAmFIZ2xrF26YbxVwmW8Zbm9rTmcKYfxWkkJHykitY6FEmpqVjZK7kPWPKZBckaqTU5fenIilYrXUFnVN2lv9Yz5ptWzbbuxvAHAYbyFt5Wn6ZG1dhFBzLHe5YKf9nQ+YJZSmkUiQ7Y+KkDCSBpVkmQeg26pswns8xlTDX3lm42rCbW5vEnC9b2du72sQaDNi7lg/R+zV86/Soi2bNZbwkvGQA5ARkBuROpOmltmb46MGsv3jAkovWvVikGhDbJlu028NcE1vgm1+auFl114fUys3T75bqSif1JimlPWRbZDrj2GQ3JF+lJeYy569qLq8bTReUmxenWVRamVtPm8JcNtvrm5mbMZoR2O0WhxLe+79sl+kJpzZlluTLpEXkP6P4JDSkgWW5ZpgohuvvdHuRVxY22HWZ8lrUG6zbxRwfG/cbQ1ruWYmYHNVcj57xIura6CkmTCVSpKYkO6PPpCPkQCU15emndGmLrjsJ6lP+lyyZLVpAm0Hb/tv8m/ubtVscWlKZFVcaE6FH4S2D6YxnYmXzZNxkTGQ8o+skHGSbZUAmvqgi6ytx/BAW1atYBBnR2sAbo1vFXCkby9ulGuFZ15hilf0Q/PM/a3FoYOaxJWoksmQ+I8ikEmRipMil5ScEKVntH8KkExoW7ZjD2mWbMpu5W8EcCdvPG0Rajxl1F1EUfEvsrrnp02eRJhIlLuRUpDsj36QGJLglCqZrZ9AqrTAiDoiVGdfPma8aqltYm8QcMZve24RbENogWJvWWJIf9q+sDyjcJthlg2TAZEIkAuQCpEck3mWlZt1oy2xZd32SLNZqmJeaCJshW7Kbw9wW2+cbadqHmY1X8pTbDnav++pf58MmcyUDJJ4kOuPV5DGkVuUYJh5njGoYruXMahRCV5dZSdqS20vbwZw4m/AboZs9miQYytbEUyl/+az0qRunAmXeZNAkR6Q+o/RkLaS2pWlmvqhXq5+zqlE1FeKYaFnpms7bqlvFXCHb/RtNGvzZn5gDFYaQITGMazIoOCZWJVjkqWQ8Y82kHuR35Okl1mdUaYUt84i2U6OXG5kiGnlbPdu9W/4b/5u8myeaY5kwVw8T1QllreNpn2dvJfuk4SROpDwj5+QWJJGlcSZnKDiq4rFVz/FVVZg2GYia+ltgm8UcK5vRW63a7pnsGEUWEJF+M+3rimiw5rulcOS2JD8jxuQN5Frk/OWTJybpHezFfagS/NabmPfaHdst27ebwhwNm9XbTtqe2U4Xv5R+TICvHKon556mGuU0JFckOuPc5ABkrqU8ZhWn6mpHr9jOHxTCV8CZpRqkG1Ubw5wzm+PbjJsdWjNYu1ZdUlA4JKxqKO1m46WKpMRkQ6QBpD5kP+STJZRmwmjXrA92NpHM1lcYitoAWxxbsJvEnBob7VtzmpaZpJfcFR3O4HBiarXn0WZ8ZQjkoSQ7I9NkLCROJQsmCeeqKcdumIu61CjXR1l/WkvbSBvAnDpb9JupGwladhjnVv9TBgR27RIpbecOZeZk1KRJZD3j8OQm5KwlWWal6GorarLUENHVzdha2eDayVun28VcJJvC25Zaytn1WChVqZBwMjarCehHZqAlX2Ss5Dzjy6QaJG+k3KXDZ3VpQW2OhwCTiBcKWRbacds5m7vb/1vDm8Pbcpp0WQsXQdQ9im5uA6ny53vlxCUmZFCkO6PkpA/kh6ViJlAoD+rksOhPSpV/F+eZvxq0W12bxNwt29abtpr72cBYpxYf0Zs03evkKIEmxmW35LokACQFZAlkU2TxJYFnCmkkrJx6aZKe1okY65oWGylbtdvC3BEb3JtZWq6ZZpesVKjNWS9AKnznrGYj5TmkWaQ649okOqRlZS5mAGfF6mfvQo2zVKqXsRla2p2bUdvC3DWb6JuU2ynaBljaFp+SvDnbbIXpPqbvJZIkyORE5ABkOqQ45Iglg6boaKWrwfUsEawWA1i92ffa11uuW8TcHRvzW31apVm7l8QVVc9ScMmqzGgf5kYlTuSkJDtj0SQnJEVlPeX2J0ip+m4oComUDxd22TRaRRtEW/9b+9v427DbFNpHmQOXN5N+hrctcGlAZ1ql7mTZJEtkPOPtZCBkoeVJ5o2ofasIsnjQbhW4mA0Z15rD26UbxVwnW8hbn1rYmcqYTFXFkM+y4uth6FbmqqVl5LAkPaPJpBVkZ6TQZfCnFylBLX8EiFNsFvjYyxpqWzUbulvAXAebytt9mkTZZNdzFDSLeq5kqcbniOYMpStkUyQ7I+GkCeS+JROmeafoarFwcc7ilShX2Nm1Wq5bWlvEnDAb25u/GsjaE9iH1mrR4PXPbD5okabRZb7kveQBZAOkBWRLpOWlr+buqO0sVLhoUkBWtpifWg3bJJu0G8OcFJvjG2Oavhl+l5gUwo4376RqUif6Ji0lP2RcZDrj12Q1JFxlIOYrZ6JqDi8bDMbUkdehWVCalxtOW8IcN1vtW5ybNhoYmPhWnlLivNSs4qkQZzrlmaTNJEakP2P2pDHkvWVzZo6otWueNB3RSpYvWHDZ71rSG6vbxRwgG/lbRxrz2ZHYKxVEz83xcirjaC7mT+VVJKdkO+PO5CIkfOTxJeJnaGmxbciJl1P0lyYZKVp92wBb/hv9G/0buBsgWljZH1cuE7fIee2PaZNnZyX2ZN4kTWQ8Y+nkGeSXpXqmdagS6zdxlxAI1aMYPxmOWv4bYlvFXCobzduoWuYZ31hvldzRATOQK7qoZqa1JWyks+Q+o8fkEKRfpMQl3mc5KQNtFYDOEw9W5tj/WiLbMNu428FcC1vRm0galNl+V2KURsxLbsaqGueWJhVlMORVZDrj3qQD5LRlBWZjZ8IqhnAxDnlU0RfKGataqBtXG8QcMlvgm4dbFZonWKeWclIfdwMsWOjiZtylheTB5EKkAmQBJERk2iWe5tNo9+wU9uNSINZjWJLaBZsfm7HbxBwX2+lbbZqNGZYXwhUMzp0wCiqn58hmdmUFJJ9kOuPVJC+kU6UTZhanv2n57p0MGJR411GZRhqQW0qbwRw5G/GbpFsCGmrY1Zba0y3B0G0/aSJnBuXhZNGkSCQ+Y/MkKySypWNmtWhGq5ozSxEoFdrYY1nmWsybqVvFXCMb/1tQWsIZ59gQ1awQFLHb6zroPeZZ5VtkqqQ8Y8zkHSR0pORlz2dI6auto0gik5lXFRkeGnabPBu82/6bwRv/WyuaaZk6VyHTy0nAbi9ppqdz5f7k4yRPZDvj5qQTpI3la6ZeaClq8jEuT6MVTRgw2YUa+Btfm8UcLJvTW7Ea85nzmFHWLpFMNH8rk+i25r+lc2S3pD+jxmQMJFfk+GWMZxxpCGzgPBFS8daU2PNaGtssG7cbwlwPG9hbUpqkmVcXkFS/zOEvKaov56OmHmU2JFgkOuPb5D4kayU3Jg2n3Opjb6LNztT5l7rZYVqhm1Pbw1w0W+Wbj5siGjpYhxa2UnY4uKx0aPOm5+WNZMYkQ+QBJD0kPWSPJY4m+KiE7CS1m1HA1k/Yhho9Wtqbr9vEnBsb75t3WpwZrVfrFQtPCbCwqr4n1qZAJUskomQ7I9KkKmRK5QYmAqedqepuQsto1B9XQVl7GklbRtvAHDrb9husGw2afJjyFtRTU8VOrV1pdKcS5elk1mRKJD2j72QkZKhlU6ac6Flra/KykITVxhhVmd1ax1um28VcJdvE25maz9n9WDWVjJCo8kcrUqhNJqQlYeSuJD0jyuQYZGyk1+X8ZynpaW1PRmwTfdbD2RKabxs327tb/9vFG8Zbdpp6WRSXVFQdSspuT+n6J0CmByUoJFGkO2PjZA2khCVc5keoAWr48L2PO9U2l+IZu1qyG1xbxNwu29ibudrAmgeYsxY8Ebf1MCvt6IcmymW6ZLtkAKQEpAfkUGTspbrm/+jP7Ic5kdKTloIY5xoS2yebtRvDHBKb3ttdGrRZb5e81KNNu29NqkTn8WYnZTvkWqQ649kkAAAnk6fXdBl5moHbq9vEHA2bwhtPmkuYyVZNURqxl2qx578l7mTMJEIkB2Qc5ExlLyY/p+irKjPiUjiWi9k32lqbWdvFXCJb7JtVWrrZCFcZkvR2pWu/6BZmZSUq5EykPuPAZFhk26X5Z3BqCbBKUCvV1piuWi3bAxvCHDIb0RuT2t4ZrRe0lCkINezh6PhmoqVO5JvkOyPpJCrkkSWCZx+pV24wTLlU0lgcGfra51u6G/0b8JuLWzbZ/VgJ1XRN8C6dKaXnJ2W4ZK/kO6PWZAMkjqVYpqzog+ywQ5GT/FdAWYEaxlutm8OcCpv8WwYafJivVgeQ8XE46mFntKXn5MikQSQI5CCkU2U6JhGoCytWtJmST9bZmQCan9tcW8VcH9vnW00arZkx1udSgXXAa60oCuZdpSakSuQ/o8OkXqTlpclnjOpjMJlQR5YmGLgaM9sGG8KcMFvM24xa0lmZl42UPoaHLMxo62aaZUokmaQ7Y+ukMGSaJZCnOClS7nxNGlUj2CcZwZsrG7tb+9vs24TbLFnsWCnVOs1w7kQpl2ceZbLkrOQ7Y9ikB6SWpWVmgijxLKuF+lPQF4yZiNrK26+bwxwHm/abPJotmJSWPhBP8NsqUOeqZeGkxWRAJAokJKRaZQVmZCgu61o1TpKm1ucZCRqlG17bxVwdm+JbRJqgGRsW8xJw9NxrWmg/ZhalIqRJpACkByRk5O/l2WeqakGxJJCiljVYgZp5mwkbw1wum8hbhNrGGYXXpRPdBNlstyieppJlRWSXZDuj7mQ1pKMlnycRKZGuus26lTUYMdnIWy7bvJv62+kbvhrhWdrYCVU0zPOuK2lJJxVlrWSqZDsj2qQMZJ6lciaXqN8sxoeiFCPXmFmQWs8bsRvCXASb8JszGh4YuVXxEDPwfioA56Cl22TB5H8jy+Qo5GGlEOZ26BOruzYB0v1W9JkRWqobYRvFXBsb3Vt8GlKZA5b9Ejo0OSsIKDRmD6UepEgkAaQKZGtk+eXp54hqp3FsEPzWBFjK2n9bDBvD3Cybw9u9GroZcZd8E45CLWxiaJImiqVApJVkO+PxJDtkrCWtpyppkm7wjhoVRlh8Wc6bMlu9m/mb5Vu3WtaZyRgn1OHMeW3TKXsmzKWoJKekOuPc5BFkpuV/Jq1ozy0HyMiUdxekWZea01uy28GcAVvqmylaDpidVd7P3bAhqjEnVqXVZP6kPqPNZC0kaOUcpknoeSuE93NS09cBmVmarxtjW8VcGJvX23NaRJksFoTSF7OXKzZn6WYIpRrkRqQCpA4kcaTEZjqnp2qTsfBRFpZTWNRaRRtPG8RcKpv/W3VarZldF1FTkj3CrE3oheaCpXwkU2Q8Y/QkAST1pbxnBGnWrx2OuNVW2EaaFVs1277b+BvhW7Bay1n3V8XU/ouA7fupLWbD5aLkpSQ6498kFmSvJUxmw6kALU+J7hRKF+/ZnxrXm7RbwNw+G6SbH1o+mEEVyI+Mb8XqIadM5c9k+2Q9488kMWRwZSgmXShfq8k4otMplw6ZYdqz22WbxRwV29Kbapp2mNPWihHGczWq5KfeZgHlFuRFZAOkEaR4ZM7mC6fG6smycZFwFmHY3VpKm1HbxJwom/rbbZqhGUhXZNNPexksOah5pnslN6RRpDzj9yQG5P7li2deqd4vQg8W1adYUNobmzlbv5v2m91bqVrAGeUX4lSGywrtpGkfpvtlXaSipDrj4aQbZLelWabaaTOtb0qSlJzX+xmmGtubthvAHDrbnlsVWi6YY9WtDz9vaqnSJ0MlyWT4ZD0j0OQ1pHelNCZw6EdsKXoRE37XG5lp2ribZ9vE3BMbzRthWmhY+xZNEYEylSrTJ9OmOyTTJEQkBOQVZH7k2aYdJ+cqyfLvUYkWsFjmWlAbVJvE3Cab9htlmpRZcxc3kzN5MSvl6G2mc2UzJE/kPaP6JAykyKXap3mp6a+hD3RVt5hbGiHbPJuAnDUb2VuiGvTZkpf+VHUKFq1NqRIm8uVYpKBkOuPkJCBkgCWnJvFpKK2vy3ZUr1fGme1a35u3m/8b91uYGwsaHhhGFYqO9i8P6cLneaWDpPVkPKPSpDokf2UAZoSosGwuvH3TU9doGXHavVtp28ScEFvHm1haWdjiFk1RRvI1KoInySY0pM+kQyQGJBkkRaUkZi5nyCsWM2tR4Va+WO9aVZtXW8UcJFvxG11ah5ldVwiTDDfJ69JoYaZsJS7kTiQ+I/1kEqTSZeonVWo5r/mPkNXHmKTaKBs/24FcM5vVW5ra6Vm/l5lUQolk7TcoxObqZVOkneQ64+akJeSIpbTmyKlgbduMGNTBWBGZ9Brjm7jb/hvz25GbANoNmGfVYc5wbvXptCcwZb3ksmQ8I9SkPqRHJUymmSiaLG1AKROo13SZedqCG6vbxBwNm8HbTxpLGMiWSlEW8ZYqsWe+pe4kzCRCJAdkHORMpS9mAGgp6y/z5FI5VoxZOBpa21nbxVwiG+xbVRq6WQeXF9LrNqPrv2gWJmSlKqRMZD7jwGRYpNwl+edxag1wTRAs1dcYrpouGwNbwhwx29Ebk5rdmaxXsxQdyDQs4Sj35qIlTqSbpDsj6SQrJJFlgucgqVmuNYy61NMYHJn7Gudbulv9G/Bbixs2WfzYCNVwTe3unCmlZycluCSvpDuj1qQDJI7lWSat6IXsiEPTE/zXQNmBWsabrZvDnAqb/BsF2nwYrhYFEO3xN+pgp7Rl56TIpEEkCOQg5FOlOqYSaAzrXTSbUlCW2hkA2qAbXFvFXB/b51tM2q0ZMRblUrm1vutsaAqmXaUmpErkP+PDpF7k5eXJ545qZnCcEEiWJpi4WjQbBlvC3DAbzJuMGtHZmNeMFDAGhSzLqOrmmiVJ5JlkO2Pr5DBkmmWRJzkpVS5AzVvVJJgnWcHbKxu7W/vb7JuEmyuZ65go1TUNbi5DKZbnHiWypKzkO2PYpAfkluVlpoLo8qy8BfwT0NeM2Ykaytuvm8LcB5v2WzxaLNiTljuQTLDaKlBnqiXhZMUkQCQKZCTkWqUF5mToMCthdVBSp5bnmQlapVte28VcHVviG0Ran5kaFvESajTa61noPyYWZSKkSWQApAckZSTwJdonq6pF8ScQo5Y2GIIaedsJW8NcLpvIW4SaxdmFF6PTxATX7LZoniaSJUUkl2Q7o+5kNeSjpZ9nEemT7oBN+9U12DIZyFsu27yb+pvpG73a4RnaWAgVMAzxrippSKcVJa0kqiQ7I9rkDKSe5XKmmGjg7NMHo5Qkl5jZkJrPW7FbwlwEW/BbMpodmLhV7ZAwsH0qAGegJdskweR/I8vkKORh5RFmd6gU64O2Q5L+VvUZEdqqW2FbxVwa290be5pR2QLW+xI0NDfrB6gz5g9lHmRH5AGkCqRrZPpl6qeJqqrxbpD91gUYy1p/mwxbw9wsm8PbvNq5mXDXehOlgevsYWiRpoolQGSVZDvj8WQ7pKylricraZUu9I4bVUbYfJnPGzKbvdv5W+UbttrWGciYJpTcjHbt0ml6psxlp+SnpDrj3OQRpKclf2auKNDtEcjJ1HfXpJmYGtObstvBnAFb6lso2g3YnFXbz9rwIKowp1Yl1ST+pD6jzWQtJGklHOZKqHprjzd1EtSXAhlaGq8bY5vFXBhb19ty2kQZKxaC0hJzlas1p+jmCGUapEakAqQOJHHkxOY7Z6iqmLHykReWU5jUmkVbT1vEXCqb/1t1Gq0ZXFdPU6s9gSxM6IUmgmV75FNkPGP0JAFk9eW85wVp2a8hDrnVV5hHGhVbNhu+2/gb4VuwGssZ9pfElPiLvu266Symw6WipKUkOuPfZBZkr2VMpsRpAm1Xye+UStfwGZ8a19u0m8DcPhukWx7aPhhAFcVPia/E6iDnTKXPJPtkPePPJDFkcGUo5l3oYWvV+KTTKlcPGWJatBtl28UcFdvSW2oadhjTFofRwHM0KuQn3eYBpRbkRWQDpBGkeKTPZgxnx+rN8nPRcRZiWN3aSttSG8ScKJv6m21aoJlHl2NTdzrXrDjoeSZ65TdkUaQ84/ckBuT/ZYvnX6nhb0WPGBWn2FEaG9s5W7/b9pvdW6ka/9mkV+EUgAsI7aNpHyb65V1koqQ64+GkG6S35Vom2yk17XZKk9Sdl/uZplrb27YbwBw6m54bFRot2GLVqM88L2mp0adC5ckk+GQ9I9DkNeR4JTSmcahI7Do6EtN/1xvZalq422fbxNwTG8zbYRpnmPoWSxG8slOq0qfTJjrk0yREJATkFWR/JNomHafoas5y8hGKFrCY5tpQW1TbxRwmW/XbZRqT2XIXNdMh+S9r5ShtJnMlMyRPpD2j+mQM5Mjl22d66ezvpE91VbhYW1oiGzzbgJw1G9kbodr0mZHX/RRtChTtTKkRpvJlWGSgJDrj5CQgpIBlp6byKSstt8t3lLAXxtntWt/bt5v/G/dbl9sK2h2YRRWGzvMvDunCZ3llg2T1ZDyj0qQ6JH+lAOaFqLHsB7y/U1SXaJlyGr2badvEnBBbx1tYGlkY4RZK0UKyNCqBp8imNGTPZEMkBiQZJEXlJOYvJ8lrG3NtUeJWvtjvmlXbV1vFHCRb8RtdGobZXJcGkz53iKvRqGFma6Uu5E4kPiP9ZBLk0qXq51ZqPG/8j5HVyBilWigbABvBXDOb1RuamujZvteX1HcJIq02KMRm6iVTZJ3kOuPmpCXkiSW1psmpYm3ijBpUwhgSGfRa49u5G/4b89uRWwBaDRhmlV0Obi706bOnL+W9pLJkPCPUpD6kR2VNJpnonCxZAGqTqZd1GXoaghur28QcDVvB207aSpjHlkgREjGU6rCnviXt5MvkQeQHpB0kTOUv5gEoKys3M+ZSOlaM2TiaWxtaG8VcIhvsG1TaudkGlxYS3/aiq76oFaZkpSqkTGQ+48CkWOTcZfpncmoQcE/QLhXX2K8aLlsDW8IcMdvQ25Na3Rmrl7HUD4gybOBo92ah5U5km6Q7I+kkKySR5YOnIalbrjvMvBTTmBzZ+1rnm7pb/RvwG4rbNhn8GAdVbA3rrpsppOcm5bfkr6Q7o9akA2SPZVmmrqiHrKAD1JP9l0EZgdrGm63bw5wKW/wbBVp7mK0WAdDqcTZqYCez5eekyGRA5AjkIORT5TrmEygOK2U0ndJRltqZARqgW1ybxVwfm+cbTFqsmTAW45KwNb2ra6gJ5l0lJmRK5D/jw+RfJOZlymePampwn5BJlidYuNo0GwZbwtwwG8ybi9rRWZgXitQeBoNsyqjqZpnlSaSZZDtj6+QwpJqlkac6KVfuRY1dFSVYJ9nCGytbu5v72+ybhBsrWerYJ5UwjWvuQmmWZx2lsmSs5Dtj2OQIJJclZmaDqPRsjEY9k9HXjVmJWssbr5vC3Adb9hs72ixYkpY4EEhw2OpP56ml4STE5EAkCmQlJFrlBmZlaDGranVSkqiW6BkJmqVbXtvFXB1b4dtD2p8ZGVbvUmH02atZKD6mFiUiZElkAKQHZGVk8KXap6zqSTEqUKSWNpiCWnobCZvDXC5byBuEWsVZhFeiU+/Eliy1aJ3mkeVE5JdkO6PupDYko+WgJxLpli6ETfzVNpgymcibLxu8m/qb6Nu9muCZ2ZgG1SnM724pqUgnFOWtJKokOyPa5AzknyVy5pko4uzfR6TUJVeZWZDaz1uxW8JcBFvwWzJaHNi3VeqQLbB76j+nX+Xa5MGkfyPL5CkkYiUR5ngoFiuOdkXS/xb1mRIaqlthW8VcGtvc23taUVkB1vkSLnQ2qwboM2YPJR5kR+QBpAqka6T65esniuqvsXGQ/tYFmMuaf9sMW8PcLJvDm7yauRlwF3iThAHqbGCokSaJ5UBklWQ8I/FkO6Ss5a6nLGmXrvlOHJVHWH0Zz1sym73b+VvlG7ba1ZnH2CVU1cx07dFpeibL5aekp2Q6490kEaSnZUAm7yjSrRvIy5R4l6UZmBrTm7MbwZwBG+pbKJoNWJtV2M/XMB+qL+dV5dTk/mQ+Y81kLWRpZR1mS2h765v3dtLVVwKZWlqvW2ObxVwYW9ebcppDmSpWgFIM85RrNOfoZgglGmRGpAKkDmRyZMUmO+epqpyx9ZEYllRY1NpFm09bxFwqm/8bdNqs2VuXTdOM/b+sDCiE5oIle6RTZDxj9GQBZPYlvacGadwvJM67FVgYR1oVmzYbvtv4G+Ebr9rKmfYXwtTyS7ztueksZsMlomSk5Drj32QWpK+lTWbFaQQtYEnxFEuX8JmfmtfbtJvA3D3bpBsemj2YfpWBj4Yvw+ogZ0wlzuT7ZD2jzyQxpHDlKSZeqGKr5fimkysXD5limrRbZdvFHBWb0htp2nVY0haF0fuy8yrjZ92mAWUWpEVkA6QR5Hjkz+YM58kq0zJ10XIWYtjeGksbUhvEnChb+lts2qAZRpdhk2Q61mw4KHimemU3JFFkPOP3ZAck/6WMp2Cp5C9JzxkVqJhRmhwbOZu/2/ab3Ruo2v9Zo5ff1LkKxy2iqR6m+qVdZKJkOuPhpBvkuCVaptwpN619ipWUnlf8Gaba3Bu2G8AcOpud2xSaLVhh1aWPOa9oqdEnQmXI5PgkPSPRJDXkeGU1JnJoSmwPelRTQJdcWWqauRtn28TcEtvM22DaZxj5VkhRtzJSatHn0uY6pNLkRCQE5BWkf2TaZh4n6WrUcvQRitaxWOcaUJtU28UcJlv1m2Tak1lxVzQTE/kt6+RobKZy5TLkT6Q9o/pkDSTJZdvne+nvr6ePdlW42FvaIls824CcNRvZG6Ga89mRF/uUZUoTLUvpESbyJVgkoCQ64+QkIOSApagm8yks7b4LeNSwl8dZ7drgG7eb/xv3G5ebClodGEPVg07wrw3pwed5JYMk9SQ8o9LkOmR/5QEmhmizbCd8gNOVl2kZcpq9m2nbxJwQG8cbV5pYmOAWSJF9sfLqgOfIJjQkz2RDJAYkGWRGJSUmL6fKqyBzb1HjVr9Y8BpWG1ebxRwkW/DbXNqGmVvXBNMzd4cr0OhgpmulLqROJD4j/aQTJNMl62dXaj9vwE/TFciYpZooWwBbwVwzW9TbmlroWb4XlpRtiSDtNWjD5unlUySdpDrj5qQmJIlltebKqWQt6EwblMKYEpn0muPbuRv+G/ObkRsAGgxYZZVZTmsu8+my5y+lvWSyZDwj1KQ+5EelTaaaqJ2sTkCsk6oXdZl6WoJbq9vEHA1bwZtOWknYxpZFkQ5xk6qwJ73l7aTL5EHkB6QdZE0lMGYBqCxrPLPo0jsWjVk42ltbWhvFXCIb69tUmrlZBdcT0tb2oWu96BUmZCUqZExkPuPApFkk3OX7J3OqFDBTkC9V2JivWi6bA1vCHDHb0JuTGtzZqtewVARIMGzfaPbmoaVOZJukOyPpZCtkkiWD5yJpXi4AzP1U1Fgdmfua59u6W/0b8BuKmzWZ+1gGFWbN6K6aaaRnJqW35K9kO6PW5AOkj2VaJq9oiSy9A9YT/ldB2YIaxtut28OcClv72wUaetisFj9QpfE1al+ns6XnJMhkQOQI5CEkVCU7ZhPoD2trtJ+SUpbbGQFaoFtcm8VcH5vm20warBkvVuFSqHW8a2roCaZc5SYkSuQ/48QkX2Tm5csnkGptsKIQSpYn2LkaNJsGm8LcMBvMW4ua0NmXl4jUD0aB7Mno6eaZpUlkmWQ7Y+vkMOSbJZInOylZ7ktNXhUmGChZwlsrW7ub+9vsW4QbKtnqWCZVLA1prkFplecdZbJkrKQ7Y9jkCCSXpWamhKj17KBGPtPSl43ZiZrLW6+bwtwHW/XbO5or2JGWNZBFMNeqTyepZeDkxORAJApkJSRbJQamZigzK3H1VJKpVuiZChqlm18bxVwdG+HbQ5qemRhW7NJbNNhrWGg+ZhXlIiRJZACkB2RlpPDl22et6kyxLNClljcYgpp6Wwmbw1wuW8fbhBrE2YOXoNPbRJQstKidJpGlRKSXJDuj7qQ2ZKQloKcT6ZjuiI3+VTcYMtnJGy8bvJv6m+ibvVrgGdjYBZUlDOzuKKlHpxRlrOSp5Dsj2uQNJJ+lc6aaKOSs7oemlCYXmdmRGs+bsVvCXARb79sx2hxYthXn0Cmweuo/J19l2qTBpH8jy+QpZGJlEiZ46BfrlvZHksAXNhkSWqqbYVvFXBqb3Jt7GlDZANb2kib0NSsGaDMmDuUeJEfkAaQK5Gwk+yXr54wqs3F0EP/WBhjMGkAbTJvD3Cxbw1u8WriZb1d3E6HBqGxf6JCmiaVAJJUkPCPxpDvkrWWvZy1pme79Th2VSBh9Wc9bMtu92/lb5Nu2WtVZx1gkVNBMcu3QqXmmy6WnZKdkOuPdJBHkp+VApu/o1G0oCM0UeVelWZia09uzG8GcARvp2ygaDNiaVdVP1DAeai9nVWXUpP5kPmPNpC2kaaUd5kwofWumN3jS1lcDGVqar5tjm8VcGFvXW3JaQxkpVr5RxnOTKzRn6CYH5RpkRqQCpA5kcmTFpjynquqgcffRGZZU2NVaRZtPW8RcKlv+23SarBla10xTrz197AtohGaB5XukU2Q8Y/RkAaT2pb4nB2nerylOvBVY2EfaFhs2W77b+Bvg26+ayln1V8GU6su67bkpK6bC5aIkpOQ6499kFuSwJU2mxikGLWqJ8lRMV/EZn9rYG7SbwNw926PbHho82H2Vvk9Db8KqH+dL5c6k+yQ9o89kMeRxJSmmX2hkK/L4qBMsFxAZYtq0W2XbxRwVm9IbaVp02NDWg5H2svHq4qfdJgElFqRFZAPkEiR5JNAmDafKqteyeNFy1mOY3ppLW1IbxJwoW/pbbJqfmUXXYBNRetTsN2h4JnolNyRRZDzj92QHpMAlzSdh6eavTQ8aFalYUdocWznbv9v2m9zbqFr/GaLX3pSwisStoakeJvplXSSiZDrj4eQb5LhlWybc6TmtRorW1J8X/Jmm2twbthvAHDpbnZsUWizYYJWiDzbvZ6nQZ0IlyKT4JD0j0SQ2JHilNaZzKEwsILpWU0FXXNlq2rlbaBvE3BLbzJtgWmaY+FZGEbKyUWrRZ9JmOmTS5EQkBOQVpH/k2uYe5+qq2PL2UYvWsdjnmlDbVRvFHCZb9ZtkmpLZcJcyEwY5LKvjaGwmcqUypE+kPaP6ZA1kyaXcZ3zp8m+rT3eVuVhcGiKbPRuAnDUb2NuhWvOZkFf6VFtKEO1K6RCm8eVX5J/kOuPkZCEkgSWopvPpLu2Fy7oUsVfH2e4a4Bu3m/8b9xuXWwoaHFhC1b7Ori8M6cFneKWC5PUkPKPS5DqkQCVB5ocotOwBfMLTlldpmXLavdtqG8RcEBvG21daWBjfFkXRebHxqoAnx+Yz5M8kQuQGZBmkRmUlpjBny+sm83IR5BaAGTBaVltXm8UcJBvwm1xahdla1wMTKHeFq9AoYGZrJS5kTeQ+I/2kE2TTZevnWGoC8ANP1BXJWKYaKJsAW8FcM1vU25oa6Bm9V5UUYckfLTSow2bppVMknaQ64+bkJmSJpbamy6lmre3MHNTDWBLZ9RrkG7kb/hvzm5DbP5nLmGRVVU5orvLpsmcvZb0ksiQ8I9TkPyRH5U4mm2ifLHeArhOq13XZepqCm6wbxBwNG8FbThpJWMVWQpEJsZKqr2e9Ze1ky6RB5AekHWRNZTCmAmgt6wP0KtI8Fo3ZORpbW1obxVwh2+vbVBq42QTXEhLN9p+rvSgUpmPlKiRMZD8jwORZZN0l++d0qhdwVlAwVdkYr9oumwObwhwx29CbkprcWapXrxQ1x+6s3qj2ZqFlTiSbZDsj6WQrpJKlhKcjaWBuBcz+VNUYHdn72ufbulv82+/bils1GfrYBRVizeZumWmjpyYlt6SvZDuj1uQDpI/lWqawKIqsk8QX0/9XQhmCWscbrdvDnApb+5sEmnpYqxY80KJxNGpe57Ml5uTIJEDkCOQhZFRlO+YUaBCrcjShklNW25kB2qCbXNvFXB+b5ttL2quZLlbfkqC1uqtqKAkmXKUmJErkP+PEJF+k5yXL55GqcPCk0EvWKFi5WjSbBpvC3DAbzFuLWtBZlteHlDzGQCzJKOlmmSVJZJkkO2PsJDEkm2WSpzwpXC5PzV9VJpgomcKbK5u7m/vb7FuD2yqZ6Zgk1SaNZu5AKZVnHSWyJKykO2PY5Ahkl6VnJoVo9+ywBgBUE1eOWYoay1uv28LcB1v12zsaKxiQljJQQTDWqk6nqOXgpMTkf+PKZCVkW2UHJmboNGt5NVZSqlbpGQpapdtfG8VcHRvhm0NanhkXlusSVHTXK1eoPeYVpSIkSSQA5AekZeTxZdvnrypRMS9QppY32IMaepsJm8NcLhvH24OaxFmC157TwQSSrLPonOaRJUSklyQ7o+7kNqSkZaEnFOmbLo3N/5U32DNZyRsvW7zb+pvom70a39nYWASVIAzqriepRycUJaykqeQ7I9skDWSf5XPmmujmLPrHqBQm15oZkVrPm7FbwlwEG+/bMZob2LUV5FAmsHnqPqde5dqkwWR/I8wkKWRipRKmeagZK5+2SVLA1zaZEpqq22GbxVwam9xbeppQWQAW9JIhNDPrBagypg6lHiRH5AGkCyRsJPul7KeNKrbxdlDBFkbYzFpAW0ybw9wsW8Nbu9q4GW6XdZO1wWbsXyiQZollf+RVJDwj8aQAAAmUQlg9WejbDNvFXBpbxdtvmhfYepTHCcGsmuh4pjbkwuR8o9okH6Sh5ZknaWpHctDSgFdOGada69u/2+/b+VtJ2rCY4tYcT0xurikv5r2lJ+RFpAikMKRN5Usm32lXLw9QGRZN2RsagtuzW/3b5BuYGvSZU5cgUgnx7Oo55w9llOSV5D4jyeRE5RAmQ+igbPlLfhU52ENaUVtfW8TcBpvb2ydZ3Ff4U/P56itZp+1lyyTtpDrj62QGJOUly2fM6194ltPM196Z1psEG8RcIVvV20saRtiX1UZMB20UqJmmSmUM5H6j1GQQ5IglracWKjBxcZHBVyqZUhrg27zb9JvGm6HamRkt1lCQUW9zKVYm1CV0JEmkBKQkZHdlJaabKRluTs8M1iTYwtq1W25bwJwu260a19mRl3sSuPMB6qXnaWWj5JwkPGPAZHGk72YLKF4sccjelMoYZ1oBG1hbxVwPG+3bBdoQ2ChUawMWa8zoC6YcpPXkOyPj5DWkiOXa56qq/PVZk1UXvlmD2zqbgtwn2+TbZZpzmK9Vok2a7ZFo/CZe5RdkQSQPJAMkr2VD5wfp2nB+UT7WhZl8WpUbuVv429MbuNq/2TSWoZE1cDxpvebr5UEkjmQBpBkkYeUBZpqo8m2XTfvVuhipmmcbaJvCnDkbgNs5WYyXhlNktRxq0+eEpfNkoqQ7Y/ckHyTQJhToJ2vWRHhUWJgKWjBbEFvFXBcb/tsjGgLYUBTyiEusQuhqpi7k/uQ8I9zkJiStZaynTuq5M1BS2tdc2bAa8JuBHC2b81t/Gl7YwNYjzv8uEWkgJrQlIqREJApkNiRXpVvm/elxr3GQeJZfGSVaiJu1W/yb3xuO2uUZd5bYEcMxSionJwRljuSTZD7jzmRNZR6mXWicrQwMZVVNmI8aWBtiW8QcApvUGxnZxNfFE8p4PasD5+Dlw6TqJDrj7qQNpPHl4Sf5q0y6yZQkV+wZ3psH28TcHlvO239aMthwFShLDCz7aEsmQeUIZH2j1uQXJJNlgCd5ajqx+JIdFzoZW1rlm75b8pvA25eah9kN1mwP+O7U6UVmymVupEfkBmQppEEldaa4KSiugw+uVjbYzZq7W3Cb/1vqG6QayNm3FzoSTnKcqlJnXiWdZJlkPOPEZHnk/aYjaFTsrQoJFR8Yc5oIW1tbxRwLm+YbONn6V/kUIz4ma7Zn/mXU5PIkOuPm5DzklOXvp5RrJraRU63XjJnMGz7bg5wlG95bWlpgWIoVvozY7XaorOZV5RLkf+PRJAkkuiVVpyjpzLDO0ZwW1dlF2tobuxv3G83brxqvWRZWipDN79wprGbhpXtkTCQC5B3kayUQ5rYo+G3mjl9VzNj0mm1baxvB3DTbuFrrGbNXS5M7tDSqv6d45aykn+Q7o/skJyTdpivoGawJBuWUrlgXGjfbE9vFXBOb95sWmi2YJBS3RpesKygdJibk+uQ7o9/kLKS5JYBntiqDNE3TNFdrmbja9NuB3Csb7Rt0WkxY3lXhznXt9WjQZqrlHaRCpAxkO6Rh5Wzm3WmSL83Q15av2S9ajhu3G/rb2duFmtVZWxbMEYhw5+nVJzmlSOSRJAAkEuRWJS2md6ibLUSNC1WhGJqaXptlG8OcPpuL2wvZ7NePU5k2kusu55Sl/KSm5Drj8mQVJP7l9yfoK40+etQ7F/lZ5lsLm8UcG1vIG3MaHhhHlSNKEuyiqHzmOaTEJHzj2WQdpJ6lkydd6lQyvFJ4FwlZpFrqW7+b8Jv7G00athjtFj8PZe63aTTmgKVpZEZkB+Qu5ErlRibV6Xvu74/PFkhZGBqBG7Kb/lvlW5sa+Zlb1zYSNbH36j9nEuWW5JbkPePIpEIlC6Z8aE4s8MsxlTNYf5oPW16bxNwHm95bK5njV8fUMPq4K2An8aXNZO6kOuPqZAPk4WXEp/8rGPgG08WX2lnUGwLbxFwiW9fbTtpM2KPVRUxabRyoniZNJQ4kfuPTpA8khOWn5wtqB7Fa0fjW5ZlPWt9bvJv1W8hbpRqeWTeWblBt73ypW2bXZXXkSiQEZCLkdGUgppJpAe5oTsIWH1j/mnNbbZvA3DBbr5rcWZnXThLys03qq+dtJaXknOQ8I/7kLyTrJgOoTax/yFGUw5hjmj8bFxvFXBBb8BsJ2heYNpR7BCWr1CgPph7k9yQ7Y+LkM6SFJdSnnertdQhTTVe52YEbOVuC3Cib5ttpGnmYulWSDe/tmejA5qGlGORBZA5kAWSsZX5m/am5MCSRNdaAWXlak1u42/lb1Nu72oTZfda7URawRqnDJy8lQuSO5AEkF6RfJTymUmjdLaiNsFW0WKYaZRtn28LcOluDmz3ZlFeXk3O1aSraJ4hl9aSj5Dsj9eQcpMvmDagYK8vDahRRmAZaLhsPW8VcGBvBG2caCVhdVOWI3CxKKG8mMWTAJHxj3CQkJKnlpmdDKr9zPVKSl1hZrVrvG4CcLhv1G0KapFjLlgqPFq5aaSTmtyUkJESkCeQ0ZFSlVqb0aVSvVBBu1lnZIlqG27Tb/Nvgm5Ha6dlAVy7R6/FU6iznB+WQpJQkPqPM5ErlGiZVqIltDYwZVUdYi5pWG2FbxFwD29ZbHhnMF9UTz7iLK0qn5KXF5OskOuPtpAtk7iXaJ+urSDo6U90X59ncGwabxNwfW9EbQtp42HyVMUtd7MMoj6ZEpQnkfePWJBUkj+W6Zy5qDrHi0hSXNVlYmuQbvdvzW8KbmtqNWRfWS5ATrx4pSqbNZXBkSGQF5CgkfiUwpq8pD+6gT2QWMVjKWrlbb9v/2+ubptrNmb9XDpKBsufqWGdhpZ9kmiQ848MkdyT5JhvoQ6yRifwU2Jhv2gYbWlvFHAyb6Js82cFYB9RH//TrvWfCZhck82Q64+XkOqSRJeknhysDtkCTpheIGcmbPVuDnCXb4Ftd2mZYlZWyzS0tfuixplilFCRAZBCkByS25VAnHqnn8LaRUxbQ2ULa2Ju6m/ebz5uyGrSZH9al0O1v5imx5uSlfSRM5AJkHGRoZQwmrajibftOFFXHGPEaa1tqW8IcNhu7Gu+Zu1dd0z80QKrF57xlrqSgpDuj+eQkpNlmJKgJrCBGF9SnmBMaNZsS28VcFNv52xqaNBgx1I1HZ6wyaCEmKST8JDvj3uQqpLWluidpqoE0OxLsl2cZthrzm4GcK9vvG3eaUhjpFcsOjC496NUmraUfZEMkC6Q55F7lZ6bTabMvshCOFqrZLFqMW7ab+5vbm4ha2hlkFuQRrTDyKdqnPSVKpJHkP6PRpFOlKOZvqIdtTYz/1VsYlxpcm2Rbw9w/245bEFn0V6BTgjcgKzVnmGX+pKfkOuPxJBLk+uXwJ9mrtvzrlDQX9RnkGwqbxRwcW8obdxokmFQVOApkrKooQWZ8JMWkfSPYpBukmuWNJ1JqY3Jn0m/XBJmh2ukbvxvxG/zbUFq7mPeWIg+/LoBpeiaDpWskRqQHZC0kR6VA5sypYa7Oj8UWQxkU2r9bchv+m+cbndr+WWSXC5JjsgNqRWdWZZjkl2Q9o8dkf6THZnRofCykSuVVLRh8Gg0bXZvE3Ajb4NsvmeqX1xQO+4Yrpyf1Zc+k76Q64+lkAaTdpf4nsasa97ZTvleWGdHbAZvEHCMb2dtSWlMYr9VAjK0tJKii5k/lD6R/I9LkDSSBZaJnAKogsQOR79bg2Uxa3Zu8G/XbyhuoGqOZARaLUItvhmmgptpld2RK5APkIWRxpRumiakqrgGO95XZmPwacZts28FcMZuyWuEZoddhku0zmaqx53Clp+Sd5Dwj/aQspObmPGg9LAcIBBT82B+aPNsWG8VcEVvyWw3aHpgE1JwFNOvbKBOmIWT4JDtj4eQxZIFlzmeRquA09lMF17WZvpr324KcKVvo22yaf1iFlf+NxS3iKMWmpKUaZEHkDaQ/pGkleObzaZfwClEslrtZNlqR27hb+dvWW77aihlHFtSReHBQ6cinMmVEpI+kAOQWJFxlN+ZKKMhtt01lFa5YoppjG2cbw1w724YbAlnb16lTSXX2KuCnjCX3pKSkOyP05Bpkx+YGqAjrxkIblEqYAlormw4bxVwZG8MbatoP2GpUzgltLFGocyYz5MFkfKPbZCHkpmWgZ3eqSPMpkopXU9mqmu2bgFwu2/cbRdqp2NYWL48urmLpKea6JSXkRSQJJDKkUaVRpurpeK810CVWVFkfGoUbtBv9W+IblJru2UjXBVIU8Z+qMqcLJZKklSQ+Y8ukSCUVpk2otqzNS80VQViH2lPbYJvEnAUb2NsiWdNX5NPleRjrUWfopcgk7CQ64+ykCOTp5dOn3eta+WpT1hfjmdnbBZvEnCBb0xtGmn8YSRV1i7BsyyiUJkclCyR+I9UkE2SMZbSnI2ojMYzSC9cwmVWa4pu9m/PbxFud2pKZIZZqkC9vJ2lP5tBlciRI5AVkJmR7JSumpmk27nyPGZYr2Mbat5tvG8AcLRupmtIZh5dikrWy82peZ2UloWSa5DyjweR0pPTmFChy7HJJbtTSGGwaBBtZW8VcDdvq2wDaCFgWlEeBg6vEaAZmGWT0ZDsj5SQ4ZI1l4qe6Kub17xNel4PZxts8G4NcJtviW2FabFihFaaNQW2HKPZmW2UVpECkD+QFZLOlSqcUacTwnRFKFsvZQBrW27ob+BvRG7UauZkpFoFRDPAwKbcm5+V+5E1kAiQa5GVlByalKMytz84JVcFY7dppm2mbwlw3m72a89mDF7ATBzTNKswngCXw5KGkO2P4pCIk1SYdqDor5gVJ1KDYDxozGxHbxVwV2/wbHlo6mD9UmIf3bDmoJWYrpP1kO+PeJCikseW0J13qgzPoEuSXYpmzWvIbgVwsm/EbexpX2PPV9A6i7gapGeawpSDkQ6QLJDgkW6ViZsnplW+VkIRWpVkpGoqbthv7290bi1rfGWzW+5GSsTzp4GcAZYxkkqQ/Y9AkUOUkZmeotC0VTLPVVRiTmlqbY1vEHAEb0NsUmfuXsJOzN20rO+ecJcDk6OQ64/AkEGT25elnyyumu9yULRfxGeGbCVvFHB0bzFt6mirYYNUKCvXssehFpn6kxuR9Y9fkGaSXpYdnRypzchLSZ1cAGZ7a51u+2/Hb/ptTmoFZAVZDT9iuyal/JoalbKRHJAbkK6REpXvmg2lH7u2PutY9mNGavZtxW/8b6Fug2sMZrNcgklIyTqpLJ1nlmuSYZD1jxiR85MLmbKhqrJXKmJUm2HhaCxtcm8UcChvjGzPZ8ZfmVBR8lKut5/ll0eTw5Drj6GQ/pJml96ekayb3JhO215HZz1sAW8PcJBvb21XaWRi7lXqMgK1sqKdmUqURJH+j0iQLZL4lXKc16fnw7BGnFtvZSVrcG7ub9lvL26saqRkKlqhQqO+QKaXm3aV5JEtkA2Qf5G6lFuaA6RPuGc6sldQY+Npvm2wbwZwzG7Ua5Vmpl3SS67PlargndGWp5J6kO+P8pCok4qY06C0sAEe2lLZYG9o6mxUbxVwSW/SbEdolGBLUo0XELCJoF+YjpPlkO2PhJC9kvaWH54Uq2HSkUz4XcRm8GvabglwqG+rbcBpFGNCV7I4a7eroymanZRvkQmQNJD2kZeVzpumpuC/v0OMWtlkzGpAbt9v6W9gbgdrPGVAW7ZFb8Jrpzmc1pUakkGQAZBSkWaUzZkGo8+1FjVmVqFifGmEbZhvDXD0biJsGmeOXupNiNgKrJueP5fnkpaQ7I/OkF+TDpj+n+iuugE0UQ9g+WelbDRvFXBobxVtumhZYd5Txyb2sWSh3pjZkwqR8o9pkH+Si5Zqna+pTMtVSgldPGafa7BuAHC+b+NtJGq9Y4JYUT0buq+ku5r0lJ2RFpAikMOROZUxm4aldbxZQG1ZPGRvag1uzW/3b45uXmvOZUZcbkgAx6qo4Zw6llKSV5D4jyiRFZREmReikrMkLgRV7GERaUdtfm8ScBlvbWyZZ2pf008w55utX5+ylymTtZDrj66QGpOYlzOfP60M42pPOl99Z11sEW8ScIRvVW0paRViVFXgLwy0S6JimSeUMpH6j1GQRZIklrucYajmxdpHDVyuZUtrhG70b9FvGG6Eal9krlknQSy9xKVTm06VzpEmkBOQk5HglJqadaR7uV08PFiZYw5q1226bwJwum6xa1tmP13aSrHM/KmRnaKWjZJvkPGPApHIk8GYM6GHsSgkh1MuYaFoB21hbxVwO2+0bBRoPWCUUZwLS68toCmYb5PWkOyPkJDYkiaXcZ62q0bWdk1bXv1mEWzrbgxwnm+RbZNpyWKyVl02WLY9o+uZeJRckQSQPJAOksCVFJwnp4fBEEUDWxtl9GpVbuZv4m9LbuBq+mTJWm5Et8DopvKbrJUCkjiQBpBlkYqUCZpyo9y2hzf4Vu5iqWmebaNvCnDjbgFs4mYrXghNRdRlq0meD5fLkoqQ7Y/dkH+TRJhZoKuvLhLuUWdgLWjDbEJvFXBbb/lsiWgFYTNTXyEfsQShppi4k/qQ8I90kJqSuZa3nUaqGc5VS3JdeGbCa8NuBHC1b8tt+Wl1Y/lXbDvnuD2ke5rNlImREJApkNmRYZV0mwCm4L3gQetZgWSYaiNu1W/xb3puOWuQZdZbS0foxB2ol5wOljmSTZD8jzqROJR/mX2ig7RnMaBVPGJAaWJtim8QcAlvTWxjZwxfBU+r3+msCZ+AlwyTp5Drj7yQOJPLl4qf863w6zVQmF+0Z3xsIG8TcHhvOm35aMVhtlRfLB+z5qEomQWUIJH2j1yQXpJPlgad76gWyPZIe1zsZXBrmG75b8lvAm5bahpkLlmPP8u7S6URmyaVuZEfkBmQqJEGldqa6aS5ui4+wljgYzhq7m3Cb/1vp26Nax5m1VzVSQ3KZ6lEnXSWc5JkkPSPEpHpk/mYlKFjsgIpLlSCYdJoI21ubxRwLW+WbN9n4l/WUCj3i67Sn/WXUZPHkOuPnZD1kleXxJ5drPbaVE69XjVnMmz8bg9wk293bWZpfGIdVsUzUbXTorCZVZRJkf+PRZAlkuuVXJytp1PDUUZ4W1tlGmtqbuxv3G81brlquGRRWhFDG79opqybg5XskTCQC5B5ka+UR5rho/W3wDmHVzlj1Wm3ba1vB3DRbt9rqGbGXR1MrdDGqvmd35awkn6Q7o/tkJ6TeZi2oHSwsRujUr9gYGjhbFBvFXBOb9tsV2ivYINSTBpQsKWgb5iYk+qQ7o+AkLSS55YGnuKqSdFITNhdsmbla9RuCHCrb7JtzWksY25XXTnDt8yjPJqolHWRCpAxkO+RipW4m32mZL9QQ2ZaxGTAajlu3W/rb2ZuE2tQZWRbGEb9wpWnT5zjlSGSRJAAkEyRW5S6meaif7VCNDhWimJuaXxtlW8OcPluLGwrZ6xeLU4K2j6stZ5Ol/CSmpDrj8qQVpP/l+Ofra6V+vlQ81/oZ5tsL28UcGxvHm3JaHNhElQ9KDyyg6HvmOOTD5Hzj2aQd5J8llKdgal9ygRK6FwpZpRrq27+b8Fv6m0xatNjqljdPX661KTPmv+UpJEYkCCQvJEtlRybX6UJvNs/RVkmZGJqBm7Lb/hvlG5pa+JlaFzFSK3H1qj4nEiWWZJakPePI5ELlDKZ+KFIswQt0lTTYQJpP216bxNwHW93bKpnh18RUA/q0617n8KXM5O5kOuPqZARk4mXGJ8JrdngKk8dX21nU2wMbxFwiG9dbTdpLmKEVdgwWLRronSZMpQ3kfuPTpA9khaWpJw2qELFf0fqW5tlP2t+bvJv1G8fbpFqdGTVWZ5Bnb3qpWibWpXVkSiQEZCNkdSUhppRpBy5xzsSWIJjAWrPbbdvA3C/brxrbWZfXSdLkc0rqqmdsJaVknKQ8I/8kL6TsJgVoUWxaCJRUxRhkmj+bF5vFXBAb75sI2hYYM1R9A+Hr0mgOph5k9qQ7I+MkNCSF5dXnoOr/NQxTT1e7GYHbOZuC3Chb5ltoWnhYt9WHjestl+j/pmElGKRBZA5kAeSs5X+m/+mAsGpRN9aBmXnak9u5G/lb1Fu7GoPZe5a1kQ7wRCnCJy5lQqSO5AEkF+Rf5T3mVCjh7bNNsxW1mKbaZZtoG8LcOhuC2zzZkpeTk2F1ZirYp4dl9SSjZDsj9mQdZMzmD2gbq8tDrVRTGAdaLpsPm8VcF9vAm2YaB9haVMpI2GxIaG3mMKT/5Dxj3GQkZKqlp+dF6ovzQdLUl1lZrhrvW4CcLhv020GaoxjJFgIPEW5YKSPmtmUj5ESkCeQ0pFVlV+b2aVsvWtBxVlrZItqHG7Tb/NvgG5Ea6Nl+VunR4fFSKiunByWQZJQkPqPNZEtlGyZXaI3tG4wb1UjYjFpWm2GbxFwDm9XbHRnKl9FT8DhIK0jn4+XFZOrkOuPt5Avk7uXb5+7rcbo9097X6Nnc2wbbxNwfG9CbQhp3mHnVH8tZrMFojqZD5QlkfePWJBWkkKW7pzDqGLHn0haXNllZGuSbvhvzG8JbmhqMGRWWRJANbxwpSWbMpXAkSGQF5ChkfqUxprFpFW6oT2aWMpjK2rnbcBv/2+tbplrMWb2XCdK08qVqVudg5Z7kmeQ848Nkd+T6Jh2oR6yoif8U2hhw2gabWpvFHAxb6Bs8Gf+XxFRdP3Gru6fBZhak8yQ64+YkOySSJeqniisZNkRTqBeJGcobPduDnCXb39tdGmUYkxWnTShtfOiwplglE+RAJBCkB6S3pVFnIOnwMLwRVRbSGUOa2Ru6m/ebzxuxWrNZHdaf0OZv4+mwpuQlfORMpAJkHORo5Q0mr6jnLcYOVtXIWPIaa9tqm8IcNdu6mu5ZuZdZky90feqEZ7ulriSgZDuj+iQlJNpmJmgNLAtGWxSpGBQaNhsTG8VcFJv5WxmaMpgulKyHI+wwqCBmKKT75Duj3yQrJLZlu6dsqo90P1LuV2gZttrz24GcK5vum3baUJjmlcHOhy476NQmrSUe5EMkC+Q6JF9laObV6bqvuFCQVqvZLRqMm7ab+1vbG4fa2NliFt6RpLDv6dlnPCVKJJGkP+PR5FQlKeZxaIvtWczCVZyYl9pdG2Rbw9w/m43bD1nyl5xTqjbc6zPnl2X+JKekOuPxZBNk+6Xx59zrvH0vFDXX9hnkmwrbxRwcG8nbdhojWFEVJQpgLKhoQGZ7ZMVkfSPY5Bvkm+WOp1UqbnJsknHXBdmiWulbv1vxG/ybT5q6WPUWGY+5br4pOOaC5WqkRqQHpC2kSGVCJs6pZ67Wj8dWRFkVWr/bchv+m+abnVr9GWKXBpJZcgCqRCdVpZhkl2Q9o8ekQCUIZnYoQCz3SugVLph82g2bXdvE3Aib4FsumejX05Qau0LrpWf0pc8k72Q64+lkAmTeZf+ntOs2N7oTgBfW2dJbAdvEHCLb2VtRmlGYrRVzTGjtIuihpk8lD2R/I9MkDaSCZaOnAuopcQjR8dbh2U0a3hu8W/XbyZunWqKZPtZE0IQvhCmfZtnldyRKpAPkIaRyJRzmi6kv7gqO+hXbGPzachttG8EcMVux2t/Zn9ddEt+zluqwp2/lp2SdpDwj/iQtJOfmPegA7GNIB1T+mCCaPVsWW8VcERvx2wzaHNgBlKvE8SvZqBLmIKT35Dtj4iQx5IIlz6eUKvD0+lMHl7aZvxr4W4KcKRvoW2vafhiC1fVNwG3gaMSmo+UaJEGkDeQ/5Gmlemb16Z/wEFEulryZNtqSG7ib+dvWG74aiNlE1s7RcLBOacdnMaVEZI9kAOQWZF0lOSZL6M0tgo2nla/Yo1pjm2cbwxw7W4WbAVnaV6VTdfWzKt8ni2X3JKRkOyP1JBrkyOYIKAxr3IJe1ExYAxosWw5bxVwY28KbahoOWGdU9wkpLE/ocmYzJMEkfGPbpCJkpyWh53pqVTMuEoxXVNmrWu3bgFwu2/abRRqomNOWJw8pLmEpKKa5ZSVkROQJZDMkUmVSpuzpfy880CdWVZkf2oVbtBv9G+HblBrtmUcXAFILcZ0qMWcKZZIklOQ+Y8vkSKUWpk+ouuzcS8/VQtiI2lRbYNvEnATb2FshWdHX4RPC+RWrT6fnpcek6+Q64+zkCWTq5dUn4OtDea3T15fkmdpbBdvEnCAb0ptF2n2YRhVmS6wsySiTJkalCuR+I9VkE6SNJbXnJeotsZHSDdcxmVZa4tu9m/PbxBudWpFZH5ZjkCkvJWlOZs/lcaRI5AVkJqR7pSzmqGk87kTPXBYtGMfauBtvW8AcLNupGtEZhZdeEqmy8KpdJ2QloOSa5DyjwiR1ZPWmFeh2rEiJshTTmG0aBJtZm8VcDZvqWwAaBpgTFGyBACvCqAWmGOT0JDsj5SQ45I4l5Ce9Kv018xNgV4TZx5s8m4NcJpvh22CaaxielZoNfO1FKPUmWuUVZECkECQF5LQlS+cW6czwo1FMFszZQJrXW7ob+BvQ27RauFknFrqQxfAt6bXm5yV+pE1kAiQbJGYlCGanKNFt2c4L1cKY7ppp22nbwlw3G70a8xmBV6vTNXSKasqnvyWwZKFkO2P45CKk1iYfKD2r0oWNFKJYEBozmxHbxVwVm/ubHVo5GDxUusezrDfoJGYrJPzkO+PeJCkksqW1Z2BqkPPsUuZXY5m0GvKbgVwsW/CbelpWWPFV6k6drgRpGOav5SBkQ6QLJAAAGlSOGH7aGptoG8FcKhuUGtIZYdaJ0HSuimkA5pIlCSR8o+AkOWSkZfAn7avSSFYVCNigmm0bbxv+G9wbuNqimQeWUI8abftoleZ5ZPzkOyPpJA4kyaYyKARsmIuHVYBYwFq+W3Ub+dvNG5vasFjmVcKNnO0xaG0mIiTyJDrj8yQkZPCmOChtLSvNr5X1GN6ajlu6W/Tb/Nt9mntYvVVcy3Xsa+gGJgwk6CQ7Y/4kO6TZpkJo7S3xDxAWZxk7Wp2bvlvum+tbXVpDWIsVJ0fgq+pn4WX3ZJ9kPKPKJFRlBOaR6Qqu45Bp1pZZVprrW4GcJ1vY23vaCFhOVIG+metsp74lo+SXZD8j1yRuZTJmpqlQr+ERfVbDWbCa+FuD3B9bxRtYWgnYBVQKN19q8idcpZGkkGQCZCVkSiViJsFp0DE4kgvXbhmJGwRbxRwWW/AbMxnHl+zTbnQvKnrnPSVAZIpkBuQ0pGclVKcjaimys5LVV5bZ4BsPG8VcDBvZ2wvZwZeCUuvyB2oGZx7lcGRFpAwkBOSFpYnnTSqh9NkTmpf9mfYbGNvE3AEbwlsimbbXP9HwMKeplKbCJWFkQWQSZBZkpeWCJ4ArD7islBuYIloKm2Gbw1w026la91lm1t9RA2+OaWWmpyUTpH5j2WQpJIel/We9625CshSZGEVaXhtpW8DcJ9uPWsmZUZaU0Amuu2j45k1lBqR8I+GkPSSrJfwnyGwWCSvVE1imWnBbcFv9W9mbs5qZmTYWDs71ra1ojiZ1JPrkOyPq5BIk0KY+qCIsiowbVYpYxhqBW7Yb+RvKG5ZaptjTlerNPKzkaGWmHeTwJDrj9SQoZPgmBaiPLXuNwdY+mOQakVu7G/Ob+Zt3mnFYqNVbitksX6g/Jcgk5qQ7Y8BkQCUhplCo024uj2EWcBkAmuAbvxvtW+gbV1p42HUU8wbG697n2qXzpJ3kPSPMpFklDSahKTeu1ZC5lp7ZW5rt24IcJhvVG3VaPVg2FE/8Qmthp7floGSWJD+j2eRzZTsmtulGcAuRjFcLmbUa+puEHB3bwVtRmj4X6lPSdonq56dWpY5kj2QDJCgkT2VrZtMp03Fc0lnXddmNWwZbxVwUW+wbLBn7F48TQHPbKnEnN2V9ZEmkB6Q3pGylXmc2KgLzE5Mil54Z5FsQ28VcClvVmwRZ9BdgUp5x9Sn9JtllbaREpA0kCCSLZZPnYeqotXVTptfEmjnbGpvEnD7bvdra2ahXGRHz8Fapi+b9JR6kQOQTpBnkq+WMp5ZrFjmGFGdYKNoOW2Mbwtwym6Ta7xlXlvGQ0i9+qR0momURJH3j2uQspI4lyKfWq4ZEiZTkGEuaYZtq28BcJRuKGsDZQRaeD+BubGjwpkilBGR74+NkAOTyJcgoI2wAycEVXZismnObcVv8m9abrlqQWSSWCg6RbZ9ohqZwpPjkOuPspBYk1+YLaECs80xulZQYy9qEW7cb+BvHG5DanRjAlc7M3SzXaF5mGeTuZDrj9yQs5P+mEuixLUfOVBYH2SlalBu72/Kb9ptx2mcYlBVQCnysE2g4ZcRk5OQ7o8JkRKUpZl8o+u4pj7IWeNkFmuLbv9vsG+SbURpuGF5UzoXta5Mn1CXwJJwkPaPO5F3lFWawaSYvBlDJVudZYFrwW4KcJJvRm27aMdgdVH66q2sWp7GlnOSUpAAkHGR4ZQOmxym+cDQRmxcTmbna/NuEXBwb/VsK2jIXzxPu9fTqnWdQ5YskjiQD5CrkVKV0ZuSp2bGAkqeXfZmRmwhbxVwSm+gbJNnuV7CTGjNH6mcnMaV6ZEikCKQ6pHIlaCcJamMzctMvV6VZ6FsS28VcCBvRWzzZpld9UlPxoynzptQlaqRD5A4kC2SRZZ4ndqq9NdFT8xfLWj3bHFvEXDybuVrS2ZnXMRG58AYpgub4JRwkQCQU5B1ksiWXZ61rGrrfVHLYL1oSG2SbwpwwG6Aa5plIFsKQ4m8vKRSmnaUOpH1j3GQwZJSl1Cfva6uF4BTu2FGaZNtsG/+b4puFGvgZMJZlD7fuHejo5kQlAiR7o+TkBKT45dQoP2wbilXVZ9iyWnabcpv729PbqNqHGRKWAQ5ubVHovuYsZPbkOuPuZBok3uYYaF+s1gzB1d3Y0VqHW7gb9xvEG4sak1jtFatMfiyKaFcmFeTspDrj+SQxJMcmYKiULY/OphYRGS6altu8m/Fb81tsGlzYv1U0CaFsBygxpcCk4yQ748SkSSUxZm2o465ij8KWgZlKmuVbgFwq2+FbSxpjWEeU5oRUq4fnzWXsZJrkPePRJGKlHea/6RXvdVDY1u+ZZRry24LcIxvOG2haJlgEFH+5VKsL56tlmaSTZADkHuR9pQym2Cm4cFxR6ZcbWb5a/xuEnBpb+ZsEGiXX8tOdtWAqkydK5YfkjSQEpC2kWeV95vap5HHjErUXRNnWGwpbxVwQ2+PbHZnhV5ETO7L0qh1nLCV3ZEekCaQ9pHflcecc6kiz0ZN8V6yZ7FsUm8UcBhvNGzVZmJdZ0k3xUanqps7lZ+RDJA9kDqSXZainS6rf9qyT/xfSGgGbXdvEHDqbtNrK2YsXB5GCMDWpemazJRmkf6PWJCCkuGWiZ4Qrezx4FH4YNdoVm2Ybwhwt25sa3hl4lpHQtC7fqQxmmKUMZH0j3eQ0JJsl36fI68eHNtT52FfaaFttW/8b4BuAGu9ZH9Zpz1BuD2jg5n/kwCR7Y+akCKT/5eBoG2xnyuqVchi4Gnnbc9v7G9Ebo5q92MBWNU3L7URot2YoJPTkOuPwZB5k5mYlaH8s8c0VFeeY1tqKW7kb9hvBG4WaiZjZlYCMH6y96BAmEeTqpDsj+yQ1ZM7mbqi4rZQO95YaGTQamZu9m/Bb8BtmGlKYqdUFSQXsOyfqpfzkoaQ8Y8bkTeU5ZnxozS6Z0BMWillPmufbgNwpW93bRNpYWHBUgkK8K3xnhyXo5JlkPmPTpGelJmaP6UdvotEoFvfZadr1G4NcIZvKW2HaGtgqlDm4fmrBJ6VllmSSJAFkIaRCpVVm6Sm1sINSN9cjWYKbAVvE3Bjb9ds9GdmX1lOX9MuqiOdFJYTki+QFpDCkX2VHJwjqMnIE0sKXjJnaGwxbxVwO29/bFlnUV7ES4bKhqhPnJqV0ZEakCqQApL1le6cwqnc0L5NI1/OZ8FsWW8UcBBvImy2Zitd1EgoxP+mhZsmlZSRCZBCkEeSdJbLnYSrZd0eUCxgY2gVbX5vD3DhbsBrC2bxW3dFL7+UpcaauJRckfyPXZCQkvqWtp5vrd/6QVImYfFoZG2ebwZwrW5Za1ZloVp+QRy7QqQRmk+UJ5Hyj32Q35KHl62fiq/jHzNUEWJ4aa5tum/5b3Vu62qZZDtZrTyotwWjZJntk/eQ7Y+hkDGTGpi0oOGxmS37VfBi92n0bdNv6W85bnhq0WO4V5E2qrTcocCYj5PLkOuPyZCJk7aYyqF+tCQ2n1fEY3FqNW7nb9Rv+G3/af5iFlY8LgiyxKAkmDeTo5Dsj/SQ55NZmfKidbdZPCRZjWTkanFu+G+8b7JtgGkfYlFUByGur72fj5fjkn+Q8o8kkUmUBZotpOC6OkGMWktlUmupbgVwoG9pbfloNWFhUvP+j63FngOXlZJfkPuPWJGxlLuafqXqvjtF3VsAZrpr3W4OcIBvGm1saDtgQVB23qGr2p18lkuSQ5AIkJCRH5V5m+im08OjSBhdq2YcbA1vFHBcb8Zs2Gc0X+ZNetHdqfuc/ZUGkiuQGZDNkZOVQpxuqBXKl0s/Xk9neWw5bxVwNG9ubDxnHF4/SzfJPKgpnISVxZEXkC6QDpIMlhadEqq00jJOVV/qZ9FsYG8TcAdvEGyXZvJcP0gow7umYZsRlYqRBpBGkFSSjZb2ndurtuCHUFpgfmgkbYRvDnDXbq5r6mW1W8hEX75UpaSapJRSkfqPY5CekhOX4p7PrcwGoVJSYQppcm2jbwRwo25FazRlYVqtQG66BaTwmT2UHpHxj4SQ7ZKhl9yf9a8fI4pUO2KPabttv2/2b2pu12p1ZPVYqzsSt8yiRZnbk++Q7I+okEGTNpjloFeycS9LVhljDmoAbtdv5W8tbmJqq2NtVz81J7SnoaKYf5PDkOuP0JCak9OY/6ECtWo36VfqY4dqQG7rb9Bv623oadZixVVKLJOxkqAImCeTnJDtj/2Q+ZN5mSqjDbhUPWhZsGT5anxu+2+3b6VtZ2n1YfhTdh1Gr46fdZfUknmQ848tkVyUJppppJK7BULMWm1lZmuzbgdwmm9bbeBoB2EBUpz0MK2YnumWh5JakP2PYpHFlN2av6W+v+dFGFwgZsxr524QcHlvC21SaAxg1k9v20qrsJ1klj6SPpALkJuRNJWdmy6n2sQ3SVBdy2YubBZvFHBVb7dsu2cBX25NtM+NqdSc5pX6kSeQHZDZkamVaZy5qHLLGEx0XmxnimxAbxVwLG9dbB5n5126SvbH86cDnG6VupETkDKQG5Iklj+dZKq81KZOh18GaOFsZ28TcP9u/2t4ZrlcpUczwnamPZv8lH+RBJBMkGGSpZYgnjOsh+TuUIpgmGgzbYpvDHDObptrymV4WxREl70VpYKakZRIkfiPaZCski2XD58wrlAP/1J+YSNpgG2pbwJwmG4xaxJlIFrVP8W5yqPPmSqUFZHwj4qQ/JK8lwygYLDtJeBUZWKoachtxG/zb19uwmpQZK9YnjqCtpWiJpnJk+aQ64+vkFKTU5gYoc+yIDGaVkBjJWoMbttv4W8hbkxqhGMiV9MzqLNyoYWYbpO8kOuP2JCrk/GYNaKLtaI4MlgPZJxqTG7ub8xv323Raa1ic1UyKiKxYaDslxeTlpDujwWRCpSYmWOjqLhEPqtZ1GQNa4du/W+yb5htT2nKYZ9TPRngrl+fWpfGknOQ9Y83kW+UR5qnpEm8ykILW49leWu9bglwlG9MbcZo2mCeUWrt06xsntCWeZJVkACQbJHZlACbAaaawI5GVFxBZt9r724RcHNv/Gw2aNxfak/C2Paqhp1NljGSOpAOkKaRSZXCm3Sn8sXGSYdd6WY/bB5vFXBNb6dsn2fPXvVMDs4/qa2cz5XukSOQIJDlkb+Vj5wEqenMlkynXolnm2xIbxVwJG9MbABnsF0xSsnGqqfem1mVr5EQkDeQKJI7lmedtqr21hdPuF8iaPBsbm8ScPZu7WtYZn9cCEdHwTOmGpvolHWRAZBRkG+SvZZLno6sLOlTUbhgsmhBbZBvCnDEbodrqGU6W1pD1rzVpGGafZQ+kfaPb5C7kkeXPZ+TroYVWlOpYTxpjm2ub/9vjm4da+9k3ln1PiG5kKOwmRiUDJHuj5CQDJPYlzygzbB1KDRVjmK/adVtyG/xb1RurGosZGhYfznztV2iCJm4k96Q64+2kGKTb5hLoUqztzLnVmdjPGoYbt5v3m8VbjZqXWPUVlUyK7M/oWiYXpO1kOuP4JC8kxCZa6IWtsc5elg1ZLJqV27xb8dv0m25aYRiH1XbJ7KwMKDRlwiTj5Dvjw6RHJS4mZ6jSbkuP+5Z+GQia5FuAHCtb4ptNmmfYURTJBR7rjGfQJe3km2Q949AkYKUaJrlpAa9iUNKW7BljGvGbgtwjm8+baxorGA6UfDneKxBnreWa5JPkAKQd5HtlCObRKZ+wS5HjlxgZvFr+G4ScGxv7GwbaKtf+k5k1qKqXZ01liSSNZARkLKRXpXnm7ynE8dSSr5dB2dQbCZvFXBGb5ZsgmebXnhMiszyqIWcuZXikR+QJJDxkdWVtpxTqXPOEk3bXqZnq2xPbxVwG287bOJmeV2iSavFY6e5m0SVpJENkDuQNJJTlpCdCqtk2YRP5189aABtdG8QcO1u22s4ZkRcZUZiwPCl95rUlGqR/49WkH2S15Z3nuus/u62UeZgzGhQbZZvCXC7bnRrh2X7WppCGryYpD+aapQ1kfWPdJDJkmGXa5/4rloatVPVYVVpm22zb/1vhG4Ia8tkm1kJPoO4VaOQmQaUA5Huj5eQG5Pzl22gPrG9KodVt2LXaeJtzW/tb0lul2oGZCBYVzhptSii6pink9aQ64++kHKTjZh/ocizLzQ1V45jUmokbuJv2m8Jbh9qNmOHVrcwsLIMoUyYTZOtkOyP6ZDOky6ZoqKktuI6wFhZZMdqYm70b8NvxW2haVtiy1RBJUawAKC1l/mSiJDwjxeRL5TYmdij77kMQDBaGmU2a5tuAnCnb31tHWlzYehSfA0YrgSfJ5epkmeQ+I9KkZWUipokpcm9QUSHW9Fln2vQbgxwiW8vbZJofmDVUIPjHqwWnp+WXpJKkASQgpEClUabh6ZvwsxHyFyAZgNsAW8TcGVv3Wz/Z3pfik431E+qNJ0elhiSMZAVkL2RdJUMnAWoRMjcSvRdJWdhbC5vFXA+b4ZsZWdnXvlLGcumqF+co5XWkRyQKJD9keyV3ZygqSDQi00OX8NnumxWbxRwE28qbMNmQl0TSZfEHaeVmy+VmZEKkECQQZJqlrqdYKsl3PFPGGBYaA9te28PcORuyGsYZgpcvUWIv6+l1ZrAlGCR/Y9bkIuS75ajnketrPYYUhJh5mhebZxvB3CxbmFrZWW9WtNBZbtbpB6aV5QrkfOPe5DYknyXmp9fr2UeDlQAYm1pqW24b/pveW70aqhkV1kWPee3HKNxmfST+5Dtj56QK5MOmJ+gsLHJLNlV4GLuae5t0W/qbz1ugWrhY9ZXGjfitPGhzJiWk8+Q64/FkIOTqpizoUi0lTWAV7RjaGowbuZv1m/9bQlqD2M3VgAvOLLZoDCYPZOmkOyP8ZDfk0yZ2qI3t+07Bll+ZNxqbW73b75vuG2KaTFidVRdItqv0Z+al+qSgpDxjyCRQpT4mRSkmbriQHFaPWVKa6VuBHCib29tBGlHYYlSGgS3rdeeDZebkmKQ+o9UkamUrJpkpZO+8kTEW/JlsmvZbg5wgm8gbXdoT2BtUNnfxqvrnYaWUZJFkAeQjJEWlWqby6Znw2ZIAF2fZhVsCm8UcF9vzWzjZ0lfFk5B0v6pDJ0HlguSLZAYkMiRipUynE+oiclhSyleQ2dybDZvFXA3b3VsSGcyXnhLwslbqDmcjZXKkRmQLJAJkgOWBp3xqenRAk5AX99ny2xdbxRwC28YbKRmCl1/SJLD2KZwmxqVjpEIkEWQTpKDluSdtqtG31tQR2ByaB5tgW8OcNtutWv4Zc5bEEW2vm+lspqslFaR+49hkJiSCZfQnqatDwJ5Uj9hAGlsbaFvBXCnbk1rQmV8WgZBt7oepP2ZRZQikfGPgZDnkpaXyJ/Hr9UhZ1QqYoVptm29b/dvb27faoRkElkZPFG35KJSmeKT8pDsj6WQO5MrmNCgJLKxLipWCGMFavtt1W/mbzJubGq6Y4xX0DVetL2hrpiFk8eQ64/NkJOTx5jpocu04zbKV9pjfmo7bulv0m/wbfJp52LnVR4txbGnoBSYLpOfkO2P+ZDxk2yZE6PNt+w8S1miZPBqeG76b7lvq21xaQdiHlQDH3GvoZ+Al9uSfJDzjyqRVJQYmlCkRruxQbJaX2Vda69uBnCcb2Ft6mgaYSlSavhYraue9JaNklyQ/I9ekb2Uz5qkpWS/n0UAXBNmxWvjbg9wfG8SbV1oIGADUKXcb6vCnW+WRJJBkAqQl5ErlY+bEadqxPlIOV2+ZidsEm8UcFhvvWzHZxZfoE1s0K+p5Jzwlf+RKZAbkNSRn5VZnJmo3crjS15eYGeDbD1vFXAvb2RsKmf9XfNKecgRqBOcd5W/kRWQMJAVkhqWLZ1Cqt7Tdk5yX/pn2mxkbxNwAm8GbIVm0VzmR5nCkqZNmwWVg5EFkEmQXJKalg6eD6zY4sNQdmCNaC1tiG8NcNJuomvXZZFbYETrvS+lkJqZlEyR+Y9mkKeSIpf8ngeuJQzXUmthGWl6badvAnCdbjlrIGU7WjFADLrio92ZMpQZkfCPh5D2krGX+J8zsMkkvVRUYp5pw23Cb/VvZG7KamBkzFgRO722rKIzmdGT6pDsj6yQS5NHmAOhm7JuMHpWL2Mcagdu2W/jbyZuVWqUY0FXbTTcs4ihkZh1k7+Q64/VkKST5ZgeolG1IjgTWABklGpHbu1vzW/kbdppvmKWVRorUbF2oPiXHpOYkO2PApEDlIuZS6NouOA9j1nGZAVrgm78b7RvnW1ZadxhxFMWGwqvc59ml8ySdpD0jzORZ5Q5mo2k+7t4QvFagWVxa7luCHCXb1Jt0WjtYMhRI/D6rH6e2pZ/kleQ/49okdCU8ZrlpTzASEY7XDNm12vsbhBwdm8CbUFo8F+XT9XZGauXnVaWN5I8kA2QopFAlbObV6d8xYxJcF3cZjhsGm8VcFBvrWyrZ+ReJ026zl+pvZzZlfORJZAfkOCRtpV/nOWoSsxjTJJefWeTbEVvFXAnb1NsDGfHXWpKRsfIp+6bYpW0kRKQNZAikjGWVp2UqgLW506jXxZo6mxrbxJw+m70a2ZmmFxJR6bBT6Ypm/GUeZEDkE6QaZKzljmeaKwh5ylRpGCoaDttjW8LcMhukGu2ZVRbqUMnvfCkbpqFlEKR949skLWSPJcqn2quEBM1U5dhMmmIbaxvAHCTbiVr/WT5WVU/Zbmoo72ZH5QQke+PjpAFk8yXKKCfsHAnEVV9YrVp0G3Gb/JvWW62ajtkhlj4OS62daIVmb+T4pDrj7OQW5NkmDahFbMRMsdWV2MyahNu3W/fbxpuP2puY/VW+TJes1ShdZhkk7iQ64/dkLWTA5lVotu1TjlcWCVkqWpSbvBvyW/XbcNplWJDVdso4LBFoNyXDpORkO6PC5EVlKqZhqMFuc4+01noZBlrjW7/b69vkG1BabFhalNtFqWuRZ9Ml72ScJD2jz2RepRamsuktbw5Qy9bomWEa8NuCnCRb0Rtt2i/YGVRD+qerFOewpZxklGQAZBzkeWUFJsopiDB7EZ1XFNm6mv1bhJwb2/zbCZowF8pT1zXxapunT+WKpI3kBCQrZFVldibnqeXxhlKpl37ZklsIm8VcElvnWyOZ7BerEwqzRKplpzDleeRIZAjkOyRzJWmnDKpys3fTMZemmekbExvFXAfb0Js7maQXd9JIsaBp8ibTZWokQ6QOZAvkkmWf53oqlbYV0/UXzFo+WxybxFw8W7ia0ZmXlyqRsDADKYGm9yUbpEAkFSQd5LMlmWexKxl7I5R0mDCaEptk28JcL9ufGuVZRZb60JpvLGkTZpylDiR9Y9ykMOSVpdYn86ucRiPU8NhS2mVbbFv/m+IbhFr2mS3WWw+w7hto52ZDZQHke6PlJAVk+eXWKAPsckpZVWnYs1p3W3Lb+9vTm6gahZkPljVOKG1PqL3mK6T2pDrj7uQa5OAmGmhkrOUMxRXfmNJah9u4W/cbw5uKWpGY6dWZzHjsiGhWJhUk7CQ64/lkMaTIZmLomm2bjqjWEpkvmpdbvNvxG/LbatpbGLvVF8mc7AUoMGX/5KLkPCPE5EnlMqZwKOpubA/FFoMZS5rl24BcKpvgm0oaYVhDlN9EECuF58yl6+SapD3j0aRjZR8mgqldr30Q25bxGWXa8xuDHCLbzVtnWiRYABRQOVDrCieqZZkkkyQA5B9kfmUOJtqpgrCikewXHNm/Gv+bhJwaG/jbAtoj1+5ThjVcqpGnSeWHZIzkBOQuJFrlf2b5qfBx6JK3V0ZZ1psKm8VcEFvjWxxZ3xeLkyvy8Wob5yslduRHZAnkPiR4pXNnICpas9ZTflet2e0bFNvFHAXbzFs0GZZXVBJCMU6p6SbOJWdkQyQPpA8kmCWqZ08q/baxE8EYE1oCW14bxBw6G7QayZmI1wERuO/yqXjmsiUZJH+j1mQhZLllpCeIK0f8/FRAGHbaFhtmW8IcLVuaWtzZddaKEKxu3SkLJpflC+R8494kNKScJeGnzSvzRzqU+5hY2mjbbZv+29+bvxqt2RzWX49KLg0o36Z/JP+kO2Pm5AkkwOYiaCBsfIrt1XPYuRp6W3Pb+tvQm6KavFj9VegNxm1CKLYmJ2T0pDrj8KQfJOdmJ6hEbQDNWFXpGNfaitu5W/YbwJuEmofY1lWvS9rsu6gO5hEk6mQ7I/tkNiTQJnDovm2fjvpWG5k02pobvZvwG++bZRpQmKZVKAjBrDkn6aX8JKFkPGPHJE6lOqZ+6NRuolAVlouZUJroW4EcKRvdW0OaVlhsVJ5COCt6p4Yl6GSZJD6j1CRoZSemkmlPb6pRKtb5WWqa9ZuDXCFbydtgmhjYJlQUuHrq/2dkZZWkkiQBpCIkQ6VW5uvpv3CJUjpXJJmDWwGbxNwYW/UbO9nXl9GTg/TIKodnRCWEJIvkBaQw5GAlSKcMKj/yChLEl42Z2tsMm8VcDpvfGxUZ0herktQynqoSZyWlc+RGpArkASS+ZX1nNCpJNHRTStf02fEbFpvFHAObx9ssWYhXb1I/8P0pn+bIpWSkQmQQpBJkniW0p2Sq+zdL1AzYGhoGG1/bw9w3269awZm51tZRQ2/iaXAmrWUWpH7j1+Qk5L+lryefq3S/FFSLGH1aGZtn28FcKtuVWtRZZhaXUH+ujekC5pMlCaR8o9+kOGSi5e0n5uvdyBCVBhie2mwbbtv+W9zbuhqk2QvWYU8j7f8ogAA71SLY+pqvW4TcDNv72txZfZYtzIPsJ+ePpbSkQWQcZAuk+SYsaOjvnNJ5F5xaIRtzW/Tb5ZtlWgoXzFKvr8ApAyZQ5N6kAGQwpEflmSegK+QMJhYQ2XWayhvFHDKbgZrv2NfVXwNhKupnDKVUJHvj8OQ+ZNimq2mUctfTyZhomkfbvhvl2/nbERnnVxrQlG3YaGzl4+SOZAokFiSSJeVoBa1Fj+wW8tmp2x+bwJwTW4AatZhC1HK0cmn7JpDlOOQ7I8pkd+UD5wyqv3pB1QiY7Jqo24QcEdvHmzLZa1ZgDY2sReffpbykQyQYpAFk5WYFqOTvORHWV4oaF5twW/db7pt22itX5tLI8KipF+Zb5OKkPuPpJHhlfGdb66RK9VX5mSkaxJvFXDjbjxrJGQ6VjoccqwTnWuVa5Hyj6+QypMJmvml1scxTqtgYWn+bfBvpW8QbZJnNl1lRPC47qH9l7WSRpAekDWSA5cSoLizkjwKW3hme2xtbwhwa249akhiFFJr14+oSpt2lPmQ648RkaqUq5tcqePeE1O3Ynhqh24McFpvTWwiZl9avDlvspKfwJYTkhWQU5DckkiYgKKuujRGyl3eZzhttG/nb9xtH2kuYPBMz8RLpbOZnJOckPaPh5GmlYGda60mJQtXhmRxa/tuFXD7bnFrhmQLVyYla62BnaaVh5H2j5yQnJOzmUulz8TwTC5gH2ncbedvtG84bd5nyl00Rq66gKJImNySU5AVkBOSwJaSn2+yvDlfWiJmTWxabwxwh254ardiE1Pj3lypq5uqlBGR64/5kHaUSpuPqGvXFFJIYj1qa24IcG1ve2x4Zgpbkjy4sxKgA5c1kh6QRpC1kv2X7qHwuGVENl2SZxBtpW/wb/5tYWmrYDFO1sf5pQmaypOvkPKPa5FrlROdcqw6HDpWJGQ8a+NuFXASb6Rr5mTVV5Erb67xneGVpJH7j4qQb5NfmaKkI8KbS61f22i6bd1vwW9ebShoWV7kR5O8FqOVmAWTYpAMkPKRfpYXnzaxgDatWctlHmxHbxBwo26yaiJjB1T96TKqD5zflCmR7I/jkEOU7JrJp8rRC1HWYQBqTW4CcH5vp2zLZrBbFj8WtZWgSJdYkiiQOZCPkrOXYaFRt2tCnVxEZ+dsl2/4bx9uomkmYV9PUcutpmKa+ZPDkO+PUJEylamchKt8DV9Vv2MGa8puFHAob9ZrQ2WYWJAwgK9knh+WwpEBkHqQQ5MMmQCkvr8xSihflWiWbdNvzW+EbXFo5F5zSaO+saPkmC6TcZAFkNKRPpafng+wtzL2WHFl72szbxNwvW7qaotj71QAABGrdZwWlUOR7Y/NkBGUj5oKp0nN8U9hYcJpLm77b49v0mwcZ09cXUGNthyhj5d8kjOQLZBqkmuX2KDPtUJAAFz0Zr1shm//bz5u4WmcYYBQcM9op72aKpTYkOyPNpH6lEGcoaqE8nxUV2POarBuEXA9bwdsnmVTWa80obDanl6W4ZEIkGmQGZO8mGOjlb2vSJ9eTWhxbcdv2G+obbhoa1/qSurAUKQ1mVmTgpD+j7ORAJYqnvWuNi43WBRlvWsdbxRw124ha/FjzlUDFvmr3pxOlV2R8I+5kOKTNZpTpoDJyk7pYIJpDm70b55v+2xrZ+pcbUMcuKeh2Jeikj+QI5BGkiWXU6BltN09XluhZpFsdm8FcFxuH2oPYpFRb9QrqBqbXJTukOuPHZHElNybxqnG445T7WKVapVuDnBRbzZs92UHWio4z7FVn5+WApIQkFuQ8JJumMqim7sQRxJeA2hLbbpv4m/Lbf1o7l9ITG7D9qSImYWTk5D4j5WRw5W4neytlShxV7ZkimsHbxVw725Wa1VkpFYdIe2sSZ2IlXmR9I+mkLOT3pmhpUTGkU1uYEBp7W3rb61vJG24Z4BdUkXMuTaiIpjIkkyQGZAkkuGW0p8QszE7tVpNZmRsZG8KcHluWmp/YpVS2tr1qHqbj5QFkeuPBZGPlHqb9aja2pVSf2JaanluCnBkb2RsTWa1WjE7ELPSn+GWJJIZkEyQyJIimDaizLlSRYBduGckba1v62/tbUBpbmCRTUTGoaXembOTppD0j3mRiJVJne2sHSGkVlVkVmvvbhVwB2+Ka7ZkcVeVKOytuJ3DlZWR+I+TkIWTiJn2pG7DSEzuX/1oy23ib7pvS20DaBJeEEebu8qibpjwkluQEJACkp+WVZ/PsSo4B1r3ZTZsUW8OcJVulWrtYo5TxuPGqdybxJQdkeuP7pBclBqbK6hv1JFRD2IfalxuBXB2b5FsoWZeW909ZbRToCWXRpIjkD+QopLYl6ehHLhtQ+pca2f7bJ5v9G8OboJp6WDKToDJU6Y1muKTuZDwj12RTpXenPmrAxbOVfFjIWvXbhRwHW+9axRlN1g2LvWuKp4AlrOR/o+CkFmTNZlQpOrA6kprX7hoqG3Yb8dvcW1NaJ9er0iVvWOjvJgZk2mQCJDhkV6W2p6hsK80U1meZQdsPW8RcLBuzmpXY3xUhPKhqkGc+pQ2keyP2JAqlL2aaKdwz4BQnGHhaT5u/2+Gb71s9GYAXEJAz7XYoGuXapItkDOQfJKPlxyhjbZdQU9cHGfSbI9v+28ubsJpYWHxT0nNCqePmhGUzZDtj0ORFpV1nBGrAADvVItj6mq9bhNwM2/va3Fl9li3Mg+wn54+ltKRBZBxkC6T5Jixo6O+c0nkXnFohG3Nb9Nvlm2VaChfMUq+vwCkDJlDk3qQAZDCkR+WZJ6Ar5AwmFhDZdZrKG8UcMpuBmu/Y19VfA2Eq6mcMpVQke+Pw5D5k2KaraZRy19PJmGiaR9u+G+Xb+dsRGedXGtCUbdhobOXj5I5kCiQWJJIl5WgFrUWP7Bby2anbH5vAnBNbgBq1mELUcrRyafsmkOU45DsjymR35QPnDKq/ekHVCJjsmqjbhBwR28ebMtlrVmANjaxF59+lvKRDJBikAWTlZgWo5O85EdZXihoXm3Bb91vum3baK1fm0sjwqKkX5lvk4qQ+4+kkeGV8Z1vrpEr1VfmZKRrEm8VcONuPGskZDpWOhxyrBOda5VrkfKPr5DKkwma+aXWxzFOq2Bhaf5t8G+lbxBtkmc2XWVE8Ljuof2XtZJGkB6QNZIDlxKguLOSPApbeGZ7bG1vCHBrbj1qSGIUUmvXj6hKm3aU+ZDrjxGRqpSrm1yp494TU7dieGqHbgxwWm9NbCJmX1q8OW+ykp/AlhOSFZBTkNySSJiAoq66NEbKXd5nOG20b+dv3G0faS5g8EzPxEuls5mck5yQ9o+HkaaVgZ1rrSYlC1eGZHFr+24VcPtucWuGZAtXJiVrrYGdppWHkfaPnJCck7OZS6XPxPBMLmAfadxt52+0bzht3mfKXTRGrrqAokiY3JJTkBWQE5LAlpKfb7K8OV9aImZNbFpvDHCHbnhqt2ITU+PeXKmrm6qUEZHrj/mQdpRKm4+oa9cUUkhiPWprbghwbW97bHhmCluSPLizEqADlzWSHpBGkLWS/ZfuofC4ZUQ2XZJnEG2lb/Bv/m1haatgMU7Wx/mlCZrKk6+Q8o9rkWuVE51yrDocOlYkZDxr424VcBJvpGvmZNVXkStvrvGd4ZWkkfuPipBvk1+ZoqQjwptLrV/baLpt3W/Bb15tKGhZXuRHk7wWo5WYBZNikAyQ8pF+lhefNrGANq1Zy2UebEdvEHCjbrJqImMHVP3pMqoPnN+UKZHsj+OQQ5TsmsmnytELUdZhAGpNbgJwfm+nbMtmsFsWPxa1laBIl1iSKJA5kI+Ss5dhoVG3a0KdXERn52yXb/hvH26iaSZhX09Ry62mYpr5k8OQ749QkTKVqZyEq3wNX1W/YwZrym4UcChv1mtDZZhYkDCAr2SeH5bCkQGQepBDkwyZAKS+vzFKKF+VaJZt02/Nb4RtcWjkXnNJo76xo+SYLpNxkAWQ0pE+lp+eD7C3MvZYcWXvazNvE3C9bupqi2PvVAAAEat1nBaVQ5Htj82QEZSPmgqnSc3xT2Fhwmkubvtvj2/SbBxnT1xdQY22HKGPl3ySM5AtkGqSa5fYoM+1QkAAXPRmvWyGb/9vPm7haZxhgFBwz2invZoqlNiQ7I82kfqUQZyhqoTyfFRXY85qsG4RcD1vB2yeZVNZrzShsNqeXpbhkQiQaZAZk7yYY6OVva9In15NaHFtx2/Yb6htuGhrX+pK6sBQpDWZWZOCkP6Ps5EAliqe9a42LjdYFGW9ax1vFHDXbiFr8WPOVQMW+avenE6VXZHwj7mQ4pM1mlOmgMnKTulggmkObvRvnm/7bGtn6lxtQxy4p6HYl6KSP5AjkEaSJZdToGW03T1eW6FmkWx2bwVwXG4fag9ikVFv1CuoGptclO6Q648dkcSU3JvGqcbjjlPtYpVqlW4OcFFvNmz3ZQdaKjjPsVWfn5YCkhCQW5Dwkm6YyqKbuxBHEl4DaEttum/ib8tt/WjuX0hMbsP2pIiZhZOTkPiPlZHDlbid7K2VKHFXtmSKawdvFXDvblZrVWSkVh0h7axJnYiVeZH0j6aQs5PemaGlRMaRTW5gQGntbetvrW8kbbhngF1SRcy5NqIimMiSTJAZkCSS4ZbSnxCzMTu1Wk1mZGxkbwpweW5aan9ilVLa2vWoepuPlAWR648FkY+Uepv1qNralVJ/YlpqeW4KcGRvZGxNZrVaMTsQs9Kf4ZYkkhmQTJDIkiKYNqLMuVJFgF24ZyRtrW/rb+1tQGluYJFNRMahpd6Zs5OmkPSPeZGIlUmd7awdIaRWVWRWa+9uFXAHb4prtmRxV5Uo7K24ncOVlZH4j5OQhZOImfakbsNITO5f/WjLbeJvum9LbQNoEl4QR5u7yqJumPCSW5AQkAKSn5ZVn8+xKjgHWvdlNmxRbw5wlW6Vau1ijlPG48ap3JvElB2R64/ukFyUGpsrqG/UkVEPYh9qXG4FcHZvkWyhZl5b3T1ltFOgJZdGkiOQP5CiktiXp6EcuG1D6lxrZ/tsnm/0bw5ugmnpYMpOgMlTpjWa4pO5kPCPXZFOld6c+asDFs5V8WMha9duFHAdb71rFGU3WDYu9a4qngCWs5H+j4KQWZM1mVCk6sDqSmtfuGiobdhvx29xbU1on16vSJW9Y6O8mBmTaZAIkOGRXpbanqGwrzRTWZ5lB2w9bxFwsG7OaldjfFSE8qGqQZz6lDaR7I/YkCqUvZpop3DPgFCcYeFpPm7/b4ZvvWz0ZgBcQkDPtdiga5dqki2QM5B8ko+XHKGNtl1BT1wcZ9Jsj2/7by5uwmlhYfFPSc0Kp4+aEZTNkO2PQ5EWlXWcEasAAO9Ui2Pqar1uE3Azb+9rcWX2WLcyD7Cfnj6W0pEFkHGQLpPkmLGjo75zSeRecWiEbc1v02+WbZVoKF8xSr6/AKQMmUOTepABkMKRH5ZknoCvkDCYWENl1msobxRwym4Ga79jX1V8DYSrqZwylVCR74/DkPmTYpqtplHLX08mYaJpH274b5dv52xEZ51ca0JRt2Ghs5ePkjmQKJBYkkiXlaAWtRY/sFvLZqdsfm8CcE1uAGrWYQtRytHJp+yaQ5TjkOyPKZHflA+cMqr96QdUImOyaqNuEHBHbx5sy2WtWYA2NrEXn36W8pEMkGKQBZOVmBajk7zkR1leKGhebcFv3W+6bdtorV+bSyPCoqRfmW+TipD7j6SR4ZXxnW+ukSvVV+ZkpGsSbxVw4248ayRkOlY6HHKsE51rlWuR8o+vkMqTCZr5pdbHMU6rYGFp/m3wb6VvEG2SZzZdZUTwuO6h/Ze1kkaQHpA1kgOXEqC4s5I8Clt4ZntsbW8IcGtuPWpIYhRSa9ePqEqbdpT5kOuPEZGqlKubXKnj3hNTt2J4aoduDHBab01sImZfWrw5b7KSn8CWE5IVkFOQ3JJImICirro0Rspd3mc4bbRv52/cbR9pLmDwTM/ES6WzmZyTnJD2j4eRppWBnWutJiULV4ZkcWv7bhVw+25xa4ZkC1cmJWutgZ2mlYeR9o+ckJyTs5lLpc/E8EwuYB9p3G3nb7RvOG3eZ8pdNEauuoCiSJjcklOQFZATksCWkp9vsrw5X1oiZk1sWm8McIdueGq3YhNT495cqaubqpQRkeuP+ZB2lEqbj6hr1xRSSGI9amtuCHBtb3tseGYKW5I8uLMSoAOXNZIekEaQtZL9l+6h8LhlRDZdkmcQbaVv8G/+bWFpq2AxTtbH+aUJmsqTr5Dyj2uRa5UTnXKsOhw6ViRkPGvjbhVwEm+ka+Zk1VeRK2+u8Z3hlaSR+4+KkG+TX5mipCPCm0utX9toum3db8FvXm0oaFle5EeTvBajlZgFk2KQDJDykX6WF582sYA2rVnLZR5sR28QcKNusmoiYwdU/ekyqg+c35QpkeyP45BDlOyayafK0QtR1mEAak1uAnB+b6dsy2awWxY/FrWVoEiXWJIokDmQj5Kzl2GhUbdrQp1cRGfnbJdv+G8fbqJpJmFfT1HLraZimvmTw5Dvj1CRMpWpnISrfA1fVb9jBmvKbhRwKG/Wa0NlmFiQMICvZJ4flsKRAZB6kEOTDJkApL6/MUooX5Volm3Tb81vhG1xaORec0mjvrGj5Jguk3GQBZDSkT6Wn54PsLcy9lhxZe9rM28TcL1u6mqLY+9UAAARq3WcFpVDke2PzZARlI+aCqdJzfFPYWHCaS5u+2+Pb9JsHGdPXF1BjbYcoY+XfJIzkC2QapJrl9igz7VCQABc9Ga9bIZv/28+buFpnGGAUHDPaKe9miqU2JDsjzaR+pRBnKGqhPJ8VFdjzmqwbhFwPW8HbJ5lU1mvNKGw2p5eluGRCJBpkBmTvJhjo5W9r0ifXk1ocW3Hb9hvqG24aGtf6krqwFCkNZlZk4KQ/o+zkQCWKp71rjYuN1gUZb1rHW8UcNduIWvxY85VAxb5q96cTpVdkfCPuZDikzWaU6aAycpO6WCCaQ5u9G+eb/tsa2fqXG1DHLinodiXopI/kCOQRpIll1OgZbTdPV5boWaRbHZvBXBcbh9qD2KRUW/UK6gam1yU7pDrjx2RxJTcm8apxuOOU+1ilWqVbg5wUW82bPdlB1oqOM+xVZ+flgKSEJBbkPCSbpjKopu7EEcSXgNoS226b+Jvy239aO5fSExuw/akiJmFk5OQ+I+VkcOVuJ3srZUocVe2ZIprB28VcO9uVmtVZKRWHSHtrEmdiJV5kfSPppCzk96ZoaVExpFNbmBAae1t62+tbyRtuGeAXVJFzLk2oiKYyJJMkBmQJJLhltKfELMxO7VaTWZkbGRvCnB5blpqf2KVUtra9ah6m4+UBZHrjwWRj5R6m/Wo2tqVUn9iWmp5bgpwZG9kbE1mtVoxOxCz0p/hliSSGZBMkMiSIpg2osy5UkWAXbhnJG2tb+tv7W1AaW5gkU1ExqGl3pmzk6aQ9I95kYiVSZ3trB0hpFZVZFZr724VcAdvimu2ZHFXlSjsrbidw5WVkfiPk5CFk4iZ9qRuw0hM7l/9aMtt4m+6b0ttA2gSXhBHm7vKom6Y8JJbkBCQApKfllWfz7EqOAda92U2bFFvDnCVbpVq7WKOU8bjxqncm8SUHZHrj+6QXJQamyuob9SRUQ9iH2pcbgVwdm+RbKFmXlvdPWW0U6All0aSI5A/kKKS2JenoRy4bUPqXGtn+2yeb/RvDm6Caelgyk6AyVOmNZrik7mQ8I9dkU6V3pz5qwMWzlXxYyFr124UcB1vvWsUZTdYNi71riqeAJazkf6PgpBZkzWZUKTqwOpKa1+4aKht2G/Hb3FtTWifXq9Ilb1jo7yYGZNpkAiQ4ZFeltqeobCvNFNZnmUHbD1vEXCwbs5qV2N8VITyoapBnPqUNpHsj9iQKpS9mmincM+AUJxh4Wk+bv9vhm+9bPRmAFxCQM+12KBrl2qSLZAzkHySj5ccoY22XUFPXBxn0myPb/tvLm7CaWFh8U9JzQqnj5oRlM2Q7Y9DkRaVdZwRqwAA71SLY+pqvW4TcDNv72txZfZYtzIPsJ+ePpbSkQWQcZAuk+SYsaOjvnNJ5F5xaIRtzW/Tb5ZtlWgoXzFKvr8ApAyZQ5N6kAGQwpEflmSegK+QMJhYQ2XWayhvFHDKbgZrv2NfVXwNhKupnDKVUJHvj8OQ+ZNimq2mUctfTyZhomkfbvhvl2/nbERnnVxrQlG3YaGzl4+SOZAokFiSSJeVoBa1Fj+wW8tmp2x+bwJwTW4AatZhC1HK0cmn7JpDlOOQ7I8pkd+UD5wyqv3pB1QiY7Jqo24QcEdvHmzLZa1ZgDY2sReffpbykQyQYpAFk5WYFqOTvORHWV4oaF5twW/db7pt22itX5tLI8KipF+Zb5OKkPuPpJHhlfGdb66RK9VX5mSkaxJvFXDjbjxrJGQ6VjoccqwTnWuVa5Hyj6+QypMJmvml1scxTqtgYWn+bfBvpW8QbZJnNl1lRPC47qH9l7WSRpAekDWSA5cSoLizkjwKW3hme2xtbwhwa249akhiFFJr14+oSpt2lPmQ648RkaqUq5tcqePeE1O3Ynhqh24McFpvTWwiZl9avDlvspKfwJYTkhWQU5DckkiYgKKuujRGyl3eZzhttG/nb9xtH2kuYPBMz8RLpbOZnJOckPaPh5GmlYGda60mJQtXhmRxa/tuFXD7bnFrhmQLVyYla62BnaaVh5H2j5yQnJOzmUulz8TwTC5gH2ncbedvtG84bd5nyl00Rq66gKJImNySU5AVkBOSwJaSn2+yvDlfWiJmTWxabwxwh254ardiE1Pj3lypq5uqlBGR64/5kHaUSpuPqGvXFFJIYj1qa24IcG1ve2x4Zgpbkjy4sxKgA5c1kh6QRpC1kv2X7qHwuGVENl2SZxBtpW/wb/5tYWmrYDFO1sf5pQmaypOvkPKPa5FrlROdcqw6HDpWJGQ8a+NuFXASb6Rr5mTVV5Erb67xneGVpJH7j4qQb5NfmaKkI8KbS61f22i6bd1vwW9ebShoWV7kR5O8FqOVmAWTYpAMkPKRfpYXnzaxgDatWctlHmxHbxBwo26yaiJjB1T96TKqD5zflCmR7I/jkEOU7JrJp8rRC1HWYQBqTW4CcH5vp2zLZrBbFj8WtZWgSJdYkiiQOZCPkrOXYaFRt2tCnVxEZ+dsl2/4bx9uomkmYV9PUcutpmKa+ZPDkO+PUJEylamchKt8DV9Vv2MGa8puFHAob9ZrQ2WYWJAwgK9knh+WwpEBkHqQQ5MMmQCkvr8xSihflWiWbdNvzW+EbXFo5F5zSaO+saPkmC6TcZAFkNKRPpafng+wtzL2WHFl72szbxNwvW7qaotj71QAABGrdZwWlUOR7Y/NkBGUj5oKp0nN8U9hYcJpLm77b49v0mwcZ09cXUGNthyhj5d8kjOQLZBqkmuX2KDPtUJAAFz0Zr1shm//bz5u4WmcYYBQcM9op72aKpTYkOyPNpH6lEGcoaqE8nxUV2POarBuEXA9bwdsnmVTWa80obDanl6W4ZEIkGmQGZO8mGOjlb2vSJ9eTWhxbcdv2G+obbhoa1/qSurAUKQ1mVmTgpD+j7ORAJYqnvWuNi43WBRlvWsdbxRw124ha/FjzlUDFvmr3pxOlV2R8I+5kOKTNZpTpoDJyk7pYIJpDm70b55v+2xrZ+pcbUMcuKeh2Jeikj+QI5BGkiWXU6BltN09XluhZpFsdm8FcFxuH2oPYpFRb9QrqBqbXJTukOuPHZHElNybxqnG445T7WKVapVuDnBRbzZs92UHWio4z7FVn5+WApIQkFuQ8JJumMqim7sQRxJeA2hLbbpv4m/Lbf1o7l9ITG7D9qSImYWTk5D4j5WRw5W4neytlShxV7ZkimsHbxVw725Wa1VkpFYdIe2sSZ2IlXmR9I+mkLOT3pmhpUTGkU1uYEBp7W3rb61vJG24Z4BdUkXMuTaiIpjIkkyQGZAkkuGW0p8QszE7tVpNZmRsZG8KcHluWmp/YpVS2tr1qHqbj5QFkeuPBZGPlHqb9aja2pVSf2JaanluCnBkb2RsTWa1WjE7ELPSn+GWJJIZkEyQyJIimDaizLlSRYBduGckba1v62/tbUBpbmCRTUTGoaXembOTppD0j3mRiJVJne2sHSGkVlVkVmvvbhVwB2+Ka7ZkcVeVKOytuJ3DlZWR+I+TkIWTiJn2pG7DSEzuX/1oy23ib7pvS20DaBJeEEebu8qibpjwkluQEJACkp+WVZ/PsSo4B1r3ZTZsUW8OcJVulWrtYo5TxuPGqdybxJQdkeuP7pBclBqbK6hv1JFRD2IfalxuBXB2b5FsoWZeW909ZbRToCWXRpIjkD+QopLYl6ehHLhtQ+pca2f7bJ5v9G8OboJp6WDKToDJU6Y1muKTuZDwj12RTpXenPmrAxbOVfFjIWvXbhRwHW+9axRlN1g2LvWuKp4AlrOR/o+CkFmTNZlQpOrA6kprX7hoqG3Yb8dvcW1NaJ9er0iVvWOjvJgZk2mQCJDhkV6W2p6hsK80U1meZQdsPW8RcLBuzmpXY3xUhPKhqkGc+pQ2keyP2JAqlL2aaKdwz4BQnGHhaT5u/2+Gb71s9GYAXEJAz7XYoGuXapItkDOQfJKPlxyhjbZdQU9cHGfSbI9v+28ubsJpYWHxT0nNCqePmhGUzZDtj0ORFpV1nBGrAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAHFXy2WnbK1vzW8QbaFmU1kmJaGqGpvKk3qQGZCPkpWY9qRJzRNT8WO9a1pv+2/LbShonVwxO4CvE53ElNiQ9o/hkSWX7qGjvpFN1mGyau9uE3BrboJpa180Rs+1VZ/hlVCR649QkeGVVZ/PtTRGa1+CaWtuE3DvbrJq1mGRTaO+7qEll+GR9o/YkMSUE52ArzE7nVwoaMtt+29ab71r8WMTU0nN9qSVmI+SGZB6kMqTGpuhqiYlU1mhZhBtzW+tb6dsy2VxVwAAj6g1mlmTU5AzkPCSX5mtptraX1XmZDZshm/nb3Fta2cKW7cy7awPnEOUppAFkDWS2Jdjo8/EgFDtYjxrKG8KcB9u22gSXl1Bb7Iqnk6VEZHtj5WRfpaVoMy5MUqrYB9qsG4VcLBuH2qrYDFKzLmVoH6WlZHtjxGRTpUqnm+yXUESXttoH24KcChvPGvtYoBQz8Rjo9iXNZIFkKaQQ5QPnO2stzIKW2tncW3nb4ZvNmzmZF9V2tqtpl+Z8JIzkFOQWZM1mo+oAABxV8tlp2ytb81vEG2hZlNZJiWhqhqbypN6kBmQj5KVmPakSc0TU/FjvWtab/tvy20oaJ1cMTuArxOdxJTYkPaP4ZEll+6ho76RTdZhsmrvbhNwa26CaWtfNEbPtVWf4ZVQkeuPUJHhlVWfz7U0RmtfgmlrbhNw726yatZhkU2jvu6hJZfhkfaP2JDElBOdgK8xO51cKGjLbftvWm+9a/FjE1NJzfaklZiPkhmQepDKkxqboaomJVNZoWYQbc1vrW+nbMtlcVcAAI+oNZpZk1OQM5Dwkl+Zraba2l9V5mQ2bIZv529xbWtnClu3Mu2sD5xDlKaQBZA1ktiXY6PPxIBQ7WI8ayhvCnAfbttoEl5dQW+yKp5OlRGR7Y+VkX6WlaDMuTFKq2AfarBuFXCwbh9qq2AxSsy5laB+lpWR7Y8RkU6VKp5vsl1BEl7baB9uCnAobzxr7WKAUM/EY6PYlzWSBZCmkEOUD5ztrLcyCltrZ3Ft52+GbzZs5mRfVdraraZfmfCSM5BTkFmTNZqPqAAAcVfLZadsrW/NbxBtoWZTWSYloaoam8qTepAZkI+SlZj2pEnNE1PxY71rWm/7b8ttKGidXDE7gK8TncSU2JD2j+GRJZfuoaO+kU3WYbJq724TcGtugmlrXzRGz7VVn+GVUJHrj1CR4ZVVn8+1NEZrX4Jpa24TcO9usmrWYZFNo77uoSWX4ZH2j9iQxJQTnYCvMTudXChoy237b1pvvWvxYxNTSc32pJWYj5IZkHqQypMam6GqJiVTWaFmEG3Nb61vp2zLZXFXAACPqDWaWZNTkDOQ8JJfma2m2tpfVeZkNmyGb+dvcW1rZwpbtzLtrA+cQ5SmkAWQNZLYl2Ojz8SAUO1iPGsobwpwH27baBJeXUFvsiqeTpURke2PlZF+lpWgzLkxSqtgH2qwbhVwsG4faqtgMUrMuZWgfpaVke2PEZFOlSqeb7JdQRJe22gfbgpwKG88a+1igFDPxGOj2Jc1kgWQppBDlA+c7ay3Mgpba2dxbedvhm82bOZkX1Xa2q2mX5nwkjOQU5BZkzWaj6gAAO9Z8GcibhRwfm7MaPVb8yhRqP+YRZL0jzCRaJY4ohnJJ1UBZkpt+m8Yb1VqcV+EP7utFZsykyCQqZD8lAqfP7rxTr5jR2y9b41vpmtaYqBK/7SInU2Ub5BGkMaTXZxhsTlGFmETa1xv3W/DbNFk/1Hdv2ugm5XikAiQwJIXmharzTfuXapp124KcLJt7GZ6V2/V4aMhl3uR7I/nkSSYQaY5CB5aBGgqbhVwdm66aMpbNSccqOmYO5LzjzeReZZfogjKY1UYZlVt/G8Tb0ZqTl/jPnet/Jomkx2QrpAKlSqfu7pAT9pjU2zBb4lvmGs9Yj5Kn7RqnT+Ua5BKkNKTeZy0sa5GN2Eha2Fv22+4bLhkuVFCv0igi5XckAqQy5IvmlOrqjgWXrtp3W4JcKlt1mZDV+zTtqMPl3OR7Y/vkTiYcaZGDk1aGGgybhVwbm6naJ1bVCXnp9OYMpLyjz6RipaGogHLn1UvZl9t/m8NbzZqKl87PjOt45obkxuQs5AZlUyfOLuQT/RjYGzEb4RvimseYtlJQbRNnTKUZpBNkN+TlZwGsiNHV2Ewa2Zv2G+sbJ5kclGuviage5XWkAyQ1ZJGmpGrfzk8Xstp5G4IcJ9twGYMV4HSjKP9lmyR7Y/4kU2YoqYQE3xaK2g7bhVwZ26UaHJbRyOzp76YKZLxj0WRm5auogbM2VVGZmltAHAGbyVqBl+OPfCsypoQkxiQuJAolW2furvdTw9kbGzHb4BvfWsAYnNJ5LMvnSWUYpBRkOuTsZxbspRHdmE+a2tv1W+gbIRkKlEavgOgbJXQkA6Q4JJems+rTTpiXtxp6m4HcJVtqmbVVirRY6PqlmSR7o8BkmKY06YHF6taP2hDbhVwX26BaEZbByGAp6mYIJLwj0yRrZbWohHNE1ZdZnNtAXAAbxVq4V7bPK2sspoFkxaQvZA3lY6fPLwrUCpkd2zLb3tvb2vhYQtJibMTnRiUXpBVkPiTzZyysgNIlmFNa3Bv0m+VbGpk4VCKveGfXJXLkBCQ6pJ2mg+sFDuGXu1p8W4FcIttlGadVufPOaPYll2R7o8KknaYBKdpGthaUmhLbhVwV25uaBlbih5Np5SYF5Lwj1ORv5b/oi7OTFZzZn1tA3D6bgVqvV4nPGysmZr6khOQw5BGla+fxLx2UEVkhGzNb3dvYWvDYZ9IMLP2nAqUW5BZkAWU6ZwKs3FItWFba3Vvz2+JbFBkllABvb6fTZXGkBKQ9ZKOmlCs0TusXv5p924EcIFtfmZlVrTOEaPHllaR748TkouYN6dcHQVbZmhTbhVwT25baOxavhsbp3+YDpLvj1qR0ZYoo1rPhFaKZodtBXDzbvRpl15pOyusgZrvkhGQyZBVldKfTb3AUF9kj2zRb3JvU2ujYTNI17LanP6TV5BdkBKUBp1hs9xI1GFpa3lvzG99bDZkS1B3vJ2fPpXAkBWQAJOnmpGsjDzRXg5q/m4CcHdtZ2YsVpHN6KK1lk+R8I8ckqCYaaf6HzJbeGhbbhVwR25HaL5akRjppmqYBZLuj2GR45ZQo5XQvVagZpFtBnDtbuRpcl6lOuuraJrkkg+QzpBllfSf270LUXlkm2zUb21vRWuEYcZHgrK9nPGTU5BgkB+UI528s0VJ8mF3a35vyW9xbBtkAFD0u3ufL5W6kBeQC5O/mtKsQD31Xh9qBG8AcG1tUGbzVXvMwKKjlkiR8Y8lkrWYnadTIl9bjGhjbhVwPm40aJBa4RS3plaY/JHtj2mR9ZZ6o+PR9Fa2ZpttCHDnbtNpTF7aOa2rUZrakg2Q1JB0lRagbb5TUZNkp2zXb2lvNmtlYVZHLLKhnOSTT5BkkCyUQJ0YtKxJEWKEa4JvxW9lbABksk9xu1qfIJW1kBqQFpPYmhSt8D0aXy9qCm//b2NtOWa5VXLLmKKSlkGR8o8uksqY0Kd1JIpbn2hrbhVwNm4gaGNafRCGpkKY85Htj3CRB5eko0TTK1fNZqRtCXDgbsJpJl4IOW6rOZrPkgqQ2ZCElTmgAL+aUa1ks2zZb2NvKGtFYeJG17GFnNiTS5BpkDmUXZ11tBFKL2KSa4dvwm9YbOVjZE/zujmfEZWwkByQIZPxmlitmj4+Xz5qEG/9b1ltImZ9VXTKcaKAljqR8483kt+YBahoJrdbsWhzbhVwLm4MaDRaDwtWpi2Y65Hsj3eRGZfOo7zUYlfjZq5tCnDZbrFpAF4uODGrIZrFkgiQ35CUlVygmb/hUcZkvmzcb19vGWslYW1GhbFpnMuTSJBtkEeUe53UtHVKTWKga4tvv29MbMpjFE91uhifApWrkB+QLZMKm5ytPT9iX09qFm/7b09tC2ZCVYDJSaJvljOR9I9AkvWYOqg1KOJbxGh6bhRwJW75ZwRa8wMmphmY4pHsj3+RLJf5o03WmFf4ZrdtC3DTbqBp2V1MN/OqCpq6kgaQ5ZCjlX+gNsAnUuBkyWzfb1pvC2sFYfRFM7FOnL6TRJBxkFSUmZ00tdZKa2Kta5Bvu29AbK9jxE78ufie9JSmkCGQOJMjm+Gt3j+FX19qG2/5b0Vt82UFVZbIIqJeliyR9Y9KkguZb6jgKQxc12iCbhRwHW7kZ9VZKfv2pQWY2pHrj4eRPpcjpATYzVcOZ8FtDXDMbo9psl1hNreq8pmwkgWQ65CzlaKg1cBsUvlk1Wzib1Rv/GrkYHtF4rAznLKTQZB1kGKUtp2WtTdLiWK7a5RvuG8zbJNjcU6Gudie5ZShkCSQQ5M9myeue0CoX25qIW/3bzpt3GXIVLXH/KFNliWR9o9TkiCZpahuKzdc6WiKbhRwFG7QZ6VZSPTHpfGX0ZHrj46RUZdPpNXZAVgjZ8ptDXDFbn1pi11xNXuq25mlkgOQ8ZDDlcege8GwUhJl4Gzkb09v7WrDYABFk7AXnKaTPZB6kG+U1J36tZVLp2LIa5hvtG8nbHdjHk4Qubie1pSckCeQT5NXm2+uEUHLX35qJ2/1bzBtxGWKVN3G1aE8lh+R949dkjaZ26jkLGFc+2iRbhNwDG68Z3RZ6O6Ypd2XyZHrj5aRZJd7pM7bNlg4Z9NtDnC/bmxpY11yNEGqxJmbkgGQ95DUleugJsLzUitl62znb0pv3mqiYH9ERLD9m5qTOpB+kH2U851ftvNLxGLVa5xvsG8abFxjy02euJieyJSXkCqQW5Nwm7eupkHuX45qLW/zbyVtrGVMVAzGr6ErlhmR+Y9nkkyZEqlDLotcDWmYbhNwA26oZ0JZn+pqpcqXwZHrj56Rd5enpPbdalhOZ9xtD3C3bltpO11nMweqrZmRkv+P/ZDklQ+h1sI2U0Rl9mzpb0Vv0GqBYP5D+K/im46TN5CDkIuUEZ7Jtk5M4WLja6BvrW8NbEBjdU0uuHieuZSSkC2QZpOKm/+uN0IQYJ1qM2/xbxptlGUNVELFiqEalhKR+o9xkmOZSqmOL7VcIGmgbhJw+m2TZxFZAec8pbaXuJHrj6aRipfUpFjgnVhjZ+VtEHCwbklpE11QMs2pl5mHkv6PA5H0lTShiMN4U1xlAW3sbz9vwGpfYHdDrK/Hm4KTNJCHkJmUMJ4yt6lM/mLwa6RvqW8BbCNjHU2/t1meq5SNkDCQcpOlm0ivw0IzYKxqOG/vbxBtfGXNU4LEZKEKlgyR/I96knmZgqnIMN1cMmmnbhFw8W1+Z99Y4uMOpaOXsJHrj66RnZcApf/iz1h4Z+5tEXCpbjdp6lwrMZWpgJl9kvyPCpEEllmhRMS5U3RlDG3ubzpvsWo9YPBCYK+tm3aTMZCMkKeUT56ctwJNGmP8a6hvpW/0awZjxUxTtzqenZSJkDOQfpO/m5SvTUNUYLtqPm/tbwRtZGWNU8XDQKH5lQWR/Y+Eko+Zu6nyMQZdQ2mubhBw6G1qZ6xYIeHipI+XqJHrj7aRsJcupf7lAlmMZ/dtEnCibiVpwlz3L1upaplzkvuPEJEVln6hBcX4U41lF23wbzRvomobYGNCFq+Tm2qTLZCRkLWUbp4JuFlNN2MKbKxvoW/na+pia0zpthuej5SEkDaQipPZm9+v0kN2YMtqQ2/qb/psTGVLUw7DG6Hplf+Q/4+OkqaZ9KkNMy9dVWm1bhBw321VZ3pYrN61pH2XoJHrj76RxJdbpXHpM1mhZwBuEnCbbhNpmFyxLiOpU5lqkvmPFpEmlqOhzcU4VKVlIW3yby9vk2r5X9NBzq55m16TK5CWkMOUjp56uLBNU2MWbK9vnW/aa81iEUyCtvydgpR/kDmQlpP0myywV0SYYNpqSG/nb+9sM2UJU1zC9qDZlfmQAJCYkr2ZLqocNFZdZmm8bg9w1m0/Z0ZYc9yJpGqXmZHrj8aR15eJpX7tZFm2ZwluE3CUbgFpb1xZLeyoPZlgkviPHZE2lsmhm8Z3VL1lLG30bylvg2rWX0JBha5fm1OTKJCakNKUrp7ruANOb2MjbLNvmW/Ma69itUsctt6ddJR7kDyQopMPnHqw1kS5YOlqTm/lb+RsGmXGUrPB0qDJlfOQApCiktSZaaofNX9deGnDbg5wzW0qZxJYbdpcpFeXkJHrj86R65e4pWrylVnKZxJuFHCMbu9oRFzrK7aoJ5lWkvePJJFHlu+hcse0VNVlN233byNvc2qzX6pAPq5Fm0eTJZCfkOCUzp5fuVdOi2MvbLdvlW+/a5NiVku2tcCdZpR3kECQrpMqnMmwVUXZYPhqU2/ib9hsAWWCUgvBrqC4le2QBJCtkuuZpKoXNqZdiWnKbg1wxG0VZ95XkNgxpESXiZHrj9eR/5fnpa34xlneZxpuFHCFbt1oGlxlKoCoEZlNkvWPKpFYlhaiUMjyVOxlQW35bx1vZGqQXw9A960rmzyTIpCkkO+U7p7XuapOpmM8bLpvkW+ya3Vi90pTtaKdWJRykEOQu5NFnBmxz0X6YAZrWG/gb81s6GQ9UmjAiqColeeQBpC3kgKa4aoFN81dm2nRbgtwum3/ZqhX19YGpDKXgZHsj9+RE5gXpg0B9VnyZyNuFHB9bspo71vEKEqo/JhEkvSPMZFplj2iM8kuVQNmTG37bxhvVGptX3I/sq0SmzCTH5CpkP2UDp9PuvpOwmNIbL5vjW+ka1dilUrytISdS5RukEaQx5NhnGqxSEYbYRVrXW/db8FszmT3Ucm/Z6CZleGQCJDBkhmaHavqN/NdrGnYbgpwsW3qZnNXPNXcox+XepHsj+iRJ5hHpvcIJFoGaCtuFXB1brdoxFsDJxWo5pg6kvOPOJF7lmSiI8prVRtmVm38bxJvRGpKX84+bq35miWTHZCukAyVLp/JuktP3WNVbMFviG+XazliMUqTtGadPpRqkEqQ1JN8nL2xvUY7YSNrYm/ab7ZstWSxUTG/RKCJlduQCpDMkjGaW6vGOBpevWnebglwp23UZj1XvNOxowyXcpHtj/GRO5h3ptkOU1oaaDRuFXBubqVomFsdJeGn0ZgxkvKPPpGMlouiHculVTJmYG3+bwxvNGolXyU+Kq3gmhqTGpCzkBuVUJ9Ju5lP+GNhbMRvhG+JaxtizEk1tEmdMJRmkE6Q4JOYnBGyMEdbYTJrZ2/Yb6tsm2RqUZu+IaB5ldaQDJDWkkmamKuaOUBezmnlbghwnW2+ZgZXVNKHo/qWa5Htj/mRT5inpogTglouaDxuFXBmbpJobVsLI62nvJgokvGPRpGelrOiI8zgVUlmam0AcAVvJGoBX3c956zHmg+TGJC5kCqVcZ/Iu+dPEmRtbMhvf297a/xhZknZsyydI5RikFGQ7ZO0nGeyo0d6YUBrbG/Vb59sgWQgUQi+/59qldCQDpDhkmGa2KtjOmVe3mnrbgZwlG2nZs9WANFeo+iWY5HujwKSZJjZpmwXsFpBaERuFXBebn9oQVu6IHqnp5gekvCPTJGvltuiNM0ZVmBmdG0CcP9uE2rcXsc8payvmgSTFZC+kDmVkp9OvDNQLWR5bMtve29ta95h/Uh/sw+dFpRekFWQ+pPQnLyyEUiZYU5rcW/Sb5NsZ2TYUHu93J9alcqQEJDsknmaFqwqO4te72nybgVwim2RZpdWv880o9eWXJHujwuSeZgLp88a3lpVaExuFXBWbmxoFFszHkenkZgVku+PVJHBlgSjU85UVnZmfm0DcPluA2q4Xg88ZKyWmvmSE5DEkEiVtJ/WvH5QSGSFbM5vdm9fa79hk0gms/OcCZRakFmQB5TtnBSzfUi5YV1rdW/Pb4dsTWSOUO+8up9LlcWQEpD3kpGaV6zpO7Be/2n4bgRwgG16Zl5Wjs4Mo8SWVZHvjxSSjpg9p7YdC1toaFRuFXBObllo5lpdGxWnfJgMku6PW5HTli2jgc+MVo1miG0FcPNu8mmTXlA7JKx+mu6SEZDJkFiV1p9fvcpQYmSRbNFvcW9Ra59hJ0jNstac/JNWkF2QE5QJnW2z6EjXYWtrem/Mb3tsMmRDUGm8mZ88lb+QFZACk6qamKyjPNZeEGr+bgJwdm1kZiVWbc3jorOWTpHwjx2Sophvp0ogOFt7aFxuFXBFbkVouVohGOKmaJgEku6PYpHlllWjv9DEVqNmkm0GcOxu4mltXos65KtmmuOSDpDPkGeV+J/tvRNRfGSdbNRvbW9Da4Bht0d2srqc8JNSkGGQIZQmncizUkn2YXlrfm/Ib29sGGT2T+O7d58tlbqQF5ANk8Ka2qxXPfpeIGoEbwBwbG1NZutVWcy7oqGWR5HxjyaSt5ijp5siZFuOaGRuFXA9bjFoi1pdFLGmVJj7ke2PaZH3ln+jDtL8VrlmnG0IcOZu0WlHXsA5pKtOmtiSDJDUkHaVG6B9vltRlmSobNdvaG80a2FhR0chsp6c45NOkGWQLpREnSS0uUkVYoZrg2/Fb2Ns/WOpT2K7Vp8elbWQGpAYk9uaHa0DPh5fMWoKb/9vYm02ZrFVUcuToo+WQJHyjy+SzJjXp7YkkFuhaGxuFXA1bh5oXFrdD4CmP5jyke2PcZEJl6mjc9MyV89mpW0JcN9uwGkhXu04Z6s2ms6SCpDakIaVPaATv6JRsGS0bNpvY28ma0Fh1UbOsYKc1pNLkGmQO5RhnYG0HkozYpRriG/Cb1ds4mNaT+K6NZ8Pla+QHJAjk/SaYa2sPkJfQWoRb/1vWG0fZnZVVMpson6WOZHzjziS4pgLqKUmvFu0aHRuFXAtbgpoLVpEClCmK5jqkeyPeJEcl9Oj7dRoV+Vmr20KcNlur2n7XRY4KasemsOSCJDgkJaVYKCtv+pRymS/bN1vXm8YayFhXkZ7sWacyZNHkG2QSJR+neC0gUpRYqFrjG++b0tsx2MLT2e6FJ8AlaqQH5Aukw2bpa1SP2ZfUGoXb/tvTm0IZjpVYslEom2WMpH0j0KS+JhAqG0o51vHaHtuFHAkbvZn/1neAiCmF5jhkeyPgJEul/6jgtaeV/tmuG0LcNJunmnUXTM37KoHmrmSBpDmkKaVhKBIwDBS42TLbN9vWW8JawBh50UosUqcvZNEkHKQVpScnUG140pvYq9rkG+7bz5srGO5Tu259J7ylKWQIpA6kyeb6q3yP4pfYGocb/lvQ23xZf5UecgdolyWLJH1j0uSDZl2qBQqElzZaINuFHAcbuJnz1kp+vClA5jYkeuPh5FAlymkNdjTVxBnwm0NcMtujWmuXUc2sKrvma+SBJDskLWVp6DqwHVS/GTWbOJvVG/6auBga0XZsC+csZNAkHaQY5S6naO1Q0uNYrxrlG+3bzJskGNnTne51J7jlKCQJJBFk0CbMK6MQK1fcGoib/dvOW3ZZcFUmcf3oUuWJZH2j1WSI5mrqJ8rPFzraIpuFHATbs5nn1mK88Gl75fQkeuPj5FTl1WkCtoIWCZny20OcMVue2mGXVE1dKrYmaSSA5DykMWVy6CRwblSFWXhbOVvT2/rar9g70SJsBScpZM9kHqQcZTYnQe2okuqYsprmG+0byVsdGMVTgO5tJ7UlJuQJ5BQk1qbd64kQdBfgGoob/VvLm3BZYNUxsbRoTqWHpH3j16SOZniqBEtZlz+aJJuE3ALbrpnbllm7pKl25fIkeuPl5Fml4CkCNw8WDtn1G0PcL1uamleXVE0OqrBmZqSAZD4kNWV76A8wvxSLmXsbOdvSm/dap5gbkQ8sPmbmJM6kH+Qf5T3nW22/0vHYtdrnG+wbxlsWGPATY+4lJ7GlJaQKpBck3Obv665QfJfj2oub/NvJG2qZURU9cWroSmWGJH5j2iST5kZqW4ukFwQaZluE3ACbqVnPVky6mSlyJfAkeuPn5F5l6ykNt5wWFFn3m0PcLduWWk2XUUzAKqrmZCS/4/+kOaVE6Hqwj1TRmX3bOpvRG/Oanxg7UPur9+bjJM3kIOQjZQVntS2WkzkYuRroG+sbwxsPGNpTSC4dJ64lJGQLZBok42bB69HQhVgn2ozb/FvGW2RZQZULMWFoRiWEZH6j3KSZZlQqbcvulwiaaBuEnD5bZFnC1ml5jeltJe3keuPp5GMl9mknuCjWGVn520QcK9uR2kOXSwyxqmUmYaS/o8EkfaVOKGgw39TX2UCbexvP2+/altgZkOir8SbgJMzkIiQm5Q0nj23tEwBY/FrpG+pb/9rIGMUTbK3VZ6qlI2QMJB0k6ibUq/UQjdgrmo5b+5vDm15ZcVTasRgoQiWC5H8j3uSe5mJqe8w41w0aahuEXDwbXxn2liR4wmloJevkeuPr5GflwWlTuPWWHpn8G0RcKhuNWnlXAUxjal9mXyS/I8KkQeWXaFcxMBTd2UNbe5vOW+vajlg30JYr6mbdJMwkIyQqZRTnqq3DU0eY/5rqG+lb/JrA2O7TEW3Np6clIiQM5B/k8Kbna9cQ1hgvmo+b+xvA21hZYRTrcM7ofeVBZH+j4WSkpnBqRcyC11Faa9uEHDnbWdnpljZ4N2kjpenkeuPt5GylzOlaOYHWY9n+G0ScKFuI2m8XM4vValnmXKS+o8RkReWgqEexQFUkGUYbfFvNG+gahdgUUINr4+baJMtkJGQt5Rynhi4Y006YwtsrG+hb+Vr5mJhTNy2GJ6OlISQNpCLk9yb6K/jQ3pgzGpEb+pv+GxJZUJT98IWoeeV/pD/j4+SqZn8qTEzNF1XabZuD3DebVJndFhh3q+kepegkeuPv5HGl2Gl6+k5WaRnAW4TcJpuEWmTXIYuHalRmWmS+Y8XkSiWqKHmxT9UqGUjbfNvLm+QavVfw0HErnWbXZMqkJaQxZSSnoe4uU1WYxhssG+db9hrymIFTHS2+Z2AlH+QOZCXk/ebNrBlRJtg3GpJb+dv7WwvZQFTScLxoNeV+JABkJmSv5k2qj40W11pab1uD3DVbT1nQFgv3ISkZ5eXkeuPx5Hal4+lEe5rWbhnCm4TcJJu/2hqXCst5qg6mV+S+I8ekTiWzqGyxn5Uv2UubfVvKW+BatJfL0F8rlubUZMnkJuQ1JSxnvq4Dk5yYyRss2+Zb8trrGKoSw+22p1ylHuQPZCjkxKcg7DmRL1g62pOb+Vv4mwXZb5SncHNoMeV8pADkKOS15lwqj81g116acRuDnDMbShnDFgu2lekVJeQkeuPz5Htl76lH/ObWcxnE24UcItu7Wg/XLsrr6gkmVWS9o8kkUmW9KGJx71U12U4bfdvI29xarBfl0A2rkKbRpMkkKCQ4pTRnm65YU6OYzFst2+Vb75rj2JKS6u1vJ1llHaQQJCwky2c07BiRd1g+WpUb+Jv12z+ZHpS9sCqoLeV7JAEkK6S7pmsqjY2ql2MactuDXDCbRJn11dW2CykQpeIkeuP2JEBmO2lnPnLWeFnG24UcINu2mgVXDIqeagPmUyS9Y8rkVqWGqJpyPlU72VDbflvHW9iaoxf/j/wrSibOpMikKWQ8JTynuS5s06pYz1su2+Qb7BrcWLqSki1np1XlHKQRJC8k0mcIrHeRf5gCGtZb+BvzGzkZDVSU8CGoKaV5pAGkLiSBZroqiI30V2dadFuC3C5bfxmoleh1gGkL5eAkeyP4JEVmBymOQL7WfVnJG4UcHxuyGjqW40oRKj5mEKS9I8ykWyWQqJRyTZVBmZNbftvF29SamlfXT+qrQ+bL5MfkKqQ/5QSn166BU/FY0psvm+Mb6JrU2KJSue0gZ1JlG6QR5DJk2ScdLFVRh5hF2teb91vwGzLZPBRuL9joJeV4JAIkMOSHZokqwI4+F2uadhuCnCwbedmbFcK1dejHJd5keyP6ZEpmEymzQkqWghoLG4VcHRutWi+W8cmD6jkmDmS8484kX2WaaJCynJVHWZXbf1vEW9CakVfuT5mrfaaJJMckK+QDpUzn9m6VE/gY1Zswm+Ib5VrNWIlSoi0Y508lGmQSpDVk3+cyLHMRj5hJWtjb9pvtWyyZKhRHr9AoIeV2pAKkM2SNJpiq904Hl6/ad9uCXCmbdFmN1eN06yjCpdxke2P8ZE9mH2mgA9ZWhxoNG4VcGxuomiTW9wk2qfOmDCS8o9AkY6WkKI+y6xVNGZhbf9vC28xaiFfEj4ird2aGZMakLSQHZVTn1m7o0/7Y2JsxW+Db4drF2LBSSu0Rp0vlGWQTpDik5ycGrI/R15hNGtob9dvqWyYZGBRiL4doHeV1ZAMkNiSTJqhq7E5RV7QaeVuCHCdbbtmAFco0oKj+JZqke2P+pFSmAAALFv3aMBuBnBKbV1lplFgu3ieW5RXkHiQzJR/n9q/ylMeZpxtD3CFbl5os1ll3XajeZYKkQiQDJNvm72wXkh/YhBsxm9ib71qaV+POkOqK5kYkuyPupFDmOSn2i/QXQ9qJ2/mb5dsuWOWTHC0l5yLkyKQyZDClcGh1MyEV4JnLm4VcAFuE2diVsnH/qBvla2QMZDLky2ddLZcTkVk1GzybwhvuGkAXS0o2abal5CR7o9JkqCZgatXPiBgC2t7b7RvzGvhYQRGKq/qmtSS/48skdaWVaST7atawmisbgpwaG2iZW1S27zTnoGUYpBskKOUIZ8qvg9T22WAbQ1wm26VaDtazeTuo6uWHJEDkO2SJpverx1HKmLsa7xvcG/nas1fsDztqmuZM5Ltj6ORCZhRpwAsYF3gaRZv7W+4bAZkkU2CteicrpMqkLmQlZVWofLJ6FZGZxZuFXAablBnAldmymehnJW8kCmQqJPanFW1aU35Y7Ns628Zb+hpc12vLGinE5inke2PLpJgmdKqXTy9X+FqbW++b/JrOGJURwKwMpvykgSQGZGjltujaOMlWoxol24NcIRt5mUuU3C+MJ+qlG6QYJB7lMSemrxOUpdlY20JcK9uymi/WsfvaqTeli+R/o/Pkt6aB6/MRdNhxmuyb31vEmswYKM+naurmU2S74+NkdGXwaZXJ+1csGkFb/Nv2WxSZIJOpLY6ndGTM5CrkGiV7aBix0dWCWf9bRVwMm6MZ55XWM3TocqVzJAhkIWTipxEtG1MrGORbORvKm8XauNdbjD9p0yYvpHrjxSSIZkoqjM6WF+2al9vx28WbI1ij0jisHybEpMJkAeRcZZjo2rcnFlVaIJuEHCgbSlm6VMiwI+f0pR6kFWQVJRpniO7hVFRZUZtBXDDbv9oQVsaBOmkEpdDkfqPsZKYmjquZUR5YZ9rp2+KbztrkWBwQFOs7ZlpkvGPd5GZlzemiiF3XH9p8275b/lsnGRoT9e3jp32kzyQnJA9lYegE8WhVctm420UcEpux2c0WLnQQqL4ldyQGZBjkzucPrNkS1xjb2zdbzpvRWpRXqczlaiHmNaR64/7keOYg6nRN/FeimpRb9BvOmzhYrtJy7HHmzKTD5D1kECW7aIF1xBZHWhsbhJwvG1qZp1U+sHwn/yUiJBLkC6UEZ7DubNQCmUobQFw124zab5bcBRrpUeXV5H2j5OSUppzreZCHmF4a5xvlm9ka+9gGEIPrTCahZL0j2KRYpevpbcZ/VtNaeFu/m8YbeZkRlAYueSdG5RFkI6QEZUioPrC9lSLZsltE3BgbgBox1i11LKiKJbskBKQQpPum0WyTkoLY01s1W9Jb3Nqu16ANjGpxJjukeuP4pGmmOWoKDWHXlxqQW/Zb15sM2PYSr+yE5xSkxaQ5JAQlnuirtKAWORnVW4UcNZtqmZLVfvDU6AmlZWQQZAIlLqdeLjcT8JkCW38b+puZWk6XNwd8KV9l2yR8o93kg+asqxNQcFgUGuQb6Fvi2tLYaRD0610mqKS949NkS2XK6XiDYJbGmnNbgNwNm0tZRtRbro8nkGUUJCBkOiUwJ8OwUVUSmaubRFwd244aFZZftkmo1iW/pAMkCKToptXsSpJuGIpbMxvWG+faiRfBDnUqQGZB5Lrj8qRaphJqCEyG14vajJv4W+AbINj6Eu9s2GcdJMdkNSQ4ZULogHP61eqZz5uFXDwbepm9FUtxrmgUpWjkDeQ5JNlnT+3+U54ZOls9m/8bpdpsVyRJHumtJeCkfCPW5LNmfmrkj9iYCdrg2+sb7JrpWEXRZ2uupq/kvyPOpH4lqqkSfgCW+Voum4HcFRtc2XoUdm7lp5nlFuQdJC+lGCfSr+OUwhmk20OcI1ucGjgWZTfnaOJlhCRBpACk1ebc7D3R2RiBGzDb2Zvy2qKX0k7eqpAmSGS7I+ykTCYs6erLqxdAGohb+hvomzSY+tMyLSxnJaTJJDEkLOVnqHay1JXb2cmbhVwCW4nZ5dWmsggoX6VspAukMCTEp0Utg5OLWTJbPBvDm/IaSZdwikHp+yXl5Huj0CSi5lHq7Q9AGD9anZvt2/Ya/5hdEZwrwKb3ZIAkCaRxZYtpLbpf1qwaKVuC3BxbbhlrVJcvfGejpRmkGiQlpQCn6S90VLFZXZtC3CibqZoZ1rP5xekvJYikQGQ45IPm5evskYNYt9ruW90b/Vq7l9aPSarf5k7ku2PnJH3lyKnkSo7XdFpEW/vb8NsH2TiTeC1Ap25ky2QtZCGlTShFcm0VjJnDm4VcCJuZGc2V1HLiqGrlcGQJpCdk8Cc+7QZTeBjqGzpbx5v92mXXfgtmKclmK6R7I8mkkuZmqqvO51f02ppb8Fv/mtUYr1HSbBKm/ySBZATkZOWs6Pl4PlZemiQbg5wjW38ZWtT+r5On7eUcpBdkG6Upp4dvA1SgGVZbQhwtm7caOpa1PSTpO+WNpH8j8WSx5rDrllFtWG5a69vgW8fa1BgPT/Zq8GZVpLwj4WRv5eTppwlx1ygaf9u9W/jbGpkz04Ht1ad3ZM1kKaQWpXLoJvGElb1ZvVtFXA6bp9nz1djzveh2ZXRkB6QepNwnO2zGEySY4ds4m8vbyZqB16HMS6oX5jGkeuPDJIMmfKpdDk3X6dqW2/KbyJsqWL0SC2xlJsckwuQAZFhljyjf9pvWUNoe24QcKltPmYkVLrArp/glH+QUpBIlEyerrpBUTplPG0EcMpuEGlqW9YKE6Ujl0mR+I+nkoGa963qQ1thk2ukb45vSGuvYP5AkawDmnKS8o9wkYeXCqY/H09cbmntbvtvA221ZLJPPLiqnQGUP5CXkC6VZqBfxGpVtmbbbRRwUW7aZ2VY9dFmogiW4ZAXkFmTIpzssgpLQmNkbNpvP29UanNeoTTHqJuY3ZHrj/ORz5hPqfg2z157akxv029GbPxiGkoZsuCbPJMRkPCQMZbHooXV4VgKaGVuE3DEbX9m1lScwhCgCpWMkEeQIpT0nVa5bVDzZB1t/2/dbkNp51vwF5alWJdekfWPipI9mjOtY0IAYWtrmG+ab3FrDWGcQk+tRpqOkvWPW5FRl4SlfhbWWzxp224AcCJt/WSMUIa5AJ4nlEmQipAElQKgVsK9VHZmwG0ScGhuE2j2WCjW2KI3lvKQEJA3k9Sb9rHxSfBiQWzSb05vgWreXlk3ZqnXmPaR64/akZOYsag0NGReTmo9b9tvaWxNYzNLELMtnF2TGJDfkAGWVqJn0VBY0WdObhRw322/ZoJVrMR0oDSVmpA9kPyTnp0PuJNPqmT+bPpv8G51aWBcSiAdpo+Xc5Hyj26S+Zl2rL5AomBDa4xvpW+Ya2lhIEQUrouaq5L5j0eRHJcBpRkIWFsJacduBHBAbURlX1HiulmeTZRTkH2Q2pShn3bAClQ1ZqVtEHB+bktog1lT202jaJYEkQqQF5OJmwyxyUidYh1syW9db61qRl/HOQmqFZkQkuuPwpFXmBioEDH3XR9qLW/jb4xsnWM9TBO0e5x/kx+Qz5DSleeh7826V5dnNm4VcPht/mYpVvDG2qBglaiQNJDYk0md3LatTmBk32z0bwJvp2nXXF8mp6bHl4mR749SkreZvqv7PkJgGWt/b7Bvv2vCYYtF4a7RmsmS/Y8zkeeWgaSE8tha1GizbglwXm2KZSlSVbyznnSUXpBwkLGUQZ++vlFT8mWJbQ5wlG6CaA1a8uHEo5qWFpEEkPiSQJsqsI5HSGL5a8Bva2/Zaqtf+juyqlWZKpLsj6uRHZiDp2wth13waRxv6m+tbOtjPE0itcycopMnkL+QpZV7oerKHldbZx9uFXARbjtnzFZzyUOhjJW2kCyQtJP2nLe1wE0UZL5s7m8Tb9dpS102Kzan/5efke2PN5J2mQ6rED3gX+9qcm+6b+VrGmLiRrWvGZvokgKQIJG0lgWkd+ZUWp9on24McHttz2XsUuC9D5+clGqQZJCJlOSeIb2RUq9lbW0KcKhuuGiSWlfrP6TMlimR/4/ZkveaUa9ERvFh02u2b3hvA2sOYPw9YKuUmUSS7o+UkeSX86YSKRVdwWkLb/Fvzmw4ZDFOP7YencWTMJCvkHeVEqE7yIBWH2cGbhVwKm53Z2hXRcyuobqVxpAjkJGTppyhtMZMx2OdbOdvJG8HarxdMC/JpziYtpHsjx2SNpliqvg6fF/EamRvxG8KbHBiI0iSsGKbB5MHkA2Rg5aMo5bezFloaIpuD3CXbRJmqVOIv26fxJR2kFmQYpSInqK7ylFqZVBtBnC9bu1oFFt0+72kAJc8kfuPu5Kwmn+u5ESZYa1rq2+Fby1rb2DSPxSs1plfkvCPfpGsl2emviOgXJBp+W73b+5sg2QaT2u3cZ3pkzmQoZBLlaqg2MXbVeFm7W0VcEJusmcAWIHPG6LoldaQHJBvk1acmLPCS3hje2zgbzRvNWorXpgyX6hzmM6R648DkviYvKmqOBVfmWpWb81vLmzEYlRJebGsmyeTDZD7kFGWFqPC2EFZMGh0bhFwsm1UZl9UVMHOn+2Ug5BOkDuUL546uv1QI2UybQJw0G4haZNb9A8+pTSXUJH3j52Sa5q2rW1DPmGGa6Bvkm9Va85giEHOrBiae5Lzj2mRdZfepb8cKFxeaedu/G8Nbc1k+k+muMadDpRCkJOQIJVFoK3DMlWhZtJtE3BZbuxnlVg904uiF5bnkBWQTpMInJuysUonY1ls2G9Eb2Nql16MNfuor5jmkeuP65G7mBupGzasXmxqR2/Wb1JsF2N2Smiy+JtHkxOQ6pAhlqKiFdSyWPhnXW4TcM1tlGYPVULDMKAYlZCQRJAVlNid6bgoUNtkFG39b+NuVGkPXAgbwqVql2WR84+Bkiaa9azeQeFgXmuUb51vfmsrYR5Djq1dmpiS9o9UkT+XWKWrEq1bK2nUbgFwLG0UZdJQ9bkdnjOUTJCFkPaU4p+2wYNUYWa4bRJwb24laCVZu9f+okeW+JAOkC2TvJupsZFJ1WI1bM9vU2+QagBfKjibqeuY/pHrj9KRf5h/qDszQV4/ajdv3m90bGdji0tjs0acaJMakNmQ8pUyojjQH1i+Z0ZuFHDnbdRmulVixZWgQpWekDuQ8JOCnai3SU+SZPRs+G/2boVpiFxyIkqmoZd6kfGPZZLjmTqsLkCDYDVriG+pb6VrhmGZRFauopq1kvqPQJELl9akiAAuW/howW4GcEptW2WhUVe7dp5alFeQeJDMlIGf47/PUyBmnG0PcIVuXWiwWUbdc6N4lgqRCJANk3GbwbBkSIFiEWzGb2FvvGpnX4Q6QKoqmRiS7I+7kUSY56fxL9NdEGonb+Vvlmy3Y5FMa7SVnIqTIpDJkMOVxKHpzIdXhGcvbhVwAW4SZ15Wucf8oG6VrJAxkMyTLp16tmFOR2TUbPJvB2+3af1cFCjWptmXkJHuj0qSopmEq2A+ImAMa3tvs2/La99h/UUmr+ma05L/jy2R15ZYpNLtrVrDaK1uCnBnbaFlaVLTvNGegZRikGyQpJQjnzW+E1PdZYBtDXCabpNoOFqj5OyjqpYckQOQ7pIom+KvJUcsYuxrvG9vb+dqy1+mPOqqaZkyku2Po5EKmFSnFCxiXeFpF2/tb7hsBWSNTX215pytkyqQupCWlVih/8nsVkhnFm4VcBpuT2f/VlnKZaGblbyQKZCpk9ycWrVuTftjs2zrbxhv52lwXZQsZacSmKaR7Y8vkmGZ1apnPMBf4mpub75v8Ws2Yk1H/K8xm/KSA5AakaSW3aOR4yhajWiYbg1whG3lZStTaL4un6mUbpBhkHyUxp6hvFJSmGVkbQlwr27JaL1abe9opN2WL5H+j8+S4JoLr9NF1WHHa7JvfG8Ray5gmj6Zq6qZTZLvj42R0pfEpngn71yxaQVv82/YbFFkfk6etjid0ZMzkKuQaZXvoG7HS1YKZ/1tFXAybotnm1dJzdGhyZXLkCGQhpOMnEq0ckytY5Js5W8pbxZq4F1dMPqnS5i+keuPFZIimSuqPzpbX7ZqYG/HbxZsjGKJSNywepsRkwmQB5FylmWjh9yfWVZogm4QcKBtJ2blUxnAjZ/RlHqQVZBVlGueKruJUVNlRm0FcMNu/mg+W6UD5qQRl0OR+o+xkpmaPq5sRHthoGunb4lvOmuPYGdAUKzrmWiS8Y93kZqXOaaqIXlcgGnzbvlv+GybZGRPz7eMnfWTPJCckD2ViaAexaRVzGbkbRRwSW7FZzFYp9A/oveV3JAZkGSTPJxFs2pLXWNwbN1vOW9Eak5emTOSqIaY1ZHrj/uR5JiGqd03816KalFv0G86bN9itUnGscWbMZMPkPaQQZbvoh3XE1keaGxuEnC7bWlmmVTxwe6f+5SHkEuQL5QTnsy5uFAMZShtAXDWbjJpvFs3FGilRpdXkfaPlJJUmnet7kIgYXlrnG+Vb2Nr7GAQQgutL5qEkvSPYpFkl7Kl5BkAXE5p4W7+bxdt5GRBUBK54p0alEWQj5ASlSSgBMP5VIxmym0TcGBu/2fEWKDUsKInluyQEpBDk++bS7JUSg1jTWzVb0lvcmq5Xm42LqnCmO2R64/jkaeY6Kg2NYpeXWpCb9lvXWwxY9NKurISnFKTFpDlkBGWfaLB0oNY5WdWbhRw1m2pZkdV8cNRoCaVlZBBkAmUvJ1/uOBPw2QJbfxv6W5kaTdcth3upXyXbJHzj3iSEJq2rFVBw2BRa5BvoW+Ka0lhnEPPrXOaoZL3j06RLpcupS0OhFsaac5uA3A2bSxlF1FlujqeQJRQkIGQ6JTCnxrBSVRLZq9tEXB2bjdoU1lk2SSjV5b+kAyQIpOjm1yxMEm6YipszG9Yb55qIV/5ONCpAJkHkuuPypFsmE2oNjIdXjBqMm/gb39sgWPhS7izYJxzkxyQ1JDilQ6iEc/uV6tnP24VcPBt6GbwVSLGtqBRlaOQN5Dlk2adRbf/Tnpk6mz2b/xulmmvXHUkeKazl4GR8I9cks6Z/aubP2RgKGuEb6xvsmujYRBFma65mr+S+486kfqWraSt+ARb5mi6bgdwVG1yZeRR0LuUnmaUW5B0kL+UYp9Tv5JTCWaTbQ9wjG5vaN1Zc9+bo4iWEJEGkAOTWZt3sP1HZWIFbMNvZm/KaohfPzt3qj6ZIJLsj7ORMZi2p70url0BaiJv6G+hbNBj5kzCtLCclpMkkMSQtJWgoenLVVdwZyduFXAJbiZnlFaOyB6hfZWxkC+QwJMTnRy2E04vZMps8G8Nb8dpI12kKQSn65eXke6PQZKNmUqrwT0CYP5qd2+3b9dr/GFtRmuvAJvdkgCQJ5HGli+k/emCWrFopm4LcHFtt2WqUlS9756OlGaQaJCXlASfr73VUsZld20LcKFupWhkWp/nFKS7liKRAZDkkhCbm6+5Rg9i4Gu5b3Rv9GrsX009I6t+mTuS7Y+ckfiXJKeuKj1d0mkRb+9vwmwdZN5N27UAnbiTLZC1kIeVNqEiybdWNGcObhVwIW5iZzJXQ8uIoaqVwJAmkJ6TwpwAtR1N4WOpbOlvHm/3aZVd5S2VpySYrpHsjyaSTJmdqrk7n1/UamlvwW/9a1NitUdEsEmb/JIFkBSRlJa2ownh/Fl7aJFuDnCNbftlaFPyvk2ftpRykF2Qb5SoniS8EFKCZVptCHC2btto6FqA9JGk7pY1kfyPxZLJmseuYEW3Ybprr2+Bbx9rTmA0P9Wrv5lVkvCPhpHAl5amtyXJXKFp/271b+NsaWTKTgG3VJ3ckzWQppBblc2gp8YVVvZm9W0VcDlunmfMV1PO9aHYldCQHpB7k3Kc8rMdTJNjh2ziby5vJWoEXncxK6hemMWR648Mkg6Z9al/OTlfqGpbb8pvIWynYu5IKLGTmxuTC5ACkWKWPqOa2nJZRGh7bhBwqW09ZiBUrsCtn9+UfpBSkEiUTp61ukVRPGU9bQRwym4PaWdbYgoQpSKXSZH4j6iSgpr7rfJDXWGTa6RvjW9Ha61g9UCMrAGacZLyj3CRiJcMpm4fUlxwae1u+28CbbNkrU82uKidAZQ/kJiQL5VooGrEblW3ZtxtFHBRbthnYljj0WSiB5bhkBeQWZMjnPGyEUtDY2Vs2m8+b1NqcV6TNMSompjdkeuP85HQmFOpCTfRXnxqTG/Tb0Vs+mIVShSy3ps8kxGQ8JAylsqim9XkWAtoZW4TcMRtfmbTVJLCDqAJlYyQSJAilPadXblzUPRkHm3/b91uQmnkW78Xk6VXl16R9Y+Lkj6aN61rQgJhbGuYb5lvcGsLYZRCS61Fmo6S9Y9bkVKXh6WyFthbPWnbbgBwIW38ZIhQf7n/nSaUSZCKkASVBKBfwsBUeGbBbRJwZ24SaPNYEdbVojaW8pAQkDiT1pv7sfdJ8mJCbNJvTm+AatxeTDdjqdaY9pHrj9uRlJi0qEI0Zl5Paj1v229obEtjLEsLsyucXZMYkN+QApZZonrRU1jSZ05uFHDebb5mf1WixHKgNJWZkD6Q/ZOgnRa4l0+sZP9s+m/vbnRpXlwnIBqmjpdzkfKPb5L6mXmsyUCkYENrjG+lb5drZ2EYRBCuipqrkvmPR5EdlwSleQhbWwppyG4EcD9tQ2VbUdm6V55MlFOQfZDblKOff8AOVDZmpm0QcH5uSmiAWTfbS6NnlgORCpAYk4ubELHOSJ9iHmzJb1xvrGpEX7w5BqoUmQ+S64/DkVmYG6ggMfldIGotb+Nvi2ybYzhMDbR6nH+TH5DPkNOV6qH+zb1XmGc3bhVw+G38ZiVW5MbYoF+VqJA0kNmTS53itrJOYWTgbPRvAW+madVcRSalpsWXiJHvj1OSuJnCqwQ/RGAaa39vsG++a8FhhEXdrtCayJL9jzOR6ZaEpNHy2lrVaLRuCHBdbYllJVJLvLKec5RekHCQspRDn8a+VVP0ZYptDnCTboBoClrN4cGjmZYWkQWQ+ZJBmy6wlkdKYvlrwG9qb9hqqV/wO66qU5kpkuyPq5EemIanfy2KXfFpHW/qb6xs6WM3TR21ypyhkyeQv5CmlX2h+MoiV11nH24VcBFuOmfHVmbJQKGLlbaQLJC1k/icvbXETRVkv2zubxNv1mlJXSErM6f+l56R7Y84kniZEasZPeJf8Gpyb7pv5GsYYttGsK8Ym+eSAZAgkbaWB6Sl5ldaoGifbgxwem3NZehS2L0Nn5uUapBlkIqU5p4svZVSsGVubQpwqG63aI9aH+s8pMuWKJEAkNqS+ZpVr0pG82HUa7ZveG8Cawxg8z1cq5OZQ5Luj5WR5Zf2pikpF13CaQtv8W/NbDZkLE44thydxJMvkLCQeJUToUzIg1YgZwZuFXApbnZnZVc2zKyhuZXGkCOQkpOnnKa0y0zIY55s528kbwZqul0eL8anN5i2keyPHpI4mWaqBjt+X8VqZW/Ebwlsb2IdSI2wYZsGkweQDpGElo6jwt7PWWloim4PcJZtEWalU4C/bJ/DlHaQWZBilIqeqbvQUWtlUG0HcLxu7GgSW9/6uqT/ljyR+4+8krKaha7rRJphrmurb4VvLGtuYMo/EKzUmV+S8I9/ka2XaqbbI6JckWn6bvdv7WyBZBVPZbdvneiTOJChkEyVrKDmxd9V4mbtbRVwQW6xZ/1XcM8ZoueV1pAckHCTWJyds8hLeWN8bOBvNG80aiheiTJcqHKYzZHrjwSS+pi/qbo4F1+aalZvzW8tbMNiT0l0saubJpMNkPyQUpYYo9vYRFkyaHRuEXCybVNmW1RHwcyf7JSDkE6QPJQxnkO6AVElZTNtAnDQbiBpkFuuDzulNJdQkfePnpJsmrutdUM/YYdroG+Rb1VrzGCAQcqsF5p7kvOPaZF3l+Gl5xwqXF9p5278bw1ty2T2T6C4xZ0NlEKQk5AhlUegu8M2VaNm020TcFhu62eSWCrTiaIWluaQFZBOkwqcoLK2SiljWWzYb0RvYmqUXn81+KitmOWR64/rkbyYHqkoNq5ebWpHb9ZvUWwVY3FKY7L3m0aTE5DqkCKWpaIw1LVY+WdebhNwzG2TZgxVOcMuoBeVkJBEkBaU2p3wuCxQ3WQUbf1v425TaQxc3Rq/pWmXZJHzj4GSJ5r4rOZB5GBfa5RvnW99aylhFkOKrVual5L2j1WRQZdbpfwSsFssadRuAXArbRNlzlDtuRueMpRMkIaQ95Tkn7/BhlRiZrhtEnBvbiRoIlmb1/yiRpb4kA6QLpO+m62xl0nXYjZsz29Sb49q/V4eOJip6pj+keuP05GAmIKoSjNDXkBqOG/eb3RsZmOGS16zRJxokxqQ2pDzlTSiSdAiWL9nR24UcOdt0ma2VVfFk6BBlZ6QO5Dxk4SdsLdOT5Rk9Wz4b/VuhWmFXFMiR6agl3mR8Y9lkuWZPaw6QIVgNmuIb6hvpGuEYZJEUq6hmrSS+o9BkQyX2aQNATFb+GjBbgZwSW1aZZ1RULt0nlmUV5B5kM2Ug5/rv9NTIWadbQ9whW5caK1ZKN1xo3eWCZEIkA6Tc5vGsGpIg2ISbMZvYW+7amVfeTo8qimZF5Lsj7uRRZjrpwIw1V0Raihv5W+WbLVjjExltJSciZMikMqQxJXGofjMileFZy9uFXAAbhBnW1atx/qgbZWskDGQzZMwnYC2ZU5JZNVs8m8Hb7Zp+1z8J9Om"
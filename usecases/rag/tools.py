@@ -1,10 +1,10 @@
 import os
 from typing import Optional
 
-import requests
 from langchain_core.tools import StructuredTool, tool
 from pydantic import BaseModel, Field
 
+from usecases import http_client
 from usecases.util import convert_to_function
 
 BASE_URL = os.getenv(
@@ -13,7 +13,7 @@ BASE_URL = os.getenv(
 
 
 @tool
-def book_appointment(
+async def book_appointment(
     customer_id: str, vehicle_id: str, date: str, time: str, service: str
 ):
     """
@@ -22,7 +22,6 @@ def book_appointment(
     Customer ID, Vehicle ID, Date, Time, and Service.
     """
     url = f"{BASE_URL}/book-appointment"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "customer_id": customer_id,
         "vehicle_id": vehicle_id,
@@ -30,35 +29,31 @@ def book_appointment(
         "time": time,
         "service": service,
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.text
+    return await http_client.post_json(url, payload)
 
 
 @tool
-def get_vehicle_details(vehicle_id: str):
+async def get_vehicle_details(vehicle_id: str):
     """
     Retrieve details of a vehicle by its ID. This should be invoked when vehicle details requested by user.
     """
     url = f"{BASE_URL}/vehicle/{vehicle_id}"
-    response = requests.get(url)
-    return response.text
+    return await http_client.get(url)
 
 
 @tool
-def get_vector_info(query: str):
+async def get_vector_info(query: str):
     """
     Query the knowledge base for general information, such as customer details, maintenance details and any other information.
     """
     url = f"{BASE_URL}/vector-info"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "query": query,
         "filter": {"topic": "maintenance"},
         "native": True,
     }
 
-    response = requests.post(url, json=payload, headers=headers)
-    return response.text
+    return await http_client.post_json(url, payload)
 
 
 class InventoryVectorSearchModel(BaseModel):
@@ -69,7 +64,7 @@ class InventoryVectorSearchModel(BaseModel):
 
 
 @tool
-def get_vector_info_inventory(
+async def get_vector_info_inventory(
     query: str,
     re_rank: bool = False,
     hybrid_search: bool = False,
@@ -82,7 +77,6 @@ def get_vector_info_inventory(
     Query the knowledge base for vehicle inventory information. VIN, StockNumber, Type, Make, Model, Year, etc will be returned.
     """
     url = f"{BASE_URL}/vector-info"
-    headers = {"Content-Type": "application/json"}
     payload = {
         "query": query,
         "filter": {},
@@ -94,10 +88,10 @@ def get_vector_info_inventory(
         "db": db,
     }
 
-    response = requests.post(url, json=payload, headers=headers)
+    response_text = await http_client.post_json(url, payload)
     print("RAG Payload: ", payload)
 
-    return str(response.text)
+    return str(response_text)
 
 
 schema = StructuredTool.from_function(
@@ -0,0 +1,41 @@
+import base64
+
+from audio import ULAW_BYTES_PER_MS, audioop
+
+
+class BargeInDetector:
+    """Spot the caller starting to talk from the inbound 8 kHz μ-law frames.
+
+    A frame counts as speech when its RMS energy reaches `rms_threshold` and
+    its zero crossings stay under `max_crossings_per_ms`, which rules out hiss
+    and line noise. Speech lasting `min_speech_ms` in a row is an onset. Both
+    measures run in C through audioop, one call per 20 ms frame.
+    """
+
+    def __init__(self, rms_threshold, max_crossings_per_ms, min_speech_ms):
+        self.rms_threshold = rms_threshold
+        self.max_crossings_per_ms = max_crossings_per_ms
+        self.min_speech_ms = min_speech_ms
+        self._speech_ms = 0
+
+    def feed(self, payload):
+        """Add a base64 μ-law frame, return True once it completes a speech onset."""
+        ulaw = base64.b64decode(payload)
+        if not ulaw:
+            return False
+        pcm = audioop.ulaw2lin(ulaw, 2)
+        duration_ms = len(ulaw) / ULAW_BYTES_PER_MS
+        if (
+            audioop.rms(pcm, 2) >= self.rms_threshold
+            and audioop.cross(pcm, 2) <= self.max_crossings_per_ms * duration_ms
+        ):
+            self._speech_ms += duration_ms
+        else:
+            self._speech_ms = 0
+        if self._speech_ms >= self.min_speech_ms:
+            self._speech_ms = 0
+            return True
+        return False
+
+    def reset(self):
+        self._speech_ms = 0
@@ -0,0 +1,76 @@
+import asyncio
+import gc
+import os
+import signal
+import socket
+
+import uvicorn
+
+# Same listen backlog as uvicorn.
+BACKLOG = 2048
+
+
+def run_worker(app, sock):
+    """Serve `app` on the inherited listening socket until SIGINT or SIGTERM."""
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    asyncio.run(server.serve(sockets=[sock]))
+
+
+def serve(app, host, port, workers):
+    """Run `app` in `workers` forked processes accepting on one socket.
+
+    Everything loaded before the fork, the usecases and their audio assets
+    included, is shared copy-on-write, and `gc.freeze()` keeps the collector
+    from writing to those pages in the workers. Each worker runs its own event
+    loop, so the Realtime pool and the tool HTTP client are per worker. A
+    worker that exits is replaced until the supervisor gets SIGINT or SIGTERM,
+    which it forwards to the workers.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(BACKLOG)
+
+    gc.collect()
+    gc.freeze()
+
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(app, sock)
+            except BaseException as e:
+                print(f"Worker {os.getpid()} failed: {e}")
+                code = 1
+            finally:
+                os._exit(code)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    for _ in range(workers):
+        spawn()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Started {workers} workers on {host}:{port}")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} exited with status {status}, starting a new one.")
+            spawn()
+    sock.close()